@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Fast (rule-only) mode versus LLM mode on the example corpus.
+
+Indexes example_corpus/, analyzes the sample responses with each pipeline
+mode and reports per-response latency, per-stage time and how often the
+two modes agree on whether a response contains a hallucination. LLM mode
+uses the provider from --config (or the environment) and is skipped when no
+API key is available.
+
+Usage:
+    python benchmarks/fast_mode_bench.py
+    python benchmarks/fast_mode_bench.py --modes fast --repeat 200
+    python benchmarks/fast_mode_bench.py --hash-encoder   # no embedding model download
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.config import load_config
+from src.core.schemas import VerdictLabel
+from src.pipeline import EpistemicRiskDetector
+
+CORPUS = Path(__file__).parent.parent / "example_corpus"
+
+RESPONSES = [
+    "Python was created by Guido van Rossum and first released in 1991.",
+    "Python 3.12 completely removed the Global Interpreter Lock (GIL), "
+    "allowing true multi-threaded execution.",
+    "The Transformer architecture was introduced in 2017 and GPT-3 has "
+    "175 billion parameters. GPT-4 was released in 2022.",
+    "Python is named after Monty Python. Django was released in 2010. "
+    "NumPy was created by Travis Oliphant in 2005.",
+    "PyTorch was developed by Meta AI. TensorFlow might be the most popular framework. "
+    "BERT was introduced by Google in 2018.",
+]
+
+
+class HashEncoder:
+    """Bag-of-words hashing encoder; stands in for the sentence transformer."""
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True):
+        embs = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in re.findall(r"\w+", text.lower()):
+                embs[i, int(hashlib.md5(token.encode()).hexdigest(), 16) % self.dim] += 1.0
+        norms = np.linalg.norm(embs, axis=1, keepdims=True)
+        return embs / np.where(norms == 0, 1.0, norms)
+
+
+def has_api_key(provider: str) -> bool:
+    env = {"openai": "OPENAI_API_KEY", "anthropic": "ANTHROPIC_API_KEY"}.get(provider)
+    return env is None or bool(os.getenv(env))
+
+
+def bench_mode(
+    mode: str, db_path: str, config_path: str | None, repeat: int, hash_encoder: bool
+) -> dict:
+    config = load_config(config_path)
+    config.pipeline.mode = mode
+    config.retrieval.db_path = db_path
+    detector = EpistemicRiskDetector(config)
+    if hash_encoder:
+        detector.retriever._encoder = HashEncoder()
+    detector.index_corpus(str(CORPUS))
+    detector.warm_up()
+
+    latencies = []
+    stages: dict[str, list[float]] = {}
+    claims = 0
+    flagged = []
+    for _ in range(repeat):
+        for response in RESPONSES:
+            t0 = time.perf_counter()
+            result = detector.analyze(response)
+            latencies.append(time.perf_counter() - t0)
+            for stage, seconds in result.metadata["timings"].items():
+                stages.setdefault(stage, []).append(seconds)
+            claims += len(result.claims)
+            flagged.append(any(v.label == VerdictLabel.HALLUCINATED for v in result.verdicts))
+
+    return {
+        "mode": mode,
+        "mean_ms": float(np.mean(latencies) * 1000),
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p95_ms": float(np.percentile(latencies, 95) * 1000),
+        "claims_per_response": claims / len(latencies),
+        "stages_ms": {stage: float(np.mean(s) * 1000) for stage, s in stages.items()},
+        "flagged": flagged[: len(RESPONSES)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modes", nargs="+", default=["fast", "llm"], choices=["fast", "llm"])
+    parser.add_argument("--config", "-c", help="Config file for the LLM provider")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the responses")
+    parser.add_argument("--hash-encoder", action="store_true", help="Skip the embedding model")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes:
+            provider = load_config(args.config).llm.provider
+            if mode == "llm" and not has_api_key(provider):
+                print(f"Skipping llm mode: no API key for provider '{provider}'")
+                continue
+            # LLM calls dominate; one pass is enough to measure them
+            repeat = args.repeat if mode == "fast" else 1
+            db_path = str(Path(tmp) / f"{mode}.db")
+            results.append(bench_mode(mode, db_path, args.config, repeat, args.hash_encoder))
+
+    print(
+        f"{'mode':>6} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'claims':>7}  "
+        "extraction / retrieval / claim_processing ms"
+    )
+    for r in results:
+        stages = " / ".join(
+            f"{r['stages_ms'].get(s, 0.0):.2f}"
+            for s in ("extraction", "retrieval", "claim_processing")
+        )
+        print(
+            f"{r['mode']:>6} {r['mean_ms']:>9.2f} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} "
+            f"{r['claims_per_response']:>7.1f}  {stages}"
+        )
+
+    if len(results) == 2:
+        fast, llm = results
+        agree = sum(a == b for a, b in zip(fast["flagged"], llm["flagged"]))
+        print(f"\nSpeedup: {llm['mean_ms'] / fast['mean_ms']:.0f}x")
+        print(f"Agreement on 'contains a hallucination': {agree}/{len(RESPONSES)} responses")
+
+
+if __name__ == "__main__":
+    main()
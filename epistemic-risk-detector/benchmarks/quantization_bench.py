@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Quantized scan matrix benchmark for LocalVectorStore.
+
+Builds a clustered synthetic corpus (so neighbours are meaningful), then
+compares float32, float16 and int8 scan matrices on matrix memory, query
+latency and recall@k against exact float32 search. Recall is reported for
+the approximate ranking alone (pool = top_k) and after float32 rescoring
+of `rescore_candidates` hits.
+
+Usage:
+    python benchmarks/quantization_bench.py
+    python benchmarks/quantization_bench.py --chunks 200000 --dim 384 --queries 50
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.config import RetrievalConfig
+from src.retrievers.local_vector import LocalVectorStore
+
+
+class LookupEncoder:
+    """Maps query strings to pre-generated vectors; stands in for the sentence transformer."""
+
+    def __init__(self, vectors: dict[str, np.ndarray]):
+        self.vectors = vectors
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True):
+        return np.stack([self.vectors[t] for t in texts])
+
+
+def clustered(rng: np.random.Generator, n: int, dim: int, centers: np.ndarray) -> np.ndarray:
+    """Unit vectors scattered around random cluster centers."""
+    embs = centers[rng.integers(len(centers), size=n)] + 0.35 * rng.standard_normal((n, dim))
+    embs = embs.astype(np.float32)
+    return embs / np.linalg.norm(embs, axis=1, keepdims=True)
+
+
+def populate(store: LocalVectorStore, embs: np.ndarray, batch: int = 50_000) -> None:
+    for start in range(0, len(embs), batch):
+        store._db.executemany(
+            "INSERT INTO chunks (id, text, source, chunk_index, embedding, metadata) "
+            "VALUES (?, ?, ?, ?, ?, '{}')",
+            (
+                (f"c{i}", f"chunk {i}", f"doc{i // 100}.txt", i % 100, embs[i].tobytes())
+                for i in range(start, min(start + batch, len(embs)))
+            ),
+        )
+    store._bump_generation()
+    store._db.commit()
+    store._invalidate_matrix()
+
+
+def recall(results: list, truth: list[set[str]]) -> float:
+    found = sum(len({c.id for c in r} & t) for r, t in zip(results, truth))
+    return found / sum(len(t) for t in truth)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--rescore", type=int, default=50, help="rescore_candidates")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((max(1, args.chunks // 200), args.dim))
+    embs = clustered(rng, args.chunks, args.dim, centers)
+    queries = clustered(rng, args.queries, args.dim, centers)
+    names = [f"q{i}" for i in range(args.queries)]
+
+    truth = []
+    for q in queries:
+        best = np.argpartition(-(embs @ q), args.top_k)[: args.top_k]
+        truth.append({f"c{i}" for i in best})
+
+    print(
+        f"{'mode':>8} {'matrix MB':>10} {'saving':>7} {'p50 ms':>8} "
+        f"{'recall approx':>14} {'recall rescored':>16}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        seed = LocalVectorStore(RetrievalConfig(db_path=db_path))
+        populate(seed, embs)
+        float32_bytes = embs.nbytes
+
+        for mode in ["none", "float16", "int8"]:
+            row = {}
+            for label, pool in [("approx", args.top_k), ("rescored", args.rescore)]:
+                store = LocalVectorStore(
+                    RetrievalConfig(
+                        db_path=db_path,
+                        similarity_threshold=0.0,
+                        quantization=mode,
+                        rescore_candidates=pool,
+                        query_cache_size=0,
+                    )
+                )
+                store._encoder = LookupEncoder(dict(zip(names, queries)))
+                matrix, _ = store._load_matrix()
+
+                latencies, results = [], []
+                for name in names:
+                    t0 = time.perf_counter()
+                    results.append(store.retrieve(name, top_k=args.top_k))
+                    latencies.append(time.perf_counter() - t0)
+
+                row[label] = recall(results, truth)
+                row["p50_ms"] = float(np.percentile(latencies, 50) * 1000)
+                row["bytes"] = matrix.nbytes
+
+            print(
+                f"{mode:>8} {row['bytes'] / 2**20:>10.1f} "
+                f"{1 - row['bytes'] / float32_bytes:>7.0%} {row['p50_ms']:>8.2f} "
+                f"{row['approx']:>14.3f} {row['rescored']:>16.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Retrieval benchmark for LocalVectorStore.
+
+Fills a throwaway evidence database with random unit-norm embeddings and
+times query latency at several corpus sizes. Uses a random query encoder so
+no model download is needed; numbers reflect the scoring engine only.
+
+Usage:
+    python benchmarks/retrieval_bench.py
+    python benchmarks/retrieval_bench.py --sizes 10000 100000 --dim 384 --queries 20
+    python benchmarks/retrieval_bench.py --backends brute_force sqlite_vec
+    python benchmarks/retrieval_bench.py --mmap   # cold start from the .npy sidecar
+    python benchmarks/retrieval_bench.py --prefilter 200   # BM25 first-stage candidates
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.config import RetrievalConfig
+from src.retrievers.local_vector import LocalVectorStore
+
+
+class RandomEncoder:
+    """Returns random unit vectors; stands in for the sentence transformer."""
+
+    def __init__(self, dim: int, seed: int = 0):
+        self.dim = dim
+        self.rng = np.random.default_rng(seed)
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True):
+        embs = self.rng.standard_normal((len(texts), self.dim)).astype(np.float32)
+        return embs / np.linalg.norm(embs, axis=1, keepdims=True)
+
+
+def populate(store: LocalVectorStore, n_chunks: int, dim: int, batch: int = 50_000) -> None:
+    """Insert n_chunks synthetic rows directly into the chunks table."""
+    rng = np.random.default_rng(42)
+    for start in range(0, n_chunks, batch):
+        size = min(batch, n_chunks - start)
+        embs = rng.standard_normal((size, dim)).astype(np.float32)
+        embs /= np.linalg.norm(embs, axis=1, keepdims=True)
+        store._db.executemany(
+            "INSERT INTO chunks (id, text, source, chunk_index, embedding, metadata) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (f"c{start + i}", f"synthetic chunk {start + i} topic{(start + i) % 997}",
+                 f"doc{(start + i) // 100}.txt", (start + i) % 100, embs[i].tobytes(),
+                 json.dumps({}))
+                for i in range(size)
+            ),
+        )
+    store._bump_generation()
+    store._db.commit()
+    store._invalidate_matrix()
+    if store.config.backend == "sqlite_vec":
+        store._init_vec_index()  # Backfill the vec0 table from `chunks`
+
+
+def legacy_retrieve(store: LocalVectorStore, query_emb: np.ndarray, top_k: int) -> list:
+    """Per-row loop equivalent to the pre-vectorized implementation."""
+    rows = store._db.execute(
+        "SELECT id, text, source, chunk_index, embedding, metadata FROM chunks"
+    ).fetchall()
+    results = []
+    for chunk_id, text, source, chunk_index, emb_bytes, metadata_str in rows:
+        similarity = float(np.dot(query_emb, np.frombuffer(emb_bytes, dtype=np.float32)))
+        if similarity >= store.config.similarity_threshold:
+            results.append((similarity, chunk_id, text, source, chunk_index, metadata_str))
+    results.sort(reverse=True)
+    return results[:top_k]
+
+
+def bench_size(
+    backend: str,
+    n_chunks: int,
+    dim: int,
+    queries: int,
+    top_k: int,
+    legacy_limit: int,
+    mmap: bool = False,
+    prefilter: int = 0,
+) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        config = RetrievalConfig(
+            db_path=str(Path(tmp) / "bench.db"),
+            similarity_threshold=0.0,
+            backend=backend,
+            mmap_sidecar=mmap,
+            lexical_prefilter=prefilter,
+        )
+        store = LocalVectorStore(config)
+        store._encoder = RandomEncoder(dim)
+
+        t0 = time.perf_counter()
+        populate(store, n_chunks, dim)
+        populate_s = time.perf_counter() - t0
+
+        if backend == "brute_force" and mmap:
+            store._load_matrix()  # Writes the sidecar
+            store._invalidate_matrix()
+
+        t0 = time.perf_counter()
+        if backend == "brute_force":
+            store._load_matrix()
+        load_s = time.perf_counter() - t0
+
+        latencies = []
+        for i in range(queries):
+            t0 = time.perf_counter()
+            # Selective token shared with ~1/997 of the chunks, so BM25 has candidates
+            store.retrieve(f"topic{i * 31 % 997}", top_k=top_k)
+            latencies.append(time.perf_counter() - t0)
+
+        result = {
+            "backend": backend,
+            "chunks": n_chunks,
+            "populate_s": populate_s,
+            "matrix_load_s": load_s,
+            "p50_ms": float(np.percentile(latencies, 50) * 1000),
+            "p95_ms": float(np.percentile(latencies, 95) * 1000),
+            "legacy_ms": None,
+        }
+
+        if n_chunks <= legacy_limit:
+            query_emb = store._embed(["legacy"])[0]
+            t0 = time.perf_counter()
+            legacy_retrieve(store, query_emb, top_k)
+            result["legacy_ms"] = (time.perf_counter() - t0) * 1000
+
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--backends", nargs="+", default=["brute_force"], choices=["brute_force", "sqlite_vec"]
+    )
+    parser.add_argument("--mmap", action="store_true", help="Load the matrix from the sidecar")
+    parser.add_argument(
+        "--prefilter", type=int, default=0,
+        help="Dense-score only the top-N BM25 candidates (brute_force backend)",
+    )
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument(
+        "--legacy-limit", type=int, default=100_000,
+        help="Largest corpus to also time with the per-row reference loop",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'backend':>12} {'chunks':>10} {'populate s':>11} {'load s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'legacy ms':>10}"
+    )
+    for backend in args.backends:
+        for n in args.sizes:
+            r = bench_size(
+                backend, n, args.dim, args.queries, args.top_k, args.legacy_limit, args.mmap,
+                args.prefilter,
+            )
+            legacy = f"{r['legacy_ms']:.1f}" if r["legacy_ms"] is not None else "-"
+            print(
+                f"{r['backend']:>12} {r['chunks']:>10} {r['populate_s']:>11.2f} "
+                f"{r['matrix_load_s']:>8.2f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {legacy:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Streaming, resumable analysis of JSONL response dumps."""
+
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
+
+from src.core.schemas import BatchProgress
+from src.pipeline import EpistemicRiskDetector
+
+
+class BatchRecord(NamedTuple):
+    """One input line: the response text, or why it could not be read."""
+
+    id: str
+    text: str | None
+    error: str | None = None
+
+
+def iter_records(
+    lines: Iterable[str], id_field: str = "id", text_field: str = "text"
+) -> Iterator[BatchRecord]:
+    """
+    Parse JSONL lines into records, lazily.
+
+    Records without an id are keyed by their 1-based line number, so
+    resuming works as long as the input file is not reordered. Unreadable
+    lines become records carrying an error instead of stopping the batch.
+    """
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        fallback_id = f"line:{line_no}"
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield BatchRecord(fallback_id, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield BatchRecord(fallback_id, None, "Record is not a JSON object")
+            continue
+
+        record_id = str(record[id_field]) if record.get(id_field) is not None else fallback_id
+        text = record.get(text_field)
+        if not isinstance(text, str) or not text.strip():
+            yield BatchRecord(record_id, None, f"Missing or empty '{text_field}'")
+        else:
+            yield BatchRecord(record_id, text)
+
+
+def completed_ids(path: str | Path) -> set[str]:
+    """IDs that already have a successful result in an output file.
+
+    Error lines are not counted, so failed records are retried on resume.
+    A line cut short by an interrupted run is ignored.
+    """
+    path = Path(path)
+    if not path.exists():
+        return set()
+
+    done = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(result, dict) and "id" in result and "error" not in result:
+                done.add(str(result["id"]))
+    return done
+
+
+def open_for_append(path: str | Path) -> TextIO:
+    """Open an output file for appending, terminating a truncated last line first."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    out = open(path, "a+", encoding="utf-8")
+    if out.tell() > 0:
+        out.seek(out.tell() - 1)
+        if out.read(1) != "\n":
+            out.write("\n")
+    return out
+
+
+def run_batch(
+    detector: EpistemicRiskDetector,
+    records: Iterable[BatchRecord],
+    out: TextIO,
+    workers: int = 4,
+    skip: set[str] | frozenset[str] = frozenset(),
+    progress: Callable[[BatchProgress], None] | None = None,
+    batch_size: int = 1,
+) -> BatchProgress:
+    """
+    Analyze records on a thread pool, writing one JSON line per record as it completes.
+
+    Records are sent to `analyze_batch` in groups of `batch_size`, so
+    repeated claims within a group share retrieval and alignment. If a
+    group fails, its records are retried one by one to isolate the bad one.
+
+    Lines are `{"id": ..., **render_for_web(result)}` or `{"id": ..., "error": ...}`
+    in completion order, flushed immediately so an interrupted run can be
+    resumed with `skip=completed_ids(output)`. At most `2 * workers` groups
+    are read ahead, so memory does not grow with the input size.
+    """
+    state = BatchProgress()
+    started = time.perf_counter()
+
+    def analyze(group: list[BatchRecord]) -> list[tuple[dict[str, Any], int] | Exception]:
+        try:
+            results = detector.analyze_batch([record.text or "" for record in group])
+        except Exception as e:
+            if len(group) == 1:
+                return [e]
+            return [outcome for record in group for outcome in analyze([record])]
+        return [
+            ({"id": record.id, **detector.render_web(result)}, len(result.claims))
+            for record, result in zip(group, results)
+        ]
+
+    def emit(line: dict[str, Any]) -> None:
+        out.write(json.dumps(line) + "\n")
+        out.flush()
+        state.elapsed_seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(state.model_copy())
+
+    def collect(futures: dict[Future, list[BatchRecord]]) -> None:
+        for future, group in futures.items():
+            for record, outcome in zip(group, future.result()):
+                if isinstance(outcome, Exception):
+                    state.records_failed += 1
+                    emit({"id": record.id, "error": f"{type(outcome).__name__}: {outcome}"})
+                else:
+                    line, n_claims = outcome
+                    state.records_done += 1
+                    state.claims += n_claims
+                    emit(line)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analyze-batch") as pool:
+        in_flight: dict[Future, list[BatchRecord]] = {}
+        group: list[BatchRecord] = []
+
+        def submit() -> None:
+            if group:
+                in_flight[pool.submit(analyze, list(group))] = list(group)
+                group.clear()
+            if len(in_flight) >= 2 * workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect({future: in_flight.pop(future) for future in done})
+
+        for record in records:
+            if record.id in skip:
+                state.records_skipped += 1
+                continue
+            if record.error is not None:
+                state.records_failed += 1
+                emit({"id": record.id, "error": record.error})
+                continue
+
+            group.append(record)
+            if len(group) >= batch_size:
+                submit()
+        submit()
+
+        for future in as_completed(list(in_flight)):
+            collect({future: in_flight.pop(future)})
+
+    state.elapsed_seconds = time.perf_counter() - started
+    return state
@@ -0,0 +1,6 @@
+"""Caching module - persistent and in-memory caches for expensive stages."""
+
+from src.cache.memory import LRUCache, TieredCache
+from src.cache.persistent import PersistentCache
+
+__all__ = ["LRUCache", "PersistentCache", "TieredCache"]
@@ -0,0 +1,85 @@
+"""In-memory LRU cache and a memory-over-disk tiered cache."""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from src.cache.persistent import PersistentCache
+
+
+class LRUCache:
+    """Bounded, thread-safe least-recently-used cache."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        """Return the cached value (marking it recently used), or None."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+
+class TieredCache:
+    """LRU memory tier in front of an optional persistent tier.
+
+    Persistent hits are promoted into memory; puts write through to both.
+    """
+
+    def __init__(self, memory: LRUCache, persistent: PersistentCache | None = None):
+        self.memory = memory
+        self.persistent = persistent
+
+    def get(self, key: str) -> dict | None:
+        value = self.memory.get(key)
+        if value is None and self.persistent is not None:
+            value = self.persistent.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        self.memory.put(key, value)
+        if self.persistent is not None:
+            self.persistent.put(key, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def stats(self) -> dict:
+        stats = {"memory": self.memory.stats()}
+        if self.persistent is not None:
+            stats["persistent"] = self.persistent.stats()
+        return stats
@@ -0,0 +1,193 @@
+"""SQLite-backed persistent cache with TTL and size-based eviction."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class PersistentCache:
+    """On-disk JSON key-value cache, partitioned by namespace.
+
+    Entries older than `ttl_seconds` are treated as misses and purged.
+    A put that takes a namespace past `max_entries` evicts the least
+    recently read entries, so the bound holds after every write. Read times
+    are buffered and written in batches rather than committed per hit.
+    Safe to share across threads.
+    """
+
+    _EVICT_EVERY = 256  # Puts between sweeps for expired entries
+    _TOUCH_BATCH = 256  # Keys read before their buffered accessed_at updates are written
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+        self._touched: dict[str, float] = {}  # key -> last read time not yet written
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self._db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cache_accessed
+            ON cache_entries(namespace, accessed_at)
+        """)
+        self._db.commit()
+        self._entries = self._count_locked()
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached value, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, created_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+
+            if row is not None and self._expired(row[1], now):
+                cursor = self._db.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                self._db.commit()
+                self._entries -= cursor.rowcount
+                self._touched.pop(key, None)
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._touched[key] = now
+            if len(self._touched) >= self._TOUCH_BATCH:
+                self._flush_touches_locked()
+                self._db.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, value: dict) -> None:
+        """Store a JSON-serializable value under key, evicting past max_entries."""
+        now = time.time()
+        with self._lock:
+            exists = self._db.execute(
+                "SELECT 1 FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), now, now),
+            )
+            self._touched.pop(key, None)
+            if exists is None:
+                self._entries += 1
+
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= self._EVICT_EVERY:
+                self._evict_locked()
+            elif self.max_entries is not None and self._entries > self.max_entries:
+                self._trim_locked(self._entries - self.max_entries)
+            else:
+                # Buffered reads ride along with this write's commit
+                self._flush_touches_locked()
+            self._db.commit()
+
+    def evict(self) -> int:
+        """Purge expired entries and trim to max_entries. Returns entries removed."""
+        with self._lock:
+            removed = self._evict_locked()
+            self._db.commit()
+            return removed
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace."""
+        with self._lock:
+            self._db.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            self._db.commit()
+            self._touched.clear()
+            self._entries = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            entries = self._count_locked()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _count_locked(self) -> int:
+        (entries,) = self._db.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        return entries
+
+    def _flush_touches_locked(self) -> None:
+        """Write buffered read times; the caller commits."""
+        if self._touched:
+            self._db.executemany(
+                "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                [(at, self.namespace, key) for key, at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _trim_locked(self, overflow: int) -> int:
+        """Delete the `overflow` least recently read entries; the caller commits."""
+        self._flush_touches_locked()
+        cursor = self._db.execute(
+            """
+            DELETE FROM cache_entries WHERE namespace = ? AND key IN (
+                SELECT key FROM cache_entries WHERE namespace = ?
+                ORDER BY accessed_at ASC LIMIT ?
+            )
+            """,
+            (self.namespace, self.namespace, overflow),
+        )
+        self._entries -= cursor.rowcount
+        return cursor.rowcount
+
+    def _evict_locked(self) -> int:
+        """Purge expired entries and trim to max_entries; the caller commits."""
+        self._puts_since_evict = 0
+        self._flush_touches_locked()
+        removed = 0
+
+        if self.ttl_seconds is not None:
+            cursor = self._db.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND created_at < ?",
+                (self.namespace, time.time() - self.ttl_seconds),
+            )
+            removed += cursor.rowcount
+
+        # Recount so writes from other processes sharing the file are picked up
+        self._entries = self._count_locked()
+        if self.max_entries is not None and self._entries > self.max_entries:
+            removed += self._trim_locked(self._entries - self.max_entries)
+        return removed
@@ -4,8 +4,10 @@ from pathlib import Path
 
 import click
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
 
 from src.core.config import Config, load_config
+from src.core.schemas import BatchProgress, IndexProgress
 from src.pipeline import EpistemicRiskDetector
 
 console = Console()
@@ -13,28 +15,68 @@ console = Console()
 
 @click.group()
 @click.option("--config", "-c", type=click.Path(exists=True), help="Path to config file")
+@click.option("--fast", is_flag=True, help="Rule-only extraction and alignment, no LLM calls")
 @click.pass_context
-def main(ctx: click.Context, config: str | None) -> None:
+def main(ctx: click.Context, config: str | None, fast: bool) -> None:
     """Epistemic Risk Detector - Inspect epistemic risk in LLM outputs."""
     ctx.ensure_object(dict)
     ctx.obj["config"] = load_config(config) if config else load_config()
+    if fast:
+        ctx.obj["config"].pipeline.mode = "fast"
 
 
 @main.command()
 @click.argument("path", type=click.Path(exists=True))
 @click.option("--extensions", "-e", multiple=True, help="File extensions to index")
+@click.option("--force", is_flag=True, help="Re-embed files even if they are unchanged")
+@click.option("--metadata", "-m", "tags", multiple=True, metavar="KEY=VALUE",
+              help="Tag every chunk, for filtering retrieval (repeatable)")
 @click.pass_context
-def index(ctx: click.Context, path: str, extensions: tuple[str, ...]) -> None:
+def index(
+    ctx: click.Context, path: str, extensions: tuple[str, ...], force: bool, tags: tuple[str, ...]
+) -> None:
     """Index documents for evidence retrieval."""
     config: Config = ctx.obj["config"]
     detector = EpistemicRiskDetector(config)
 
+    metadata = {}
+    for tag in tags:
+        key, sep, value = tag.partition("=")
+        if not sep or not key or '"' in key:
+            raise click.BadParameter(f"expected KEY=VALUE, got {tag!r}", param_hint="--metadata")
+        metadata[key] = value
+
     ext_list = list(extensions) if extensions else None
+    last: list[IndexProgress] = []
+
+    with Progress(
+        TextColumn("Indexing"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("files"),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True,
+    ) as bar:
+        task = bar.add_task("index", total=None)
+
+        def on_progress(p: IndexProgress) -> None:
+            last[:] = [p]
+            bar.update(task, total=p.files_total, completed=p.files_done)
 
-    with console.status(f"Indexing {path}..."):
-        count = detector.index_corpus(path, ext_list)
+        count = detector.index_corpus(
+            path, ext_list, progress=on_progress, force=force, metadata=metadata or None
+        )
 
     console.print(f"[green]✓[/green] Indexed {count} chunks from {path}")
+    if last:
+        p = last[0]
+        console.print(
+            f"  {p.files_done} files in {p.elapsed_seconds:.1f}s "
+            f"({p.files_per_second:.1f} files/s, {p.chunks_per_second:.1f} chunks/s)"
+        )
+        if p.files_skipped or p.files_removed:
+            console.print(f"  {p.files_skipped} unchanged, {p.files_removed} removed")
     stats = detector.retriever.stats()
     console.print(f"  Total: {stats['total_chunks']} chunks from {stats['total_documents']} documents")
 
@@ -71,6 +113,89 @@ def analyze(ctx: click.Context, text: str | None, file: str | None, output_json:
         console.print(detector.render_cli(result))
 
 
+@main.command("analyze-batch")
+@click.argument("input_path", metavar="INPUT", type=click.Path(exists=True, dir_okay=False))
+@click.option("--output", "-o", required=True, type=click.Path(dir_okay=False),
+              help="JSONL file to append results to")
+@click.option("--workers", "-j", type=int, default=4, show_default=True,
+              help="Groups of responses analyzed in parallel")
+@click.option("--batch-size", "-b", type=int, default=8, show_default=True,
+              help="Responses per group; repeated claims in a group share evidence work")
+@click.option("--id-field", default="id", show_default=True, help="Record ID field")
+@click.option("--text-field", default="text", show_default=True, help="Response text field")
+@click.option("--restart", is_flag=True, help="Overwrite the output instead of resuming it")
+@click.pass_context
+def analyze_batch(
+    ctx: click.Context,
+    input_path: str,
+    output: str,
+    workers: int,
+    batch_size: int,
+    id_field: str,
+    text_field: str,
+    restart: bool,
+) -> None:
+    """Analyze a JSONL file of responses, streaming results to a JSONL output."""
+    from src.batch import completed_ids, iter_records, open_for_append, run_batch
+
+    config: Config = ctx.obj["config"]
+    if workers < 1:
+        raise click.BadParameter("must be at least 1", param_hint="--workers")
+    if batch_size < 1:
+        raise click.BadParameter("must be at least 1", param_hint="--batch-size")
+
+    if restart:
+        Path(output).unlink(missing_ok=True)
+    done = completed_ids(output)
+
+    with console.status("Loading models and index..."):
+        detector = EpistemicRiskDetector(config)
+        detector.warm_up()
+
+    with (
+        open(input_path, encoding="utf-8") as lines,
+        open_for_append(output) as out,
+        Progress(
+            TextColumn("Analyzing"),
+            TextColumn("{task.completed} responses"),
+            TextColumn("[dim]{task.fields[rate]:.1f}/s[/dim]"),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True,
+        ) as bar,
+    ):
+        task = bar.add_task("analyze", total=None, rate=0.0)
+
+        def on_progress(p: BatchProgress) -> None:
+            bar.update(task, completed=p.records_done + p.records_failed, rate=p.records_per_second)
+
+        summary = run_batch(
+            detector,
+            iter_records(lines, id_field, text_field),
+            out,
+            workers=workers,
+            skip=done,
+            progress=on_progress,
+            batch_size=batch_size,
+        )
+
+    console.print(
+        f"[green]✓[/green] Analyzed {summary.records_done} responses "
+        f"({summary.claims} claims) in {summary.elapsed_seconds:.1f}s"
+    )
+    console.print(
+        f"  {summary.records_per_second:.2f} responses/s, "
+        f"{summary.claims_per_second:.2f} claims/s with {workers} workers"
+    )
+    if summary.records_skipped:
+        console.print(f"  {summary.records_skipped} already in {output}, skipped")
+    if summary.records_failed:
+        console.print(
+            f"  [red]{summary.records_failed} failed[/red] (error lines in {output}; "
+            f"rerun to retry them)"
+        )
+
+
 @main.command()
 @click.pass_context
 def stats(ctx: click.Context) -> None:
@@ -81,9 +206,43 @@ def stats(ctx: click.Context) -> None:
     stats = detector.retriever.stats()
     console.print(f"Indexed chunks: {stats['total_chunks']}")
     console.print(f"Documents: {stats['total_documents']}")
+    console.print(
+        f"Embedding dedup: {stats['embedding_dedup_ratio']:.1%} "
+        f"({stats['embeddings_reused']} reused, {stats['embeddings_encoded']} encoded)"
+    )
     console.print(f"Database: {config.retrieval.db_path}")
 
 
+@main.command()
+@click.option("--host", help="Interface to bind (default: server.host)")
+@click.option("--port", "-p", type=int, help="Port to listen on (default: server.port)")
+@click.pass_context
+def serve(ctx: click.Context, host: str | None, port: int | None) -> None:
+    """Serve the analysis API over HTTP, keeping models and indexes loaded."""
+    from src.server import AnalysisServer
+
+    config: Config = ctx.obj["config"]
+    overrides = {k: v for k, v in {"host": host, "port": port}.items() if v is not None}
+    server_config = config.server.model_copy(update=overrides)
+
+    with console.status("Loading models and index..."):
+        detector = EpistemicRiskDetector(config)
+        server = AnalysisServer(detector, server_config)
+
+    stats = detector.retriever.stats()
+    console.print(
+        f"[green]✓[/green] Serving on {server.url} "
+        f"({stats['total_chunks']} chunks from {stats['total_documents']} documents)"
+    )
+    console.print("  POST /analyze, POST /analyze/batch, GET /stats  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("Shutting down")
+    finally:
+        server.server_close()
+
+
 @main.command()
 @click.option("--output", "-o", type=click.Path(), default="config.yaml", help="Output path")
 @click.pass_context
@@ -2,11 +2,13 @@
 
 from src.core.interfaces import (
     AlignmentEvaluator,
+    AsyncLLMProvider,
     ClaimExtractor,
     ConfidenceCalibrator,
     EvidenceProvider,
     LLMProvider,
     OutputRenderer,
+    ResultCache,
     VerdictEngine,
 )
 from src.core.schemas import (
@@ -17,6 +19,7 @@ from src.core.schemas import (
     ClaimType,
     ContradictionType,
     EvidenceChunk,
+    EvidenceFilter,
     Verdict,
     VerdictLabel,
 )
@@ -25,6 +28,7 @@ __all__ = [
     "AlignmentEvaluator",
     "AlignmentLabel",
     "AlignmentResult",
+    "AsyncLLMProvider",
     "CalibratedConfidence",
     "Claim",
     "ClaimExtractor",
@@ -32,9 +36,11 @@ __all__ = [
     "ConfidenceCalibrator",
     "ContradictionType",
     "EvidenceChunk",
+    "EvidenceFilter",
     "EvidenceProvider",
     "LLMProvider",
     "OutputRenderer",
+    "ResultCache",
     "Verdict",
     "VerdictEngine",
     "VerdictLabel",
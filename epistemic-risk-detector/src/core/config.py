@@ -27,6 +27,47 @@ class RetrievalConfig(BaseModel):
     similarity_threshold: float = Field(0.3, ge=0.0, le=1.0)
     embedding_model: str = "all-MiniLM-L6-v2"
     db_path: str = ".hallucination_debugger/evidence.db"
+    read_pool_size: int = Field(4, gt=0)  # Read-only connections for concurrent queries
+    busy_timeout_seconds: float = Field(30.0, ge=0.0)  # Wait this long on a locked database
+    # "brute_force" scores an in-memory matrix; "sqlite_vec" pushes KNN into a vec0 table
+    backend: Literal["brute_force", "sqlite_vec"] = "brute_force"
+    # > 1 partitions chunks by source hash across <db>.shard{i}.db files (ShardedVectorStore)
+    shards: int = Field(1, ge=1)
+    # Serve the brute-force matrix from a memory-mapped .npy sidecar next to db_path
+    mmap_sidecar: bool = False
+    # Compact brute-force scan matrix; float32 BLOBs stay in SQLite for exact rescoring.
+    # Trades latency for memory: numpy has no fast half/int8 matmul, so blocks are widened
+    # to float32 per scan (100k chunks, scan p50: none 1.4 ms, int8 3.1 ms, float16 11.8 ms)
+    quantization: Literal["none", "int8", "float16"] = "none"
+    rescore_candidates: int = Field(50, gt=0)  # Approximate hits re-ranked in float32 per claim
+    index_workers: int = Field(0, ge=0)  # Read/chunk processes; 0 = one per CPU, 1 = in-process
+    index_batch_size: int = Field(1024, gt=0)  # Chunks per embedding call and write transaction
+    # Files above this size are streamed and flushed batch by batch instead of read whole
+    stream_threshold_bytes: int = Field(8 * 1024 * 1024, ge=0)
+    query_cache_size: int = Field(1024, ge=0)  # Query embeddings kept in memory; 0 disables
+    # "hybrid" fuses BM25 (SQLite FTS5) and cosine rankings with reciprocal rank fusion
+    search_mode: Literal["dense", "hybrid"] = "dense"
+    hybrid_candidates: int = Field(50, gt=0)  # Per-ranker pool fed into the fusion
+    rrf_k: int = Field(60, gt=0)
+    # > 0: brute-force scoring only over the top-N BM25 candidates of each claim
+    lexical_prefilter: int = Field(0, ge=0)
+
+
+class AlignmentConfig(BaseModel):
+    """Alignment evaluation configuration."""
+
+    # "nli" judges with a local cross-encoder NLI model instead of the LLM, in any pipeline.mode
+    evaluator: Literal["llm", "nli"] = "llm"
+    batch_evidence: bool = False  # One LLM call per claim covering all its evidence chunks
+    # Rules settle clear-cut pairs; only uncertain ones are sent to the LLM
+    cascade: bool = False
+    # Escalate when the heuristic score is within this distance of a label boundary
+    escalation_band: float = Field(0.15, ge=0.0, le=1.0)
+    near_duplicate_similarity: float = Field(0.95, ge=0.0, le=1.0)  # Settled as SUPPORTS
+    nli_model: str = "cross-encoder/nli-deberta-v3-xsmall"
+    nli_batch_size: int = Field(128, gt=0)  # Pairs per forward-pass minibatch
+    # Entailment probability at which a neutral pair counts as WEAK_SUPPORT
+    nli_weak_support: float = Field(0.25, ge=0.0, le=1.0)
 
 
 class CalibrationConfig(BaseModel):
@@ -56,14 +97,52 @@ class ExtractionConfig(BaseModel):
     include_opinions: bool = False
 
 
+class CacheConfig(BaseModel):
+    """Result cache configuration."""
+
+    path: str = ".hallucination_debugger/cache.db"
+    alignment_enabled: bool = False
+    alignment_ttl_seconds: float | None = Field(7 * 24 * 3600, gt=0)  # None = never expire
+    alignment_max_entries: int | None = Field(100_000, gt=0)  # None = unbounded
+    extraction_enabled: bool = False
+    extraction_memory_entries: int = Field(1024, gt=0)
+    extraction_persistent: bool = False  # Also keep extractions in the on-disk cache
+    extraction_ttl_seconds: float | None = Field(7 * 24 * 3600, gt=0)
+    extraction_max_entries: int | None = Field(100_000, gt=0)
+
+
+class PipelineConfig(BaseModel):
+    """Pipeline orchestration configuration."""
+
+    # "fast" extracts sentences and judges alignment with rules only: no LLM calls
+    mode: Literal["llm", "fast"] = "llm"
+    concurrency: Literal["sequential", "threads"] = "sequential"
+    max_workers: int = Field(8, gt=0)  # Max claims in flight at once
+
+
+class ServerConfig(BaseModel):
+    """HTTP server settings for `epistemic-risk serve`."""
+
+    host: str = "127.0.0.1"
+    port: int = Field(8080, ge=0, le=65535)  # 0 picks a free port
+    batch_workers: int = Field(4, gt=0)  # Threads shared by /analyze/batch requests
+    max_batch_size: int = Field(100, gt=0)
+    max_request_bytes: int = Field(10 * 1024 * 1024, gt=0)
+    access_log: bool = True
+
+
 class Config(BaseModel):
     """Root configuration."""
 
     llm: LLMConfig = Field(default_factory=LLMConfig)
     retrieval: RetrievalConfig = Field(default_factory=RetrievalConfig)
+    alignment: AlignmentConfig = Field(default_factory=AlignmentConfig)
     calibration: CalibrationConfig = Field(default_factory=CalibrationConfig)
     verdict: VerdictConfig = Field(default_factory=VerdictConfig)
     extraction: ExtractionConfig = Field(default_factory=ExtractionConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    server: ServerConfig = Field(default_factory=ServerConfig)
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "Config":
@@ -1,5 +1,6 @@
 """Abstract interfaces for all modules. Each is independently testable and swappable."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Protocol, runtime_checkable
 
@@ -9,6 +10,7 @@ from src.core.schemas import (
     CalibratedConfidence,
     Claim,
     EvidenceChunk,
+    EvidenceFilter,
     Verdict,
 )
 
@@ -26,6 +28,36 @@ class LLMProvider(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncLLMProvider(Protocol):
+    """Async variant of LLMProvider for event-loop based callers."""
+
+    async def acomplete(self, prompt: str, temperature: float = 0.0) -> str:
+        """Generate a completion for the given prompt."""
+        ...
+
+    async def acomplete_json(self, prompt: str, schema: dict) -> dict:
+        """Generate a JSON completion conforming to the schema."""
+        ...
+
+
+@runtime_checkable
+class ResultCache(Protocol):
+    """Key-value cache for JSON-serializable stage results."""
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached value, or None on a miss."""
+        ...
+
+    def put(self, key: str, value: dict) -> None:
+        """Store a value under key."""
+        ...
+
+    def stats(self) -> dict:
+        """Hit/miss counters and size."""
+        ...
+
+
 class ClaimExtractor(ABC):
     """Extracts atomic, falsifiable claims from LLM responses."""
 
@@ -52,24 +84,45 @@ class ClaimExtractor(ABC):
         """
         pass
 
+    async def aextract_with_confidence(self, text: str) -> tuple[list[Claim], dict]:
+        """Async extract_with_confidence; runs the sync version in a worker thread by default."""
+        return await asyncio.to_thread(self.extract_with_confidence, text)
+
 
 class EvidenceProvider(ABC):
     """Interface for evidence retrieval. Implement for different sources."""
 
     @abstractmethod
-    def retrieve(self, claim: str, top_k: int = 5) -> list[EvidenceChunk]:
+    def retrieve(
+        self, claim: str, top_k: int = 5, filters: EvidenceFilter | None = None
+    ) -> list[EvidenceChunk]:
         """
         Retrieve evidence chunks relevant to a claim.
 
         Args:
             claim: The claim text to find evidence for
             top_k: Maximum number of chunks to return
+            filters: Only consider chunks matching this filter
 
         Returns:
             List of evidence chunks, may be empty (valid signal)
         """
         pass
 
+    def retrieve_many(
+        self, claims: list[str], top_k: int = 5, filters: EvidenceFilter | None = None
+    ) -> list[list[EvidenceChunk]]:
+        """
+        Retrieve evidence for several claims at once.
+
+        Override when the backend can batch encoding or scoring; the default
+        falls back to one retrieve() call per claim.
+
+        Returns:
+            One evidence list per claim, in input order
+        """
+        return [self.retrieve(claim, top_k, filters) for claim in claims]
+
     @abstractmethod
     def index_document(self, path: str) -> int:
         """
@@ -94,6 +147,10 @@ class EvidenceProvider(ABC):
 class AlignmentEvaluator(ABC):
     """Evaluates semantic and logical alignment between claims and evidence."""
 
+    # True when evaluate_many judges all claims in one call (e.g. one model forward
+    # pass); the pipeline then aligns a response's claims together instead of per claim
+    batches_claims: bool = False
+
     @abstractmethod
     def evaluate(self, claim: Claim, evidence: list[EvidenceChunk]) -> list[AlignmentResult]:
         """
@@ -113,6 +170,26 @@ class AlignmentEvaluator(ABC):
         """Evaluate alignment for a single claim-evidence pair."""
         pass
 
+    def evaluate_many(
+        self, claims: list[Claim], evidence_by_claim: list[list[EvidenceChunk]]
+    ) -> list[list[AlignmentResult]]:
+        """
+        Evaluate several claims, each against its own evidence.
+
+        Override when the backend can batch across claims; the default falls
+        back to one evaluate() call per claim.
+
+        Returns:
+            One alignment list per claim, in input order
+        """
+        return [self.evaluate(c, evidence) for c, evidence in zip(claims, evidence_by_claim)]
+
+    async def aevaluate(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> list[AlignmentResult]:
+        """Async evaluate; runs the sync version in a worker thread by default."""
+        return await asyncio.to_thread(self.evaluate, claim, evidence)
+
 
 class ConfidenceCalibrator(ABC):
     """Calibrates model confidence based on evidence and language patterns."""
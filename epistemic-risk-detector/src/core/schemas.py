@@ -1,5 +1,6 @@
 """Strict schemas for all data structures. Schema drift breaks builds, not production."""
 
+import json
 from enum import Enum
 from typing import Optional
 
@@ -80,6 +81,41 @@ class EvidenceChunk(BaseModel):
     metadata: dict = Field(default_factory=dict)
 
 
+# Per-document tags stored on every chunk at index time, e.g. {"product": "api"}
+MetadataValue = str | int | float | bool | None
+DocumentMetadata = dict[str, MetadataValue]
+
+
+class EvidenceFilter(BaseModel):
+    """Restricts retrieval to a slice of the corpus; all given conditions must hold."""
+
+    source_prefix: str | None = Field(None, description="Chunk source starts with this")
+    filename_glob: str | None = Field(
+        None, description="Case-sensitive glob on the `filename` metadata, e.g. '*.md'"
+    )
+    metadata: DocumentMetadata = Field(
+        default_factory=dict,
+        description="Metadata key -> required value; None matches a missing key",
+    )
+
+    @field_validator("metadata")
+    @classmethod
+    def validate_keys(cls, v: DocumentMetadata) -> DocumentMetadata:
+        # Keys become quoted JSON path labels ($."key"), which cannot escape a quote
+        for key in v:
+            if not key or '"' in key:
+                raise ValueError(f"metadata key must be non-empty and contain no '\"': {key!r}")
+        return v
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.source_prefix or self.filename_glob or self.metadata)
+
+    def cache_key(self) -> str:
+        """Stable key for caching the rows a filter selects."""
+        return json.dumps(self.model_dump(), sort_keys=True)
+
+
 class ContradictionType(str, Enum):
     """Types of contradictions detected."""
 
@@ -146,3 +182,41 @@ class AnalysisResult(BaseModel):
     overall_hallucination_risk: float = Field(..., ge=0.0, le=1.0)
     summary: str
     metadata: dict = Field(default_factory=dict)
+
+
+class IndexProgress(BaseModel):
+    """Progress snapshot emitted while indexing a corpus."""
+
+    files_total: int = Field(..., ge=0)
+    files_done: int = Field(0, ge=0)
+    files_failed: int = Field(0, ge=0)
+    files_skipped: int = Field(0, ge=0)  # Unchanged since the last run
+    files_removed: int = Field(0, ge=0)  # Deleted from disk; their chunks were dropped
+    chunks_indexed: int = Field(0, ge=0)
+    elapsed_seconds: float = Field(0.0, ge=0.0)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_done / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks_indexed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class BatchProgress(BaseModel):
+    """Progress snapshot emitted while analyzing a batch of responses."""
+
+    records_done: int = Field(0, ge=0)  # Analyzed successfully in this run
+    records_failed: int = Field(0, ge=0)
+    records_skipped: int = Field(0, ge=0)  # Already in the output from an earlier run
+    claims: int = Field(0, ge=0)
+    elapsed_seconds: float = Field(0.0, ge=0.0)
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records_done / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def claims_per_second(self) -> float:
+        return self.claims / self.elapsed_seconds if self.elapsed_seconds else 0.0
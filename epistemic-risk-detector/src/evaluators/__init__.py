@@ -1,5 +1,15 @@
 """Alignment evaluation module."""
 
-from src.evaluators.alignment import LLMAlignmentEvaluator
+from src.evaluators.alignment import (
+    CascadeAlignmentEvaluator,
+    HeuristicAlignmentEvaluator,
+    LLMAlignmentEvaluator,
+)
+from src.evaluators.nli import NLIAlignmentEvaluator
 
-__all__ = ["LLMAlignmentEvaluator"]
+__all__ = [
+    "CascadeAlignmentEvaluator",
+    "HeuristicAlignmentEvaluator",
+    "LLMAlignmentEvaluator",
+    "NLIAlignmentEvaluator",
+]
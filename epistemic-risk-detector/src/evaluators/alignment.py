@@ -1,10 +1,24 @@
 """Alignment evaluation between claims and evidence."""
 
+import asyncio
+import hashlib
 import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
-from src.core.interfaces import AlignmentEvaluator
-from src.core.schemas import AlignmentLabel, AlignmentResult, Claim, ContradictionType, EvidenceChunk
+from src.cache.persistent import PersistentCache
+from src.core.interfaces import AlignmentEvaluator, AsyncLLMProvider
+from src.core.schemas import (
+    AlignmentLabel,
+    AlignmentResult,
+    Claim,
+    ContradictionType,
+    EvidenceChunk,
+)
 
 # Negation patterns
 NEGATION_PATTERNS = [
@@ -15,6 +29,10 @@ NEGATION_PATTERNS = [
     r"\bNOT\b",  # Explicit caps NOT
 ]
 
+# Heuristic score (mean of similarity and keyword overlap) boundaries between labels
+HEURISTIC_SUPPORT_SCORE = 0.7  # Above: SUPPORTS
+HEURISTIC_IRRELEVANT_SCORE = 0.2  # Below: IRRELEVANT; in between: WEAK_SUPPORT
+
 # Temporal markers for date extraction
 YEAR_PATTERN = r"\b(19|20)\d{2}\b"
 VERSION_PATTERN = r"\bv?(\d+\.\d+(?:\.\d+)?)\b"
@@ -57,6 +75,9 @@ Respond with JSON:
   "evidence_date": "extracted date from evidence or null"
 }}"""
 
+# Part of every cache key, so editing the prompt invalidates cached judgments
+ALIGNMENT_PROMPT_VERSION = hashlib.sha256(ALIGNMENT_PROMPT.encode()).hexdigest()[:12]
+
 ALIGNMENT_SCHEMA = {
     "type": "object",
     "properties": {
@@ -74,12 +95,74 @@ ALIGNMENT_SCHEMA = {
     "required": ["label", "confidence", "explanation", "temporal_match", "semantic_score", "logical_score"],
 }
 
+BATCH_ALIGNMENT_PROMPT = """You are a precise fact-checker. Evaluate the relationship between
+a CLAIM and each numbered EVIDENCE passage, judging every passage independently.
 
-class LLMAlignmentEvaluator(AlignmentEvaluator):
-    """Evaluates claim-evidence alignment using an LLM."""
+CLAIM: "{claim}"
 
-    def __init__(self, llm_provider: Any):
-        self.llm = llm_provider
+{evidence_list}
+
+For each passage, classify the relationship as one of:
+- SUPPORTS: Evidence directly confirms the claim
+- WEAK_SUPPORT: Evidence partially supports but doesn't fully confirm
+- CONTRADICTS: Evidence directly contradicts the claim
+- IRRELEVANT: Evidence is unrelated to the claim
+
+Also analyze for each passage:
+1. Temporal alignment: Do dates/versions/timeframes match?
+2. Semantic alignment: Does the meaning align?
+3. Logical alignment: Is the claim logically derivable from evidence?
+4. Negation: Does the evidence negate the claim?
+5. Contradiction type (if CONTRADICTS): DIRECT_NEGATION, TEMPORAL_MISMATCH,
+   QUANTITATIVE_MISMATCH, OUTDATED_EVIDENCE or PARTIAL_OVERLAP
+
+Respond with JSON containing exactly one judgment per passage, in passage order:
+{{
+  "judgments": [
+    {{
+      "index": 1,
+      "label": "SUPPORTS|WEAK_SUPPORT|CONTRADICTS|IRRELEVANT",
+      "confidence": 0.0-1.0,
+      "explanation": "Brief explanation of why this label",
+      "temporal_match": true/false,
+      "semantic_score": 0.0-1.0,
+      "logical_score": 0.0-1.0,
+      "negation_detected": true/false,
+      "contradiction_type": "{contradiction_types}",
+      "claim_date": "extracted date from claim or null",
+      "evidence_date": "extracted date from evidence or null"
+    }}
+  ]
+}}"""
+
+BATCH_ALIGNMENT_PROMPT_VERSION = hashlib.sha256(BATCH_ALIGNMENT_PROMPT.encode()).hexdigest()[:12]
+
+BATCH_ALIGNMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "judgments": {
+            "type": "array",
+            "items": {
+                **ALIGNMENT_SCHEMA,
+                "properties": {"index": {"type": "integer"}, **ALIGNMENT_SCHEMA["properties"]},
+                "required": ["index", *ALIGNMENT_SCHEMA["required"]],
+            },
+        }
+    },
+    "required": ["judgments"],
+}
+
+
+class HeuristicAlignmentEvaluator(AlignmentEvaluator):
+    """
+    Rule-only alignment: no LLM calls.
+
+    Labels come from the retrieval similarity, claim/evidence keyword
+    overlap, negation mismatches and temporal markers. LLMAlignmentEvaluator
+    falls back to the same rules when a call fails.
+    """
+
+    def __init__(self) -> None:
         self._negation_regex = re.compile("|".join(NEGATION_PATTERNS), re.IGNORECASE)
 
     def _extract_temporal_markers(self, text: str) -> list[str]:
@@ -139,52 +222,10 @@ class LLMAlignmentEvaluator(AlignmentEvaluator):
         # Check if any claim markers appear in evidence
         return bool(claim_markers & evidence_markers)
 
-    def evaluate_single(self, claim: Claim, evidence: EvidenceChunk) -> AlignmentResult:
-        """Evaluate alignment for a single claim-evidence pair."""
-        prompt = ALIGNMENT_PROMPT.format(claim=claim.text, evidence=evidence.text)
-
-        # Rule-based pre-checks
-        claim_has_negation = self._detect_negation(claim.text)
-        evidence_has_negation = self._detect_negation(evidence.text)
-
-        try:
-            result = self.llm.complete_json(prompt, ALIGNMENT_SCHEMA)
-        except Exception as e:
-            # Fallback to heuristic evaluation
-            return self._heuristic_evaluate(claim, evidence, str(e))
-
-        # Parse contradiction type
-        contradiction_type_str = result.get("contradiction_type", "NONE")
-        try:
-            contradiction_type = ContradictionType(contradiction_type_str)
-        except ValueError:
-            contradiction_type = ContradictionType.NONE
-
-        # If LLM says CONTRADICTS but didn't specify type, use rule-based detection
-        if result["label"] == "CONTRADICTS" and contradiction_type == ContradictionType.NONE:
-            contradiction_type = self._detect_contradiction_type(
-                claim.text, evidence.text, claim_has_negation, evidence_has_negation
-            )
-
-        return AlignmentResult(
-            claim_id=claim.id,
-            evidence_id=evidence.id,
-            label=AlignmentLabel(result["label"]),
-            confidence=result["confidence"],
-            explanation=result["explanation"],
-            temporal_match=result["temporal_match"],
-            semantic_score=result["semantic_score"],
-            logical_score=result["logical_score"],
-            contradiction_type=contradiction_type,
-            negation_detected=result.get("negation_detected", claim_has_negation != evidence_has_negation),
-            claim_date=result.get("claim_date"),
-            evidence_date=result.get("evidence_date"),
-        )
-
     def _heuristic_evaluate(
         self, claim: Claim, evidence: EvidenceChunk, error: str = ""
     ) -> AlignmentResult:
-        """Fallback heuristic evaluation when LLM fails."""
+        """Judge a pair from similarity, keyword overlap, negation and temporal markers."""
         # Use similarity score as base
         semantic_score = evidence.similarity_score
         temporal_match = self._quick_temporal_check(claim.text, evidence.text)
@@ -210,11 +251,11 @@ class LLMAlignmentEvaluator(AlignmentEvaluator):
         else:
             contradiction_type = ContradictionType.NONE
             avg_score = (semantic_score + logical_score) / 2
-            if avg_score > 0.7:
+            if avg_score > HEURISTIC_SUPPORT_SCORE:
                 label = AlignmentLabel.SUPPORTS
             elif avg_score > 0.4:
                 label = AlignmentLabel.WEAK_SUPPORT
-            elif avg_score < 0.2:
+            elif avg_score < HEURISTIC_IRRELEVANT_SCORE:
                 label = AlignmentLabel.IRRELEVANT
             else:
                 label = AlignmentLabel.WEAK_SUPPORT
@@ -224,7 +265,12 @@ class LLMAlignmentEvaluator(AlignmentEvaluator):
             evidence_id=evidence.id,
             label=label,
             confidence=0.5,  # Low confidence for heuristic
-            explanation=f"Heuristic evaluation (LLM unavailable: {error[:50]})",
+            explanation=(
+                f"Heuristic evaluation (LLM unavailable: {error[:50]})"
+                if error
+                else f"Heuristic evaluation (similarity {semantic_score:.2f}, "
+                f"keyword overlap {overlap:.2f})"
+            ),
             temporal_match=temporal_match,
             semantic_score=semantic_score,
             logical_score=logical_score,
@@ -232,9 +278,400 @@ class LLMAlignmentEvaluator(AlignmentEvaluator):
             negation_detected=negation_mismatch,
         )
 
+    def evaluate_single(self, claim: Claim, evidence: EvidenceChunk) -> AlignmentResult:
+        """Evaluate alignment for a single claim-evidence pair."""
+        return self._heuristic_evaluate(claim, evidence)
+
+    def evaluate(self, claim: Claim, evidence: list[EvidenceChunk]) -> list[AlignmentResult]:
+        """Evaluate alignment between a claim and all evidence chunks."""
+        return [self._heuristic_evaluate(claim, e) for e in evidence]
+
+    async def aevaluate(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> list[AlignmentResult]:
+        """Rules are CPU-cheap, so run them inline instead of on a worker thread."""
+        return self.evaluate(claim, evidence)
+
+
+class LLMAlignmentEvaluator(HeuristicAlignmentEvaluator):
+    """Evaluates claim-evidence alignment using an LLM."""
+
+    def __init__(
+        self,
+        llm_provider: Any,
+        cache: PersistentCache | None = None,
+        batch_evidence: bool = False,
+    ):
+        super().__init__()
+        self.llm = llm_provider
+        self.cache = cache
+        # Judge all of a claim's evidence chunks in one prompt instead of one call each
+        self.batch_evidence = batch_evidence
+
+    def _cache_key(
+        self, claim: Claim, evidence: EvidenceChunk, version: str = ALIGNMENT_PROMPT_VERSION
+    ) -> str:
+        """Content address for a judgment: model, prompt version, claim and evidence text."""
+        model = getattr(getattr(self.llm, "config", None), "model", type(self.llm).__name__)
+        content = "\x1f".join([model, version, claim.text, evidence.text])
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _cached(
+        self, claim: Claim, evidence: EvidenceChunk, version: str = ALIGNMENT_PROMPT_VERSION
+    ) -> AlignmentResult | None:
+        """Look up a previous judgment and re-key it to this claim/evidence pair."""
+        if self.cache is None:
+            return None
+        fields = self.cache.get(self._cache_key(claim, evidence, version))
+        if fields is None:
+            return None
+        return AlignmentResult(claim_id=claim.id, evidence_id=evidence.id, **fields)
+
+    def _store(
+        self,
+        claim: Claim,
+        evidence: EvidenceChunk,
+        result: AlignmentResult,
+        version: str = ALIGNMENT_PROMPT_VERSION,
+    ) -> None:
+        if self.cache is not None:
+            fields = result.model_dump(mode="json", exclude={"claim_id", "evidence_id"})
+            self.cache.put(self._cache_key(claim, evidence, version), fields)
+
+    def evaluate_single(self, claim: Claim, evidence: EvidenceChunk) -> AlignmentResult:
+        """Evaluate alignment for a single claim-evidence pair."""
+        if cached := self._cached(claim, evidence):
+            return cached
+
+        prompt = ALIGNMENT_PROMPT.format(claim=claim.text, evidence=evidence.text)
+
+        try:
+            result = self.llm.complete_json(prompt, ALIGNMENT_SCHEMA)
+        except Exception as e:
+            # Fallback to heuristic evaluation (not cached, so the LLM is retried next time)
+            return self._heuristic_evaluate(claim, evidence, str(e))
+
+        alignment = self._parse_alignment(claim, evidence, result)
+        self._store(claim, evidence, alignment)
+        return alignment
+
+    async def aevaluate_single(self, claim: Claim, evidence: EvidenceChunk) -> AlignmentResult:
+        """Async evaluate_single; uses the provider's native async API when it has one."""
+        if cached := self._cached(claim, evidence):
+            return cached
+
+        prompt = ALIGNMENT_PROMPT.format(claim=claim.text, evidence=evidence.text)
+
+        try:
+            if isinstance(self.llm, AsyncLLMProvider):
+                result = await self.llm.acomplete_json(prompt, ALIGNMENT_SCHEMA)
+            else:
+                result = await asyncio.to_thread(self.llm.complete_json, prompt, ALIGNMENT_SCHEMA)
+        except Exception as e:
+            return self._heuristic_evaluate(claim, evidence, str(e))
+
+        alignment = self._parse_alignment(claim, evidence, result)
+        self._store(claim, evidence, alignment)
+        return alignment
+
+    def _parse_alignment(
+        self, claim: Claim, evidence: EvidenceChunk, result: dict
+    ) -> AlignmentResult:
+        """Convert an LLM judgment into an AlignmentResult, filling gaps with rules."""
+        # Rule-based pre-checks
+        claim_has_negation = self._detect_negation(claim.text)
+        evidence_has_negation = self._detect_negation(evidence.text)
+
+        # Parse contradiction type
+        contradiction_type_str = result.get("contradiction_type", "NONE")
+        try:
+            contradiction_type = ContradictionType(contradiction_type_str)
+        except ValueError:
+            contradiction_type = ContradictionType.NONE
+
+        # If LLM says CONTRADICTS but didn't specify type, use rule-based detection
+        if result["label"] == "CONTRADICTS" and contradiction_type == ContradictionType.NONE:
+            contradiction_type = self._detect_contradiction_type(
+                claim.text, evidence.text, claim_has_negation, evidence_has_negation
+            )
+
+        return AlignmentResult(
+            claim_id=claim.id,
+            evidence_id=evidence.id,
+            label=AlignmentLabel(result["label"]),
+            confidence=result["confidence"],
+            explanation=result["explanation"],
+            temporal_match=result["temporal_match"],
+            semantic_score=result["semantic_score"],
+            logical_score=result["logical_score"],
+            contradiction_type=contradiction_type,
+            negation_detected=result.get("negation_detected", claim_has_negation != evidence_has_negation),
+            claim_date=result.get("claim_date"),
+            evidence_date=result.get("evidence_date"),
+        )
+
     def evaluate(self, claim: Claim, evidence: list[EvidenceChunk]) -> list[AlignmentResult]:
         """Evaluate alignment between a claim and all evidence chunks."""
         if not evidence:
             return []
 
+        if self.batch_evidence and len(evidence) > 1:
+            return self._evaluate_batch(claim, evidence)
+
         return [self.evaluate_single(claim, e) for e in evidence]
+
+    async def aevaluate(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> list[AlignmentResult]:
+        """Evaluate all evidence chunks concurrently on the running event loop."""
+        if not evidence:
+            return []
+
+        if self.batch_evidence and len(evidence) > 1:
+            return await self._aevaluate_batch(claim, evidence)
+
+        return list(await asyncio.gather(*(self.aevaluate_single(claim, e) for e in evidence)))
+
+    def _batch_prompt(self, claim: Claim, evidence: list[EvidenceChunk]) -> str:
+        evidence_list = "\n\n".join(
+            f'EVIDENCE [{i}]: "{e.text}"' for i, e in enumerate(evidence, start=1)
+        )
+        return BATCH_ALIGNMENT_PROMPT.format(
+            claim=claim.text,
+            evidence_list=evidence_list,
+            contradiction_types="|".join(t.value for t in ContradictionType),
+        )
+
+    def _evaluate_batch(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> list[AlignmentResult]:
+        """One LLM call for every uncached chunk of a claim."""
+        results = {e.id: self._cached(claim, e, BATCH_ALIGNMENT_PROMPT_VERSION) for e in evidence}
+        pending = [e for e in evidence if results[e.id] is None]
+
+        if pending:
+            try:
+                response = self.llm.complete_json(
+                    self._batch_prompt(claim, pending), BATCH_ALIGNMENT_SCHEMA
+                )
+            except Exception as e:
+                response = {"error": str(e)}
+            results.update(self._parse_batch(claim, pending, response))
+
+        return [results[e.id] for e in evidence]
+
+    async def _aevaluate_batch(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> list[AlignmentResult]:
+        """Async _evaluate_batch."""
+        results = {e.id: self._cached(claim, e, BATCH_ALIGNMENT_PROMPT_VERSION) for e in evidence}
+        pending = [e for e in evidence if results[e.id] is None]
+
+        if pending:
+            prompt = self._batch_prompt(claim, pending)
+            try:
+                if isinstance(self.llm, AsyncLLMProvider):
+                    response = await self.llm.acomplete_json(prompt, BATCH_ALIGNMENT_SCHEMA)
+                else:
+                    response = await asyncio.to_thread(
+                        self.llm.complete_json, prompt, BATCH_ALIGNMENT_SCHEMA
+                    )
+            except Exception as e:
+                response = {"error": str(e)}
+            results.update(self._parse_batch(claim, pending, response))
+
+        return [results[e.id] for e in evidence]
+
+    def _parse_batch(
+        self, claim: Claim, evidence: list[EvidenceChunk], response: dict
+    ) -> dict[str, AlignmentResult]:
+        """Match judgments to chunks by index; malformed or missing items fall back per item."""
+        judgments = response.get("judgments") if isinstance(response, dict) else None
+        if not isinstance(judgments, list):
+            judgments = []
+        error = ""
+        if isinstance(response, dict):
+            error = response.get("error", "malformed batch response")
+
+        by_index: dict[int, dict] = {}
+        for position, item in enumerate(judgments, start=1):
+            if isinstance(item, dict):
+                index = item.get("index", position)
+                by_index.setdefault(index if isinstance(index, int) else position, item)
+
+        results = {}
+        for i, chunk in enumerate(evidence, start=1):
+            item = by_index.get(i)
+            try:
+                if item is None:
+                    raise ValueError(f"no judgment for evidence {i}")
+                alignment = self._parse_alignment(claim, chunk, item)
+            except (KeyError, TypeError, ValueError) as e:
+                results[chunk.id] = self._heuristic_evaluate(claim, chunk, f"{error}; {e}")
+                continue
+            self._store(claim, chunk, alignment, BATCH_ALIGNMENT_PROMPT_VERSION)
+            results[chunk.id] = alignment
+        return results
+
+
+class CascadeStats:
+    """Pairs settled and seconds spent per cascade tier; safe to record from many threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pairs = {"rules": 0, "llm": 0}
+        self._seconds = {"rules": 0.0, "llm": 0.0}
+
+    def record(self, tier: str, pairs: int, seconds: float) -> None:
+        with self._lock:
+            self._pairs[tier] += pairs
+            self._seconds[tier] += seconds
+
+    def summary(self) -> dict:
+        """Pairs settled per tier, escalation rate and mean latency per pair in each tier."""
+        with self._lock:
+            pairs = dict(self._pairs)
+            seconds = dict(self._seconds)
+        total = pairs["rules"] + pairs["llm"]
+        return {
+            "pairs": total,
+            "settled_by_rules": pairs["rules"],
+            "escalated": pairs["llm"],
+            "escalation_rate": pairs["llm"] / total if total else 0.0,
+            "rules_seconds": seconds["rules"],
+            "llm_seconds": seconds["llm"],
+            "rules_ms_per_pair": 1000 * seconds["rules"] / total if total else 0.0,
+            "llm_ms_per_pair": 1000 * seconds["llm"] / pairs["llm"] if pairs["llm"] else 0.0,
+        }
+
+
+# Stats of the innermost CascadeAlignmentEvaluator.track() block, if any
+_tracked_stats: ContextVar[CascadeStats | None] = ContextVar("cascade_stats", default=None)
+
+
+class CascadeAlignmentEvaluator(AlignmentEvaluator):
+    """
+    Two-tier alignment: rules settle clear-cut pairs, the LLM judges the rest.
+
+    A pair is settled by rules when its evidence scores below the retrieval
+    similarity threshold (IRRELEVANT), is a near-duplicate of the claim
+    (SUPPORTS), or has a heuristic score at least `escalation_band` away from
+    the nearest label boundary. Negation or temporal mismatches always
+    escalate, since those are where the rules are least reliable. Escalated
+    pairs go through the wrapped evaluator, including its cache and evidence
+    batching. `stats()` reports the escalation rate and time spent per tier
+    since construction; `track()` counts the same for one block of work.
+    """
+
+    def __init__(
+        self,
+        llm_evaluator: LLMAlignmentEvaluator,
+        similarity_threshold: float = 0.3,
+        escalation_band: float = 0.15,
+        near_duplicate_similarity: float = 0.95,
+    ):
+        self.llm_evaluator = llm_evaluator
+        self.similarity_threshold = similarity_threshold
+        self.escalation_band = escalation_band
+        self.near_duplicate_similarity = near_duplicate_similarity
+        self._totals = CascadeStats()
+
+    def _settle(self, claim: Claim, evidence: EvidenceChunk) -> AlignmentResult | None:
+        """The rule-based judgment if the pair is clear-cut, else None to escalate."""
+        result = self.llm_evaluator._heuristic_evaluate(claim, evidence)
+        similarity = evidence.similarity_score
+
+        if similarity < self.similarity_threshold:
+            return result.model_copy(update={
+                "label": AlignmentLabel.IRRELEVANT,
+                "confidence": 1.0 - similarity,
+                "explanation": f"Similarity {similarity:.2f} is below the retrieval threshold",
+            })
+        if result.negation_detected or not result.temporal_match:
+            return None
+        if similarity >= self.near_duplicate_similarity:
+            return result.model_copy(update={
+                "label": AlignmentLabel.SUPPORTS,
+                "confidence": similarity,
+                "explanation": f"Near-duplicate evidence (similarity {similarity:.2f})",
+            })
+
+        score = (result.semantic_score + result.logical_score) / 2
+        margin = min(abs(score - HEURISTIC_SUPPORT_SCORE), abs(score - HEURISTIC_IRRELEVANT_SCORE))
+        if margin < self.escalation_band:
+            return None
+        # Confidence grows with the distance from the nearest label boundary
+        return result.model_copy(update={"confidence": min(0.5 + margin, 1.0)})
+
+    def _triage(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> tuple[list[AlignmentResult | None], list[EvidenceChunk]]:
+        started = time.perf_counter()
+        settled = [self._settle(claim, e) for e in evidence]
+        self._record("rules", sum(r is not None for r in settled), time.perf_counter() - started)
+        return settled, [e for e, r in zip(evidence, settled) if r is None]
+
+    def _record(self, tier: str, pairs: int, seconds: float) -> None:
+        self._totals.record(tier, pairs, seconds)
+        tracked = _tracked_stats.get()
+        if tracked is not None:
+            tracked.record(tier, pairs, seconds)
+
+    @contextmanager
+    def track(self) -> Iterator[CascadeStats]:
+        """
+        Count the pairs evaluated inside the block, apart from concurrent work.
+
+        Counting follows the current context, so it covers asyncio tasks and
+        to_thread calls started in the block, and pool threads that run
+        under a copy of it (contextvars.copy_context), but not other callers.
+        """
+        stats = CascadeStats()
+        token = _tracked_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            _tracked_stats.reset(token)
+
+    @staticmethod
+    def _merge(
+        settled: list[AlignmentResult | None], judged: list[AlignmentResult]
+    ) -> list[AlignmentResult]:
+        escalated = iter(judged)
+        return [result if result is not None else next(escalated) for result in settled]
+
+    def evaluate(self, claim: Claim, evidence: list[EvidenceChunk]) -> list[AlignmentResult]:
+        """Settle clear-cut pairs with rules and send the rest to the LLM in one evaluate call."""
+        if not evidence:
+            return []
+
+        settled, pending = self._triage(claim, evidence)
+        judged: list[AlignmentResult] = []
+        if pending:
+            started = time.perf_counter()
+            judged = self.llm_evaluator.evaluate(claim, pending)
+            self._record("llm", len(pending), time.perf_counter() - started)
+        return self._merge(settled, judged)
+
+    async def aevaluate(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> list[AlignmentResult]:
+        """Async evaluate; escalated pairs use the wrapped evaluator's async path."""
+        if not evidence:
+            return []
+
+        settled, pending = self._triage(claim, evidence)
+        judged: list[AlignmentResult] = []
+        if pending:
+            started = time.perf_counter()
+            judged = await self.llm_evaluator.aevaluate(claim, pending)
+            self._record("llm", len(pending), time.perf_counter() - started)
+        return self._merge(settled, judged)
+
+    def evaluate_single(self, claim: Claim, evidence: EvidenceChunk) -> AlignmentResult:
+        """Evaluate alignment for a single claim-evidence pair."""
+        return self.evaluate(claim, [evidence])[0]
+
+    def stats(self) -> dict:
+        """Cumulative CascadeStats summary over every evaluation since construction."""
+        return self._totals.summary()
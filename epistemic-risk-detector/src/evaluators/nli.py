@@ -0,0 +1,157 @@
+"""Local alignment evaluation with a cross-encoder NLI model."""
+
+import asyncio
+import threading
+from typing import Any
+
+import numpy as np
+
+from src.core.schemas import (
+    AlignmentLabel,
+    AlignmentResult,
+    Claim,
+    ContradictionType,
+    EvidenceChunk,
+)
+from src.evaluators.alignment import HeuristicAlignmentEvaluator
+
+NLI_CLASSES = ("contradiction", "entailment", "neutral")
+
+# Output order of the sentence-transformers cross-encoder/nli-* models, used when the
+# model config doesn't name its labels
+DEFAULT_NLI_LABEL_ORDER = {"contradiction": 0, "entailment": 1, "neutral": 2}
+
+
+class NLIAlignmentEvaluator(HeuristicAlignmentEvaluator):
+    """
+    Judges alignment with a local cross-encoder NLI model; no network calls.
+
+    Each pair is scored with the evidence as premise and the claim as
+    hypothesis. Entailment maps to SUPPORTS and contradiction to CONTRADICTS.
+    Neutral pairs become WEAK_SUPPORT when the entailment probability reaches
+    `weak_support_threshold`, else IRRELEVANT. Contradiction types, negation
+    and temporal checks come from the same rules as the heuristic evaluator.
+
+    `evaluate_many` sends every claim x evidence pair to the model in one
+    predict call, so a response's claims share one batched forward pass. The
+    model is loaded on first use.
+    """
+
+    batches_claims = True
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/nli-deberta-v3-xsmall",
+        batch_size: int = 128,
+        weak_support_threshold: float = 0.25,
+        device: str | None = None,
+    ):
+        super().__init__()
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.weak_support_threshold = weak_support_threshold
+        self.device = device
+        self._model: Any = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self) -> Any:
+        """Lazy-load the cross-encoder; one instance serves every thread."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import CrossEncoder
+
+                    self._model = CrossEncoder(self.model_name, device=self.device)
+        return self._model
+
+    def warm_up(self) -> None:
+        """Load the model ahead of the first request."""
+        self.model
+
+    def _label_index(self) -> dict[str, int]:
+        """Output column of each NLI class, from the model's id2label when it names them."""
+        config = getattr(getattr(self.model, "model", None), "config", None)
+        id2label = getattr(config, "id2label", None) or {}
+        columns = {str(label).lower(): int(i) for i, label in id2label.items()}
+        if all(name in columns for name in NLI_CLASSES):
+            return {name: columns[name] for name in NLI_CLASSES}
+        return dict(DEFAULT_NLI_LABEL_ORDER)
+
+    def evaluate_many(
+        self, claims: list[Claim], evidence_by_claim: list[list[EvidenceChunk]]
+    ) -> list[list[AlignmentResult]]:
+        """Score every claim x evidence pair in one batched predict call."""
+        pairs = [
+            (chunk.text, claim.text)
+            for claim, evidence in zip(claims, evidence_by_claim)
+            for chunk in evidence
+        ]
+        if not pairs:
+            return [[] for _ in claims]
+
+        probabilities = np.asarray(
+            self.model.predict(
+                pairs, batch_size=self.batch_size, apply_softmax=True, show_progress_bar=False
+            ),
+            dtype=np.float32,
+        ).reshape(len(pairs), -1)
+        columns = self._label_index()
+
+        rows = iter(probabilities)
+        return [
+            [self._to_alignment(claim, chunk, next(rows), columns) for chunk in evidence]
+            for claim, evidence in zip(claims, evidence_by_claim)
+        ]
+
+    def _to_alignment(
+        self, claim: Claim, evidence: EvidenceChunk, probs: np.ndarray, columns: dict[str, int]
+    ) -> AlignmentResult:
+        entailment, neutral, contradiction = (
+            float(probs[columns[name]]) for name in ("entailment", "neutral", "contradiction")
+        )
+        claim_has_negation = self._detect_negation(claim.text)
+        evidence_has_negation = self._detect_negation(evidence.text)
+
+        contradiction_type = ContradictionType.NONE
+        if contradiction >= max(entailment, neutral):
+            label, confidence = AlignmentLabel.CONTRADICTS, contradiction
+            contradiction_type = self._detect_contradiction_type(
+                claim.text, evidence.text, claim_has_negation, evidence_has_negation
+            )
+        elif entailment >= neutral:
+            label, confidence = AlignmentLabel.SUPPORTS, entailment
+        elif entailment >= self.weak_support_threshold:
+            label, confidence = AlignmentLabel.WEAK_SUPPORT, neutral
+        else:
+            label, confidence = AlignmentLabel.IRRELEVANT, neutral
+
+        return AlignmentResult(
+            claim_id=claim.id,
+            evidence_id=evidence.id,
+            label=label,
+            confidence=min(max(confidence, 0.0), 1.0),
+            explanation=(
+                f"NLI ({self.model_name}): entailment {entailment:.2f}, "
+                f"neutral {neutral:.2f}, contradiction {contradiction:.2f}"
+            ),
+            temporal_match=self._quick_temporal_check(claim.text, evidence.text),
+            semantic_score=evidence.similarity_score,
+            logical_score=min(max(entailment, 0.0), 1.0),
+            contradiction_type=contradiction_type,
+            negation_detected=claim_has_negation != evidence_has_negation,
+        )
+
+    def evaluate(self, claim: Claim, evidence: list[EvidenceChunk]) -> list[AlignmentResult]:
+        """Evaluate alignment between a claim and all evidence chunks in one forward pass."""
+        return self.evaluate_many([claim], [evidence])[0]
+
+    def evaluate_single(self, claim: Claim, evidence: EvidenceChunk) -> AlignmentResult:
+        """Evaluate alignment for a single claim-evidence pair."""
+        return self.evaluate(claim, [evidence])[0]
+
+    async def aevaluate(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> list[AlignmentResult]:
+        """Run inference on a worker thread so the event loop stays responsive."""
+        return await asyncio.to_thread(self.evaluate, claim, evidence)
@@ -1,5 +1,5 @@
 """Claim extraction module."""
 
-from src.extractors.claim_extractor import LLMClaimExtractor
+from src.extractors.claim_extractor import LLMClaimExtractor, RuleBasedClaimExtractor
 
-__all__ = ["LLMClaimExtractor"]
+__all__ = ["LLMClaimExtractor", "RuleBasedClaimExtractor"]
@@ -1,11 +1,13 @@
 """Claim extraction from LLM responses using deterministic prompting."""
 
+import asyncio
 import hashlib
 import re
+import unicodedata
 from typing import Any
 
 from src.core.config import ExtractionConfig
-from src.core.interfaces import ClaimExtractor
+from src.core.interfaces import AsyncLLMProvider, ClaimExtractor, ResultCache
 from src.core.schemas import Claim, ClaimType
 
 # Hedging patterns that indicate uncertainty
@@ -44,6 +46,27 @@ QUANTITATIVE_PATTERNS = [
     r"\b(?:approximately|about|around|roughly)\s*\d+\b",
 ]
 
+# First-person framing marks an opinion rather than a checkable claim
+OPINION_PATTERNS = [
+    r"\b(?:I think|I believe|I feel|I guess|in my opinion|in my view|personally)\b",
+]
+
+# Sentence ends: terminal punctuation followed by whitespace, or a line break
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?;])\s+|\s*\n\s*")
+
+# Words whose trailing period does not end a sentence
+ABBREVIATIONS = frozenset({
+    "e.g", "i.e", "etc", "vs", "cf", "approx", "al", "fig", "no",
+    "dr", "mr", "mrs", "ms", "prof", "jr", "sr", "st", "inc", "ltd", "co", "corp",
+})
+
+# List markers stripped from the start of a sentence
+LIST_MARKER = re.compile(r"^(?:[-*\u2022]|\d+[.)])\s+")
+
+# Sentence-level extraction can't judge atomicity or factuality as well as an LLM
+RULE_CLAIM_CONFIDENCE = 0.9
+RULE_EXTRACTION_CONFIDENCE = 0.7
+
 EXTRACTION_PROMPT = """You are a precise claim extractor. Your task is to decompose the following text into atomic, falsifiable claims.
 
 Rules:
@@ -84,6 +107,9 @@ Example output:
   ]
 }}"""
 
+# Part of every cache key, so editing the prompt invalidates cached extractions
+EXTRACTION_PROMPT_VERSION = hashlib.sha256(EXTRACTION_PROMPT.encode()).hexdigest()[:12]
+
 EXTRACTION_SCHEMA = {
     "type": "object",
     "properties": {
@@ -108,12 +134,10 @@ EXTRACTION_SCHEMA = {
 }
 
 
-class LLMClaimExtractor(ClaimExtractor):
-    """Extracts claims using an LLM with deterministic prompting."""
+class _ClaimTypeRules:
+    """Rule-based claim typing and hedging detection shared by the extractors."""
 
-    def __init__(self, llm_provider: Any, config: ExtractionConfig | None = None):
-        self.llm = llm_provider
-        self.config = config or ExtractionConfig()
+    def __init__(self) -> None:
         self._hedging_regex = re.compile("|".join(HEDGING_PATTERNS), re.IGNORECASE)
         self._multi_hop_regex = re.compile("|".join(MULTI_HOP_PATTERNS), re.IGNORECASE)
         self._temporal_regex = re.compile("|".join(TEMPORAL_PATTERNS), re.IGNORECASE)
@@ -144,35 +168,92 @@ class LLMClaimExtractor(ClaimExtractor):
         """Check if text contains hedging language."""
         return bool(self._hedging_regex.search(text))
 
-    def _generate_claim_id(self, text: str, start: int) -> str:
-        """Generate deterministic ID for a claim."""
-        content = f"{text}:{start}"
-        return hashlib.sha256(content.encode()).hexdigest()[:12]
+
+class LLMClaimExtractor(_ClaimTypeRules, ClaimExtractor):
+    """Extracts claims using an LLM with deterministic prompting."""
+
+    def __init__(
+        self,
+        llm_provider: Any,
+        config: ExtractionConfig | None = None,
+        cache: ResultCache | None = None,
+    ):
+        super().__init__()
+        self.llm = llm_provider
+        self.config = config or ExtractionConfig()
+        self.cache = cache
+
+    def _cache_key(self, text: str) -> str:
+        """Key on normalized text, prompt version, model and output-affecting config."""
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        model = getattr(getattr(self.llm, "config", None), "model", type(self.llm).__name__)
+        content = "\x1f".join([
+            model,
+            EXTRACTION_PROMPT_VERSION,
+            str(self.config.max_claims),
+            str(self.config.min_claim_length),
+            str(self.config.include_opinions),
+            normalized,
+        ])
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _from_cache(self, text: str) -> tuple[list[Claim], dict] | None:
+        """Return cached claims for text, re-anchoring spans if only whitespace differs."""
+        if self.cache is None:
+            return None
+        entry = self.cache.get(self._cache_key(text))
+        if entry is None:
+            return None
+
+        claims = [Claim(**c) for c in entry["claims"]]
+        if entry["text"] != text:
+            spans = [self._locate_span(c.text, text) for c in claims]
+            # Old offsets mean nothing in the new text; re-extract rather than guess
+            if any(span is None or span[0] > span[1] for span in spans):
+                return None
+            claims = [
+                c.model_copy(update={
+                    "source_span": span,
+                    "id": self._generate_claim_id(c.text, span[0]),
+                })
+                for c, span in zip(claims, spans)
+            ]
+        return claims, {**entry["metadata"], "cache_hit": True}
+
+    def _to_cache(self, text: str, claims: list[Claim], metadata: dict) -> None:
+        if self.cache is not None:
+            self.cache.put(self._cache_key(text), {
+                "text": text,
+                "claims": [c.model_dump(mode="json") for c in claims],
+                "metadata": metadata,
+            })
+
+    def _locate_span(self, text: str, original_text: str) -> tuple[int, int] | None:
+        """Find a claim's span in the original text, or None if it can't be found."""
+        # Try to find the claim text in the original
+        found_start = original_text.lower().find(text.lower())
+        if found_start >= 0:
+            return found_start, found_start + len(text)
+
+        # Fuzzy match - find best substring match
+        words = text.split()[:5]  # First 5 words
+        pattern = r"\b" + r"\s+".join(re.escape(w) for w in words)
+        match = re.search(pattern, original_text, re.IGNORECASE)
+        if not match:
+            return None
+        start = match.start()
+        # Find end of sentence
+        end_match = re.search(r"[.!?]", original_text[start:])
+        end = start + (end_match.end() if end_match else len(text))
+        return start, min(end, len(original_text))
 
     def _validate_spans(self, claims_data: list[dict], original_text: str) -> list[dict]:
         """Validate and fix claim spans against original text."""
         validated = []
         for claim in claims_data:
             text = claim["text"]
-            start = claim.get("start", 0)
-            end = claim.get("end", len(text))
-
-            # Try to find the claim text in the original
-            found_start = original_text.lower().find(text.lower())
-            if found_start >= 0:
-                start = found_start
-                end = found_start + len(text)
-            else:
-                # Fuzzy match - find best substring match
-                words = text.split()[:5]  # First 5 words
-                pattern = r"\b" + r"\s+".join(re.escape(w) for w in words)
-                match = re.search(pattern, original_text, re.IGNORECASE)
-                if match:
-                    start = match.start()
-                    # Find end of sentence
-                    end_match = re.search(r"[.!?]", original_text[start:])
-                    end = start + (end_match.end() if end_match else len(text))
-
+            span = self._locate_span(text, original_text)
+            start, end = span or (claim.get("start", 0), claim.get("end", len(text)))
             validated.append({**claim, "start": start, "end": min(end, len(original_text))})
 
         return validated
@@ -187,6 +268,9 @@ class LLMClaimExtractor(ClaimExtractor):
         if not text.strip():
             return [], {"error": "Empty input text"}
 
+        if cached := self._from_cache(text):
+            return cached
+
         prompt = EXTRACTION_PROMPT.format(text=text)
 
         # Retry logic for robustness
@@ -201,6 +285,43 @@ class LLMClaimExtractor(ClaimExtractor):
         else:
             return [], {"error": f"Extraction failed after {self.config.max_retries} attempts: {last_error}"}
 
+        claims, metadata = self._build_claims(text, result)
+        self._to_cache(text, claims, metadata)
+        return claims, metadata
+
+    async def aextract_with_confidence(self, text: str) -> tuple[list[Claim], dict]:
+        """Async extract_with_confidence; uses the provider's native async API when it has one."""
+        if not text.strip():
+            return [], {"error": "Empty input text"}
+
+        if cached := self._from_cache(text):
+            return cached
+
+        prompt = EXTRACTION_PROMPT.format(text=text)
+
+        last_error = None
+        for attempt in range(self.config.max_retries):
+            try:
+                if isinstance(self.llm, AsyncLLMProvider):
+                    result = await self.llm.acomplete_json(prompt, EXTRACTION_SCHEMA)
+                else:
+                    result = await asyncio.to_thread(
+                        self.llm.complete_json, prompt, EXTRACTION_SCHEMA
+                    )
+                break
+            except Exception as e:
+                last_error = e
+                continue
+        else:
+            error = f"Extraction failed after {self.config.max_retries} attempts: {last_error}"
+            return [], {"error": error}
+
+        claims, metadata = self._build_claims(text, result)
+        self._to_cache(text, claims, metadata)
+        return claims, metadata
+
+    def _build_claims(self, text: str, result: dict) -> tuple[list[Claim], dict]:
+        """Turn a raw extraction response into validated, filtered Claim objects."""
         claims_data = result.get("claims", [])
 
         # Validate spans
@@ -256,3 +377,103 @@ class LLMClaimExtractor(ClaimExtractor):
         }
 
         return claims, metadata
+
+
+class RuleBasedClaimExtractor(_ClaimTypeRules, ClaimExtractor):
+    """
+    Extracts one claim per sentence with regular expressions; no LLM calls.
+
+    Meant for first-pass screening where latency matters more than
+    atomicity: compound sentences stay one claim, questions are dropped and
+    first-person opinions are filtered unless `include_opinions` is set.
+    Claim types and hedging use the same rules as LLMClaimExtractor.
+    """
+
+    def __init__(self, config: ExtractionConfig | None = None):
+        super().__init__()
+        self.config = config or ExtractionConfig()
+        self._opinion_regex = re.compile("|".join(OPINION_PATTERNS), re.IGNORECASE)
+
+    def _split_sentences(self, text: str) -> list[tuple[int, int]]:
+        """Character spans of the sentences in text, skipping abbreviation periods."""
+        spans = []
+        start = 0
+        for boundary in SENTENCE_BOUNDARY.finditer(text):
+            end = boundary.start()
+            if "\n" not in boundary.group() and self._ends_with_abbreviation(text[start:end]):
+                continue
+            spans.append((start, end))
+            start = boundary.end()
+        spans.append((start, len(text)))
+        return spans
+
+    @staticmethod
+    def _ends_with_abbreviation(sentence: str) -> bool:
+        if not sentence.endswith("."):
+            return False
+        words = sentence[:-1].split()
+        if not words:
+            return False
+        word = words[-1].lower().lstrip("(\"'")
+        if len(words) == 1 and word.isdigit():
+            return True  # Numbered list marker ("1. Django ...")
+        # Single letters are initials ("Guido v. Rossum", "J. Smith")
+        return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+    def extract(self, text: str) -> list[Claim]:
+        """Extract claims from text."""
+        claims, _ = self.extract_with_confidence(text)
+        return claims
+
+    def extract_with_confidence(self, text: str) -> tuple[list[Claim], dict]:
+        """Extract one claim per factual sentence, with the same metadata as LLM extraction."""
+        if not text.strip():
+            return [], {"error": "Empty input text"}
+
+        sentences = 0
+        opinions = 0
+        claims: list[Claim] = []
+        for start, end in self._split_sentences(text):
+            sentence = text[start:end]
+            if marker := LIST_MARKER.match(sentence):
+                start += marker.end()
+                sentence = sentence[marker.end():]
+            claim_text = sentence.strip().rstrip(".;").rstrip()
+            if not claim_text:
+                continue
+            start += len(sentence) - len(sentence.lstrip())
+            sentences += 1
+
+            is_factual = not claim_text.endswith("?") and not self._opinion_regex.search(claim_text)
+            if not is_factual:
+                opinions += 1
+                if not self.config.include_opinions:
+                    continue
+            if len(claim_text) < self.config.min_claim_length:
+                continue
+            if len(claims) >= self.config.max_claims:
+                break
+
+            hedging_detected = self._detect_hedging(claim_text)
+            claims.append(Claim(
+                id=self._generate_claim_id(claim_text, start),
+                text=claim_text,
+                source_span=(start, start + len(claim_text)),
+                raw_confidence=RULE_CLAIM_CONFIDENCE,
+                is_factual=is_factual,
+                claim_type=self._detect_claim_type(claim_text),
+                extraction_confidence=RULE_EXTRACTION_CONFIDENCE,
+                hedging_detected=hedging_detected,
+            ))
+
+        metadata = {
+            "extractor": "rules",
+            "total_extracted": sentences,
+            "after_filtering": len(claims),
+            "filtered_opinions": opinions,
+            "hedged_claims": len([c for c in claims if c.hedging_detected]),
+            "claim_types": {
+                ct.value: len([c for c in claims if c.claim_type == ct]) for ct in ClaimType
+            },
+        }
+        return claims, metadata
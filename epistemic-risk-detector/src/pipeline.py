@@ -1,16 +1,61 @@
 """Main analysis pipeline - orchestrates all modules."""
 
+import asyncio
+import contextvars
+import re
+import time
+import unicodedata
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, TypeVar
+
+from src.cache.memory import LRUCache, TieredCache
+from src.cache.persistent import PersistentCache
 from src.calibrators.confidence import PenaltyBasedCalibrator
 from src.core.config import Config, load_config
-from src.core.schemas import AnalysisResult, VerdictLabel
-from src.evaluators.alignment import LLMAlignmentEvaluator
-from src.extractors.claim_extractor import LLMClaimExtractor
+from src.core.interfaces import AlignmentEvaluator, ClaimExtractor
+from src.core.schemas import (
+    AlignmentResult,
+    AnalysisResult,
+    Claim,
+    DocumentMetadata,
+    EvidenceChunk,
+    IndexProgress,
+    Verdict,
+    VerdictLabel,
+)
+from src.evaluators.alignment import (
+    CascadeAlignmentEvaluator,
+    CascadeStats,
+    HeuristicAlignmentEvaluator,
+    LLMAlignmentEvaluator,
+)
+from src.evaluators.nli import NLIAlignmentEvaluator
+from src.extractors.claim_extractor import LLMClaimExtractor, RuleBasedClaimExtractor
 from src.providers.llm import LLMProviderFactory
 from src.renderers.cli import CLIRenderer
 from src.renderers.structured import StructuredRenderer
 from src.retrievers.local_vector import LocalVectorStore
+from src.retrievers.sharded import ShardedVectorStore
 from src.verdict.engine import DefaultVerdictEngine
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonical_claim_text(text: str) -> str:
+    """Key under which near-identical claim wordings share evidence work.
+
+    Folds Unicode compatibility forms and case, collapses whitespace and
+    drops trailing punctuation, so "Python 3.12  removed the GIL." and
+    "python 3.12 removed the GIL" are one claim.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE.sub(" ", text).strip().rstrip(".!;:,").rstrip()
+
 
 class EpistemicRiskDetector:
     """Main pipeline for epistemic risk detection."""
@@ -18,11 +63,31 @@ class EpistemicRiskDetector:
     def __init__(self, config: Config | None = None):
         self.config = config or load_config()
 
-        # Initialize components
-        self.llm = LLMProviderFactory.create(self.config.llm)
-        self.extractor = LLMClaimExtractor(self.llm, self.config.extraction)
-        self.retriever = LocalVectorStore(self.config.retrieval)
-        self.evaluator = LLMAlignmentEvaluator(self.llm)
+        # Initialize components; fast mode never talks to an LLM
+        fast = self.config.pipeline.mode == "fast"
+        self.llm = None if fast else LLMProviderFactory.create(self.config.llm)
+        self.extraction_cache = None if fast else self._build_extraction_cache()
+        self.extractor: ClaimExtractor = (
+            RuleBasedClaimExtractor(self.config.extraction)
+            if fast
+            else LLMClaimExtractor(self.llm, self.config.extraction, cache=self.extraction_cache)
+        )
+        self.retriever: LocalVectorStore | ShardedVectorStore = (
+            ShardedVectorStore(self.config.retrieval)
+            if self.config.retrieval.shards > 1
+            else LocalVectorStore(self.config.retrieval)
+        )
+        self.alignment_cache = (
+            PersistentCache(
+                self.config.cache.path,
+                namespace="alignment",
+                ttl_seconds=self.config.cache.alignment_ttl_seconds,
+                max_entries=self.config.cache.alignment_max_entries,
+            )
+            if self.config.cache.alignment_enabled and self._uses_llm_judge
+            else None
+        )
+        self.evaluator: AlignmentEvaluator = self._build_evaluator()
         self.calibrator = PenaltyBasedCalibrator(self.config.calibration)
         self.verdict_engine = DefaultVerdictEngine(self.config.verdict)
 
@@ -30,14 +95,79 @@ class EpistemicRiskDetector:
         self.cli_renderer = CLIRenderer()
         self.json_renderer = StructuredRenderer()
 
-    def index_corpus(self, path: str, extensions: list[str] | None = None) -> int:
-        """Index documents for evidence retrieval."""
+    @property
+    def _uses_llm_judge(self) -> bool:
+        return self.config.pipeline.mode != "fast" and self.config.alignment.evaluator == "llm"
+
+    def _build_evaluator(self) -> AlignmentEvaluator:
+        """NLI model, rules (fast mode) or the LLM judge, optionally behind a rule-based tier."""
+        alignment_config = self.config.alignment
+        if alignment_config.evaluator == "nli":
+            return NLIAlignmentEvaluator(
+                alignment_config.nli_model,
+                batch_size=alignment_config.nli_batch_size,
+                weak_support_threshold=alignment_config.nli_weak_support,
+            )
+        if not self._uses_llm_judge:
+            return HeuristicAlignmentEvaluator()
+
+        evaluator = LLMAlignmentEvaluator(
+            self.llm,
+            cache=self.alignment_cache,
+            batch_evidence=alignment_config.batch_evidence,
+        )
+        if not alignment_config.cascade:
+            return evaluator
+        return CascadeAlignmentEvaluator(
+            evaluator,
+            similarity_threshold=self.config.retrieval.similarity_threshold,
+            escalation_band=alignment_config.escalation_band,
+            near_duplicate_similarity=alignment_config.near_duplicate_similarity,
+        )
+
+    def _build_extraction_cache(self) -> TieredCache | None:
+        """In-memory LRU for extractions, optionally backed by the on-disk cache."""
+        cache_config = self.config.cache
+        if not cache_config.extraction_enabled:
+            return None
+
+        persistent = None
+        if cache_config.extraction_persistent:
+            persistent = PersistentCache(
+                cache_config.path,
+                namespace="extraction",
+                ttl_seconds=cache_config.extraction_ttl_seconds,
+                max_entries=cache_config.extraction_max_entries,
+            )
+        return TieredCache(LRUCache(cache_config.extraction_memory_entries), persistent)
+
+    def index_corpus(
+        self,
+        path: str,
+        extensions: list[str] | None = None,
+        progress: Callable[[IndexProgress], None] | None = None,
+        force: bool = False,
+        metadata: DocumentMetadata | None = None,
+    ) -> int:
+        """Index documents for evidence retrieval; unchanged files are skipped unless forced.
+
+        `metadata` tags every indexed chunk for filtering with EvidenceFilter.metadata.
+        """
         from pathlib import Path
 
         p = Path(path)
         if p.is_file():
-            return self.retriever.index_document(str(p))
-        return self.retriever.index_directory(str(p), extensions)
+            return self.retriever.index_document(str(p), force=force, metadata=metadata)
+        return self.retriever.index_directory(
+            str(p), extensions, progress=progress, force=force,
+            metadata_fn=(lambda _: metadata) if metadata else None,
+        )
+
+    def warm_up(self) -> None:
+        """Load the embedding model, evidence index and any local judge model ahead of time."""
+        self.retriever.warm_up()
+        if isinstance(self.evaluator, NLIAlignmentEvaluator):
+            self.evaluator.warm_up()
 
     def analyze(self, text: str) -> AnalysisResult:
         """
@@ -49,35 +179,273 @@ class EpistemicRiskDetector:
         Returns:
             Complete analysis result with verdicts for each claim
         """
+        started = time.perf_counter()
+
         # Step 1: Extract claims
         claims, extraction_meta = self.extractor.extract_with_confidence(text)
+        timings = {"extraction": time.perf_counter() - started}
+
+        if not claims:
+            return self._no_claims_result(text, extraction_meta, timings)
+
+        # Step 2: Retrieve evidence for all claims in one batch
+        stage_start = time.perf_counter()
+        evidence_by_claim = self.retriever.retrieve_many(
+            [claim.text for claim in claims], self.config.retrieval.top_k
+        )
+        timings["retrieval"] = time.perf_counter() - stage_start
+
+        # Step 3-5: Evaluate, calibrate and judge each claim (order preserved)
+        stage_start = time.perf_counter()
+        with self._track_cascade() as cascade:
+            if self.evaluator.batches_claims:
+                processed = self._process_claims_together(claims, evidence_by_claim)
+            else:
+                processed = self._map(
+                    lambda pair: self._process_claim(*pair), zip(claims, evidence_by_claim)
+                )
+        timings["claim_processing"] = time.perf_counter() - stage_start
+
+        return self._build_result(
+            text, claims, processed, extraction_meta, timings, started,
+            concurrency=self.config.pipeline.concurrency,
+            cascade=cascade,
+        )
+
+    async def aanalyze(self, text: str) -> AnalysisResult:
+        """
+        Async variant of analyze for event-loop based services.
+
+        LLM calls go through the provider's async API, so many analyses can
+        share one loop without a thread per request. Claims are evaluated
+        concurrently, bounded by pipeline.max_workers. Retrieval runs on a
+        worker thread so the loop keeps serving other requests. Await
+        `self.llm.aclose()` before the loop ends to close its connections.
+
+        Args:
+            text: The LLM response to analyze
+
+        Returns:
+            Complete analysis result with verdicts for each claim
+        """
+        started = time.perf_counter()
+
+        # Step 1: Extract claims
+        claims, extraction_meta = await self.extractor.aextract_with_confidence(text)
+        timings = {"extraction": time.perf_counter() - started}
 
         if not claims:
-            return AnalysisResult(
-                original_text=text,
-                claims=[],
-                verdicts=[],
-                overall_hallucination_risk=0.0,
-                summary="No factual claims found in the text.",
-                metadata={"extraction": extraction_meta},
+            return self._no_claims_result(text, extraction_meta, timings)
+
+        # Step 2: Retrieve evidence for all claims in one batch
+        stage_start = time.perf_counter()
+        evidence_by_claim = await asyncio.to_thread(
+            self.retriever.retrieve_many,
+            [claim.text for claim in claims],
+            self.config.retrieval.top_k,
+        )
+        timings["retrieval"] = time.perf_counter() - stage_start
+
+        # Step 3-5: Evaluate, calibrate and judge each claim (order preserved by gather)
+        stage_start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.config.pipeline.max_workers)
+
+        async def bounded(claim: Claim, evidence: list[EvidenceChunk]):
+            async with semaphore:
+                return await self._aprocess_claim(claim, evidence)
+
+        with self._track_cascade() as cascade:
+            if self.evaluator.batches_claims:
+                processed = await asyncio.to_thread(
+                    self._process_claims_together, claims, evidence_by_claim
+                )
+            else:
+                processed = await asyncio.gather(
+                    *(bounded(c, e) for c, e in zip(claims, evidence_by_claim))
+                )
+        timings["claim_processing"] = time.perf_counter() - stage_start
+
+        return self._build_result(
+            text, claims, list(processed), extraction_meta, timings, started,
+            concurrency="async",
+            cascade=cascade,
+        )
+
+    def analyze_batch(
+        self, texts: list[str], pool: Executor | None = None
+    ) -> list[AnalysisResult]:
+        """
+        Analyze several responses, sharing evidence work across them.
+
+        Identical responses are extracted once. Claims are grouped by
+        `canonical_claim_text` across the whole batch; retrieval runs as one
+        batch over the unique claims and alignment runs once per unique
+        claim. Calibration and verdicts still run per response claim, on its
+        own confidence and hedging, so every result keeps its own claim ids
+        and source spans. Extraction and alignment run in parallel on `pool`
+        when one is given, else when pipeline.concurrency is "threads".
+
+        Args:
+            texts: The LLM responses to analyze
+            pool: Executor to fan extraction and alignment out on, e.g. one
+                shared by a server's batch requests; must not be the pool
+                running this call
+
+        Returns:
+            One AnalysisResult per input text, in input order. Shared stages
+            (retrieval, claim processing) report batch-wide timings and
+            cascade counts, and metadata["batch"] reports how much work
+            deduplication saved.
+        """
+        started = time.perf_counter()
+
+        # Step 1: Extract claims once per distinct response
+        unique_texts = list(dict.fromkeys(texts))
+        extracted = dict(zip(unique_texts, self._map(self._timed_extract, unique_texts, pool)))
+
+        # Group claims across responses; the first wording seen represents its group
+        representatives: dict[str, Claim] = {}
+        for text in texts:
+            for claim in extracted[text][0]:
+                representatives.setdefault(canonical_claim_text(claim.text), claim)
+        keys = list(representatives)
+
+        # Step 2: Retrieve evidence for every unique claim in one batch
+        stage_start = time.perf_counter()
+        evidence_by_key: dict[str, list[EvidenceChunk]] = {}
+        if keys:
+            evidence_by_key = dict(
+                zip(
+                    keys,
+                    self.retriever.retrieve_many(
+                        [representatives[key].text for key in keys], self.config.retrieval.top_k
+                    ),
+                )
             )
+        retrieval_time = time.perf_counter() - stage_start
+
+        # Step 3: Align each unique claim once
+        stage_start = time.perf_counter()
+
+        def align(key: str) -> tuple[list[AlignmentResult], float]:
+            align_start = time.perf_counter()
+            alignments = self.evaluator.evaluate(representatives[key], evidence_by_key[key])
+            return alignments, time.perf_counter() - align_start
+
+        with self._track_cascade() as cascade:
+            if self.evaluator.batches_claims:
+                aligned_keys = self._align_together(
+                    [representatives[key] for key in keys], [evidence_by_key[key] for key in keys]
+                )
+            else:
+                aligned_keys = self._map(align, keys, pool)
+        alignments_by_key = dict(zip(keys, aligned_keys))
+
+        # Steps 4-5: Calibrate and judge each response's own claims
+        total_claims = sum(len(extracted[text][0]) for text in texts)
+        batch_meta = {
+            "responses": len(texts),
+            "unique_responses": len(unique_texts),
+            "claims": total_claims,
+            "unique_claims": len(keys),
+            "dedup_ratio": 1 - len(keys) / total_claims if total_claims else 0.0,
+        }
+        corpus_stats = self.retriever.stats()
+        aligned: set[str] = set()  # Groups whose alignment time is already attributed
+
+        per_response = []
+        for text in texts:
+            claims, extraction_meta, extraction_time = extracted[text]
+            processed = []
+            for claim in claims:
+                key = canonical_claim_text(claim.text)
+                shared, align_time = alignments_by_key[key]
+                alignments = [a.model_copy(update={"claim_id": claim.id}) for a in shared]
+                verdict, timings = self._judge_claim(claim, evidence_by_key[key], alignments)
+                timings["alignment"] = 0.0 if key in aligned else align_time
+                aligned.add(key)
+                processed.append((verdict, timings))
+            per_response.append((text, claims, extraction_meta, extraction_time, processed))
+        claim_processing_time = time.perf_counter() - stage_start
+
+        results = []
+        for text, claims, extraction_meta, extraction_time, processed in per_response:
+            timings = {"extraction": extraction_time}
+            if not claims:
+                result = self._no_claims_result(text, extraction_meta, timings)
+            else:
+                timings["retrieval"] = retrieval_time
+                timings["claim_processing"] = claim_processing_time
+                result = self._build_result(
+                    text, claims, processed, extraction_meta, timings, started,
+                    concurrency="threads" if pool is not None else self.config.pipeline.concurrency,
+                    corpus_stats=corpus_stats,
+                    cascade=cascade,
+                )
+            result.metadata["batch"] = batch_meta
+            results.append(result)
+        return results
 
-        verdicts = []
+    def _timed_extract(self, text: str) -> tuple[list[Claim], dict, float]:
+        started = time.perf_counter()
+        claims, extraction_meta = self.extractor.extract_with_confidence(text)
+        return claims, extraction_meta, time.perf_counter() - started
 
-        # Step 2-5: Process each claim
-        for claim in claims:
-            # Retrieve evidence
-            evidence = self.retriever.retrieve(claim.text)
+    def _map(
+        self, fn: Callable[[T], R], items: Iterable[T], pool: Executor | None = None
+    ) -> list[R]:
+        """
+        Map in input order, on `pool` or a bounded thread pool when concurrency is "threads".
 
-            # Evaluate alignment
-            alignments = self.evaluator.evaluate(claim, evidence)
+        Each item runs under a copy of the caller's context, so per-analysis
+        tracking such as CascadeAlignmentEvaluator.track() sees pool threads.
+        """
+        items = list(items)
+        pipeline_config = self.config.pipeline
+        if len(items) < 2 or (pool is None and pipeline_config.concurrency != "threads"):
+            return [fn(item) for item in items]
 
-            # Calibrate confidence
-            calibrated = self.calibrator.calibrate(claim, alignments, evidence)
+        contexts = [contextvars.copy_context() for _ in items]
+        if pool is not None:
+            return list(pool.map(lambda ctx, item: ctx.run(fn, item), contexts, items))
+        with ThreadPoolExecutor(max_workers=min(pipeline_config.max_workers, len(items))) as own:
+            return list(own.map(lambda ctx, item: ctx.run(fn, item), contexts, items))
 
-            # Compute verdict
-            verdict = self.verdict_engine.compute(claim, evidence, alignments, calibrated)
-            verdicts.append(verdict)
+    def _track_cascade(self) -> AbstractContextManager[CascadeStats | None]:
+        """Per-analysis cascade tier counts; yields None for other evaluators."""
+        if isinstance(self.evaluator, CascadeAlignmentEvaluator):
+            return self.evaluator.track()
+        return nullcontext()
+
+    def _no_claims_result(
+        self, text: str, extraction_meta: dict, timings: dict[str, float]
+    ) -> AnalysisResult:
+        return AnalysisResult(
+            original_text=text,
+            claims=[],
+            verdicts=[],
+            overall_hallucination_risk=0.0,
+            summary="No factual claims found in the text.",
+            metadata={"extraction": extraction_meta, "timings": timings},
+        )
+
+    def _build_result(
+        self,
+        text: str,
+        claims: list[Claim],
+        processed: list[tuple[Verdict, dict[str, float]]],
+        extraction_meta: dict,
+        timings: dict[str, float],
+        started: float,
+        concurrency: str,
+        corpus_stats: dict[str, Any] | None = None,
+        cascade: CascadeStats | None = None,
+    ) -> AnalysisResult:
+        """Aggregate per-claim verdicts into an AnalysisResult with summary and metadata."""
+        verdicts = [verdict for verdict, _ in processed]
+        # Per-stage totals summed across claims (exceed wall time when run in parallel)
+        for stage in ("alignment", "calibration", "verdict"):
+            timings[stage] = sum(stage_timings[stage] for _, stage_timings in processed)
 
         # Compute overall risk
         if verdicts:
@@ -99,18 +467,100 @@ class EpistemicRiskDetector:
                 f"{grounded_count} claims are well-grounded."
             )
 
+        metadata = {
+            "extraction": extraction_meta,
+            "corpus_stats": corpus_stats if corpus_stats is not None else self.retriever.stats(),
+            "mode": self.config.pipeline.mode,
+            "concurrency": {
+                "mode": concurrency,
+                "max_workers": self.config.pipeline.max_workers,
+            },
+            "timings": {**timings, "total": time.perf_counter() - started},
+        }
+        if self.alignment_cache is not None:
+            metadata["alignment_cache"] = self.alignment_cache.stats()
+        if self.extraction_cache is not None:
+            metadata["extraction_cache"] = self.extraction_cache.stats()
+        if cascade is not None:
+            metadata["cascade"] = cascade.summary()
+
         return AnalysisResult(
             original_text=text,
             claims=claims,
             verdicts=verdicts,
             overall_hallucination_risk=overall_risk,
             summary=summary,
-            metadata={
-                "extraction": extraction_meta,
-                "corpus_stats": self.retriever.stats(),
-            },
+            metadata=metadata,
         )
 
+    def _process_claim(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> tuple[Verdict, dict[str, float]]:
+        """Run alignment, calibration and verdict for one claim, timing each stage."""
+        # Evaluate alignment
+        stage_start = time.perf_counter()
+        alignments = self.evaluator.evaluate(claim, evidence)
+        alignment_time = time.perf_counter() - stage_start
+
+        verdict, timings = self._judge_claim(claim, evidence, alignments)
+        timings["alignment"] = alignment_time
+        return verdict, timings
+
+    def _align_together(
+        self, claims: list[Claim], evidence_by_claim: list[list[EvidenceChunk]]
+    ) -> list[tuple[list[AlignmentResult], float]]:
+        """One evaluate_many call for all claims; its time is attributed to the first claim."""
+        if not claims:
+            return []
+        stage_start = time.perf_counter()
+        alignments = self.evaluator.evaluate_many(claims, evidence_by_claim)
+        elapsed = time.perf_counter() - stage_start
+        return [(a, elapsed if i == 0 else 0.0) for i, a in enumerate(alignments)]
+
+    def _process_claims_together(
+        self, claims: list[Claim], evidence_by_claim: list[list[EvidenceChunk]]
+    ) -> list[tuple[Verdict, dict[str, float]]]:
+        """_process_claim for evaluators that batch across claims."""
+        processed = []
+        aligned = self._align_together(claims, evidence_by_claim)
+        for claim, evidence, (alignments, alignment_time) in zip(
+            claims, evidence_by_claim, aligned
+        ):
+            verdict, timings = self._judge_claim(claim, evidence, alignments)
+            timings["alignment"] = alignment_time
+            processed.append((verdict, timings))
+        return processed
+
+    def _judge_claim(
+        self, claim: Claim, evidence: list[EvidenceChunk], alignments: list[AlignmentResult]
+    ) -> tuple[Verdict, dict[str, float]]:
+        """Calibrate confidence and compute the verdict for already-aligned evidence."""
+        timings: dict[str, float] = {}
+
+        # Calibrate confidence
+        stage_start = time.perf_counter()
+        calibrated = self.calibrator.calibrate(claim, alignments, evidence)
+        timings["calibration"] = time.perf_counter() - stage_start
+
+        # Compute verdict
+        stage_start = time.perf_counter()
+        verdict = self.verdict_engine.compute(claim, evidence, alignments, calibrated)
+        timings["verdict"] = time.perf_counter() - stage_start
+
+        return verdict, timings
+
+    async def _aprocess_claim(
+        self, claim: Claim, evidence: list[EvidenceChunk]
+    ) -> tuple[Verdict, dict[str, float]]:
+        """Async _process_claim: awaits alignment, then runs the CPU-only stages inline."""
+        stage_start = time.perf_counter()
+        alignments = await self.evaluator.aevaluate(claim, evidence)
+        alignment_time = time.perf_counter() - stage_start
+
+        verdict, timings = self._judge_claim(claim, evidence, alignments)
+        timings["alignment"] = alignment_time
+        return verdict, timings
+
     def render_cli(self, result: AnalysisResult) -> str:
         """Render result for CLI output."""
         return self.cli_renderer.render(result)
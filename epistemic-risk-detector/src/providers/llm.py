@@ -1,13 +1,103 @@
 """LLM provider implementations for OpenAI, Anthropic, and local models."""
 
+import asyncio
 import json
 import os
+import socket
+from collections.abc import Callable
 from typing import Any
 
 from src.core.config import LLMConfig
 
 
-class OpenAIProvider:
+def _json_prompt(prompt: str, schema: dict) -> str:
+    """Append the JSON-only instruction and schema to a prompt."""
+    return f"""{prompt}
+
+Respond with valid JSON conforming to this schema:
+{json.dumps(schema, indent=2)}
+
+Output only the JSON, no other text."""
+
+
+def _parse_json(content: str) -> dict:
+    """Parse a JSON response, handling potential markdown wrapping."""
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0]
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0]
+
+    return json.loads(content.strip())
+
+
+async def _close_client(client: Any) -> None:
+    """Close an httpx.AsyncClient (aclose) or an OpenAI/Anthropic async client (close)."""
+    close = getattr(client, "aclose", None) or client.close
+    await close()
+
+
+def _shutdown_sockets(client: Any) -> None:
+    """Disconnect the pooled sockets of an async client whose event loop is gone.
+
+    Nothing can await its close() any more, so this reaches into the httpx
+    pool. The file descriptors are released when the client is collected.
+    """
+    http = getattr(client, "_client", client)  # The SDK clients wrap an httpx.AsyncClient
+    pool = getattr(getattr(http, "_transport", None), "_pool", None)
+    for connection in getattr(pool, "connections", []):
+        stream = getattr(getattr(connection, "_connection", None), "_network_stream", None)
+        sock = stream.get_extra_info("socket") if stream is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # Already disconnected
+
+
+class _AsyncClientMixin:
+    """Caches one async client per running event loop.
+
+    Async HTTP clients hold connection pools bound to the loop that created
+    them, so a client is rebuilt if the provider is reused from a new loop
+    (e.g. successive asyncio.run() calls). The replaced client is closed on
+    its own loop if that loop is still running; otherwise its connections
+    are shut down. Await aclose() before a loop ends to close it cleanly.
+    """
+
+    _async_client: Any = None
+    _async_loop: asyncio.AbstractEventLoop | None = None
+
+    def _loop_client(self, factory: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._discard_client()
+            self._async_client = factory()
+            self._async_loop = loop
+        return self._async_client
+
+    def _discard_client(self) -> None:
+        """Release the cached client without awaiting it on the current loop."""
+        client, loop = self._async_client, self._async_loop
+        self._async_client = self._async_loop = None
+        if client is None:
+            return
+        if loop is not None and loop.is_running():
+            # Another thread's loop still owns the client; close it there
+            asyncio.run_coroutine_threadsafe(_close_client(client), loop)
+        else:
+            _shutdown_sockets(client)
+
+    async def aclose(self) -> None:
+        """Close the async client and its connections."""
+        if self._async_loop is asyncio.get_running_loop():
+            client = self._async_client
+            self._async_client = self._async_loop = None
+            await _close_client(client)
+        else:
+            self._discard_client()
+
+
+class OpenAIProvider(_AsyncClientMixin):
     """OpenAI API provider."""
 
     def __init__(self, config: LLMConfig):
@@ -38,16 +128,42 @@ class OpenAIProvider:
 
     def complete_json(self, prompt: str, schema: dict) -> dict:
         """Generate a JSON completion conforming to schema."""
-        json_prompt = f"""{prompt}
+        response = self.client.chat.completions.create(
+            model=self.config.model,
+            messages=[{"role": "user", "content": _json_prompt(prompt, schema)}],
+            temperature=0.0,
+            max_tokens=self.config.max_tokens,
+            response_format={"type": "json_object"},
+        )
 
-Respond with valid JSON conforming to this schema:
-{json.dumps(schema, indent=2)}
+        content = response.choices[0].message.content or "{}"
+        return json.loads(content)
 
-Output only the JSON, no other text."""
+    @property
+    def async_client(self) -> Any:
+        def factory() -> Any:
+            from openai import AsyncOpenAI
 
-        response = self.client.chat.completions.create(
+            api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
+            return AsyncOpenAI(api_key=api_key, base_url=self.config.base_url)
+
+        return self._loop_client(factory)
+
+    async def acomplete(self, prompt: str, temperature: float | None = None) -> str:
+        """Generate a completion without blocking the event loop."""
+        response = await self.async_client.chat.completions.create(
+            model=self.config.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature if temperature is not None else self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+        return response.choices[0].message.content or ""
+
+    async def acomplete_json(self, prompt: str, schema: dict) -> dict:
+        """Generate a JSON completion without blocking the event loop."""
+        response = await self.async_client.chat.completions.create(
             model=self.config.model,
-            messages=[{"role": "user", "content": json_prompt}],
+            messages=[{"role": "user", "content": _json_prompt(prompt, schema)}],
             temperature=0.0,
             max_tokens=self.config.max_tokens,
             response_format={"type": "json_object"},
@@ -57,7 +173,7 @@ Output only the JSON, no other text."""
         return json.loads(content)
 
 
-class AnthropicProvider:
+class AnthropicProvider(_AsyncClientMixin):
     """Anthropic API provider."""
 
     def __init__(self, config: LLMConfig):
@@ -70,7 +186,7 @@ class AnthropicProvider:
             from anthropic import Anthropic
 
             api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
-            self._client = Anthropic(api_key=api_key)
+            self._client = Anthropic(api_key=api_key, base_url=self.config.base_url)
         return self._client
 
     def complete(self, prompt: str, temperature: float | None = None) -> str:
@@ -85,31 +201,48 @@ class AnthropicProvider:
 
     def complete_json(self, prompt: str, schema: dict) -> dict:
         """Generate a JSON completion conforming to schema."""
-        json_prompt = f"""{prompt}
+        response = self.client.messages.create(
+            model=self.config.model,
+            max_tokens=self.config.max_tokens,
+            temperature=0.0,
+            messages=[{"role": "user", "content": _json_prompt(prompt, schema)}],
+        )
 
-Respond with valid JSON conforming to this schema:
-{json.dumps(schema, indent=2)}
+        return _parse_json(response.content[0].text)
 
-Output only the JSON, no other text."""
+    @property
+    def async_client(self) -> Any:
+        def factory() -> Any:
+            from anthropic import AsyncAnthropic
 
-        response = self.client.messages.create(
+            api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
+            return AsyncAnthropic(api_key=api_key, base_url=self.config.base_url)
+
+        return self._loop_client(factory)
+
+    async def acomplete(self, prompt: str, temperature: float | None = None) -> str:
+        """Generate a completion without blocking the event loop."""
+        response = await self.async_client.messages.create(
             model=self.config.model,
             max_tokens=self.config.max_tokens,
-            temperature=0.0,
-            messages=[{"role": "user", "content": json_prompt}],
+            temperature=temperature if temperature is not None else self.config.temperature,
+            messages=[{"role": "user", "content": prompt}],
         )
+        return response.content[0].text
 
-        content = response.content[0].text
-        # Extract JSON from response (handle potential markdown wrapping)
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+    async def acomplete_json(self, prompt: str, schema: dict) -> dict:
+        """Generate a JSON completion without blocking the event loop."""
+        response = await self.async_client.messages.create(
+            model=self.config.model,
+            max_tokens=self.config.max_tokens,
+            temperature=0.0,
+            messages=[{"role": "user", "content": _json_prompt(prompt, schema)}],
+        )
 
-        return json.loads(content.strip())
+        return _parse_json(response.content[0].text)
 
 
-class OllamaProvider:
+class OllamaProvider(_AsyncClientMixin):
     """Ollama local model provider."""
 
     def __init__(self, config: LLMConfig):
@@ -134,22 +267,37 @@ class OllamaProvider:
 
     def complete_json(self, prompt: str, schema: dict) -> dict:
         """Generate a JSON completion."""
-        json_prompt = f"""{prompt}
+        content = self.complete(_json_prompt(prompt, schema), temperature=0.0)
+        return _parse_json(content)
 
-Respond with valid JSON conforming to this schema:
-{json.dumps(schema, indent=2)}
+    @property
+    def async_client(self) -> Any:
+        def factory() -> Any:
+            import httpx
 
-Output only the JSON, no other text."""
+            # Local generation can be slow; rely on the server rather than a short timeout
+            return httpx.AsyncClient(base_url=self.base_url, timeout=None)
 
-        content = self.complete(json_prompt, temperature=0.0)
+        return self._loop_client(factory)
 
-        # Extract JSON
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+    async def acomplete(self, prompt: str, temperature: float | None = None) -> str:
+        """Generate a completion using Ollama without blocking the event loop."""
+        response = await self.async_client.post(
+            "/api/generate",
+            json={
+                "model": self.config.model,
+                "prompt": prompt,
+                "temperature": temperature if temperature is not None else self.config.temperature,
+                "stream": False,
+            },
+        )
+        response.raise_for_status()
+        return response.json()["response"]
 
-        return json.loads(content.strip())
+    async def acomplete_json(self, prompt: str, schema: dict) -> dict:
+        """Generate a JSON completion without blocking the event loop."""
+        content = await self.acomplete(_json_prompt(prompt, schema), temperature=0.0)
+        return _parse_json(content)
 
 
 class LLMProviderFactory:
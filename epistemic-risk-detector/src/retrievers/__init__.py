@@ -1,5 +1,6 @@
 """Evidence retrieval module."""
 
 from src.retrievers.local_vector import LocalVectorStore
+from src.retrievers.sharded import ShardedVectorStore
 
-__all__ = ["LocalVectorStore"]
+__all__ = ["LocalVectorStore", "ShardedVectorStore"]
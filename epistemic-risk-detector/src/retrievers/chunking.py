@@ -0,0 +1,143 @@
+"""Document reading and chunking, kept picklable for worker processes."""
+
+import codecs
+import hashlib
+import io
+import os
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+DEFAULT_EXTENSIONS = [".txt", ".md", ".py", ".js", ".ts", ".json", ".yaml", ".yml"]
+
+SENTENCE_SEPARATORS = [". ", ".\n", "! ", "? ", "\n\n"]
+
+READ_BUFFER_BYTES = 1 << 20
+
+
+class DocumentReader:
+    """Iterate a file's text in bounded pieces while hashing its raw bytes.
+
+    Decodes like `Path.read_text(encoding="utf-8", errors="ignore")`,
+    including universal-newline translation, without holding the file.
+    """
+
+    def __init__(self, path: str, buffer_size: int = READ_BUFFER_BYTES):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._hash = hashlib.sha256()
+
+    def __iter__(self) -> Iterator[str]:
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="ignore"), translate=True
+        )
+        with open(self.path, "rb") as f:
+            while block := f.read(self.buffer_size):
+                self._hash.update(block)
+                if text := decoder.decode(block):
+                    yield text
+        if tail := decoder.decode(b"", final=True):
+            yield tail
+
+    def hexdigest(self) -> str:
+        """sha256 of the bytes read so far (the whole file once iteration ends)."""
+        return self._hash.hexdigest()
+
+
+def file_sha256(path: str, buffer_size: int = READ_BUFFER_BYTES) -> str:
+    """Hash a file without decoding it."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(buffer_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_chunks(pieces: Iterable[str], chunk_size: int, chunk_overlap: int) -> Iterator[str]:
+    """
+    Yield overlapping chunks of the concatenated pieces, preferring sentence boundaries.
+
+    Produces exactly the chunks `chunk_text` would for the joined text, but
+    only buffers about one piece plus one chunk at a time.
+    """
+    pieces = iter(pieces)
+    buf = ""
+    offset = 0  # Absolute position of buf[0]
+    start = 0
+    eof = False
+
+    while True:
+        end = start + chunk_size
+
+        # Read until one character past `end` is buffered, so `end < len(text)` is decidable
+        while not eof and offset + len(buf) <= end:
+            piece = next(pieces, None)
+            if piece is None:
+                eof = True
+            else:
+                buf += piece
+
+        total = offset + len(buf)
+        if start >= total:
+            return
+
+        # Try to break at sentence boundary
+        if end < total:
+            # Look for sentence end within last 20% of chunk
+            search_start = int(end - chunk_size * 0.2)
+            for sep in SENTENCE_SEPARATORS:
+                pos = buf.rfind(sep, search_start - offset, end - offset)
+                if pos != -1 and pos + offset > start:
+                    end = pos + offset + len(sep)
+                    break
+
+        chunk = buf[start - offset : end - offset].strip()
+        if chunk:  # Filter empty chunks
+            yield chunk
+        start = end - chunk_overlap
+
+        # Drop consumed text, keeping `chunk_overlap` behind start in case it moves back
+        keep_from = start - chunk_overlap
+        if keep_from - offset > max(chunk_size, len(buf) // 2):
+            buf = buf[keep_from - offset :]
+            offset = keep_from
+
+
+def chunk_text(text: str, chunk_size: int, chunk_overlap: int) -> list[str]:
+    """Split text into overlapping chunks, preferring sentence boundaries."""
+    return list(iter_chunks([text], chunk_size, chunk_overlap))
+
+
+class ChunkedFile(NamedTuple):
+    """A file read by a worker, with the fingerprint it was read at."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    chunks: list[str] | None  # None when the content hash matched `known_hash`
+    error: str | None = None
+
+
+def read_and_chunk(
+    path: str, chunk_size: int, chunk_overlap: int, known_hash: str | None = None
+) -> ChunkedFile:
+    """Read, fingerprint and chunk one file; skip chunking if its hash is `known_hash`."""
+    reader = DocumentReader(path)
+    try:
+        # Stat before reading so a write during the read is picked up next run
+        st = os.stat(path)
+        pieces = list(reader)
+    except OSError as e:
+        return ChunkedFile(path, 0, 0, "", None, str(e))
+
+    content_hash = reader.hexdigest()
+    if content_hash == known_hash:
+        return ChunkedFile(path, st.st_size, st.st_mtime_ns, content_hash, None)
+
+    return ChunkedFile(
+        path,
+        st.st_size,
+        st.st_mtime_ns,
+        content_hash,
+        list(iter_chunks(pieces, chunk_size, chunk_overlap)),
+    )
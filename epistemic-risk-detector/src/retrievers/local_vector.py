@@ -1,25 +1,106 @@
 """Local vector store using SQLite and sentence-transformers."""
 
+import functools
 import hashlib
 import json
+import multiprocessing
+import os
+import queue
+import re
 import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from src.cache.memory import LRUCache
 from src.core.config import RetrievalConfig
 from src.core.interfaces import EvidenceProvider
-from src.core.schemas import EvidenceChunk
+from src.core.schemas import DocumentMetadata, EvidenceChunk, EvidenceFilter, IndexProgress
+from src.retrievers.chunking import (
+    DEFAULT_EXTENSIONS,
+    ChunkedFile,
+    DocumentReader,
+    chunk_text,
+    file_sha256,
+    iter_chunks,
+    read_and_chunk,
+)
+from src.retrievers.quantization import QuantizationMode, QuantizedMatrix
+
+# Brute-force scan matrix: plain float32, or a compact QuantizedMatrix
+Matrix = np.ndarray | QuantizedMatrix
+
+# (id, text, source, chunk_index, embedding bytes, metadata json)
+ChunkRow = tuple[str, str, str, int, bytes, str]
+
+_WORD = re.compile(r"\w")
+
+_MAX_CODE_POINT = 0x10FFFF
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string above every string starting with prefix (UTF-8 order), if any."""
+    while prefix:
+        code = ord(prefix[-1]) + 1
+        if 0xD800 <= code <= 0xDFFF:  # Surrogates cannot be stored; skip past them
+            code = 0xE000
+        if code <= _MAX_CODE_POINT:
+            return prefix[:-1] + chr(code)
+        prefix = prefix[:-1]
+    return None
+
+
+def _writes(method):
+    """Serialize a write path on the store's single writer connection."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class LocalVectorStore(EvidenceProvider):
-    """SQLite-backed vector store with local embeddings."""
+    """SQLite-backed vector store with local embeddings.
+
+    The database runs in WAL mode. Index writes go through one writer
+    connection, serialized by a write lock. Queries and stats borrow
+    read-only connections from a pool, so they can run from any thread
+    while a re-index is in progress; each query reads one snapshot, so it
+    never mixes rows from before and after a concurrent commit.
+    """
+
+    _SIDECAR_BATCH = 10_000
+    _SQL_BATCH = 500  # Stay well under SQLITE_MAX_VARIABLE_NUMBER
+    _SCORE_BLOCK = 32_000_000  # Max claims x chunks scores held at once
+    _FILTER_CACHE_SIZE = 64
 
     def __init__(self, config: RetrievalConfig | None = None):
         self.config = config or RetrievalConfig()
         self._encoder: Any = None
-        self._db: sqlite3.Connection | None = None
+        self._query_cache = (
+            LRUCache(self.config.query_cache_size) if self.config.query_cache_size else None
+        )
+        # (generation, filter key) -> sorted rowids the filter selects
+        self._filter_cache = LRUCache(self._FILTER_CACHE_SIZE)
+        self._db: sqlite3.Connection | None = None  # The writer connection
+        self._write_lock = threading.RLock()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_count = 0
+        self._pool_lock = threading.Lock()
+        self._held = threading.local()  # The reader this thread has borrowed, if any
+        # (generation, matrix, rowids) swapped as one tuple so readers never see a torn pair;
+        # rebuilt lazily after any write to `chunks`, or patched in place by index batches
+        self._matrix_state: tuple[int, Matrix, np.ndarray] | None = None
+        self._matrix_lock = threading.Lock()
         self._init_db()
 
     @property
@@ -36,7 +117,14 @@ class LocalVectorStore(EvidenceProvider):
         db_path = Path(self.config.db_path)
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._db = sqlite3.connect(str(db_path))
+        self._db = sqlite3.connect(
+            str(db_path), timeout=self.config.busy_timeout_seconds, check_same_thread=False
+        )
+        # WAL lets the read pool see the last committed state while a write is in progress
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        # Make INSERT OR REPLACE fire the FTS delete trigger for the replaced row
+        self._db.execute("PRAGMA recursive_triggers = ON")
         self._db.execute("""
             CREATE TABLE IF NOT EXISTS chunks (
                 id TEXT PRIMARY KEY,
@@ -50,29 +138,163 @@ class LocalVectorStore(EvidenceProvider):
         self._db.execute("""
             CREATE INDEX IF NOT EXISTS idx_source ON chunks(source)
         """)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """)
+        self._db.executemany(
+            "INSERT OR IGNORE INTO store_meta (key, value) VALUES (?, '0')",
+            [("generation",), ("embeddings_encoded",), ("embeddings_reused",)],
+        )
+        # Chunk text hash -> embedding, so duplicated boilerplate is encoded once per model
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+        """)
+        # One row per indexed file; lets re-indexing skip files whose fingerprint is unchanged
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                index_key TEXT NOT NULL,
+                chunk_count INTEGER NOT NULL,
+                indexed_at REAL NOT NULL
+            )
+        """)
+        self._db.commit()
+
+        if self.config.backend == "sqlite_vec":
+            self._init_vec_index()
+        if self.config.search_mode == "hybrid" or self.config.lexical_prefilter:
+            self._init_fts_index()
+
+    def _init_fts_index(self) -> None:
+        """Create the FTS5 BM25 index over chunk text, kept in sync by triggers."""
+        row = self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chunks_fts'"
+        ).fetchone()
+        if row is not None:
+            return
+
+        self._db.executescript("""
+            CREATE VIRTUAL TABLE chunks_fts USING fts5(
+                text, content='chunks', content_rowid='rowid'
+            );
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_ai AFTER INSERT ON chunks BEGIN
+                INSERT INTO chunks_fts(rowid, text) VALUES (new.rowid, new.text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_ad AFTER DELETE ON chunks BEGIN
+                INSERT INTO chunks_fts(chunks_fts, rowid, text)
+                VALUES ('delete', old.rowid, old.text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_au AFTER UPDATE OF text ON chunks BEGIN
+                INSERT INTO chunks_fts(chunks_fts, rowid, text)
+                VALUES ('delete', old.rowid, old.text);
+                INSERT INTO chunks_fts(rowid, text) VALUES (new.rowid, new.text);
+            END;
+            INSERT INTO chunks_fts(chunks_fts) VALUES ('rebuild');
+        """)
         self._db.commit()
 
+    def _init_vec_index(self) -> None:
+        """Load sqlite-vec and backfill the vec0 table if it lags behind `chunks`."""
+        self._load_vec_extension(self._db)
+
+        if not self._has_vec_table():
+            row = self._db.execute("SELECT embedding FROM chunks LIMIT 1").fetchone()
+            if row is None:
+                return  # Created on first insert, once the dimension is known
+            self._create_vec_table(len(row[0]) // np.dtype(np.float32).itemsize)
+
+        (n_chunks,) = self._db.execute("SELECT COUNT(*) FROM chunks").fetchone()
+        (n_vecs,) = self._db.execute("SELECT COUNT(*) FROM chunks_vec").fetchone()
+        if n_chunks != n_vecs:
+            self._db.execute("DELETE FROM chunks_vec")
+            self._db.execute(
+                "INSERT INTO chunks_vec(rowid, embedding) SELECT rowid, embedding FROM chunks"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _load_vec_extension(db: sqlite3.Connection) -> None:
+        import sqlite_vec
+
+        db.enable_load_extension(True)
+        sqlite_vec.load(db)
+        db.enable_load_extension(False)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = Path(self.config.db_path).resolve().as_uri() + "?mode=ro"
+        db = sqlite3.connect(
+            uri, uri=True, timeout=self.config.busy_timeout_seconds, check_same_thread=False
+        )
+        if self.config.backend == "sqlite_vec":
+            self._load_vec_extension(db)
+        return db
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, opening one if the pool is not yet full.
+
+        Nested borrows on the same thread share the outer connection, so
+        they read inside any snapshot it holds.
+        """
+        held = getattr(self._held, "db", None)
+        if held is not None:
+            yield held
+            return
+
+        try:
+            db = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                can_open = self._reader_count < self.config.read_pool_size
+                if can_open:
+                    self._reader_count += 1
+            db = self._open_reader() if can_open else self._readers.get()
+        self._held.db = db
+        try:
+            yield db
+        finally:
+            self._held.db = None
+            self._readers.put(db)
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Pin one read transaction for every `_reader` use inside the block."""
+        with self._reader() as db:
+            if db.in_transaction:  # Already inside an outer snapshot
+                yield db
+                return
+            db.execute("BEGIN")
+            try:
+                yield db
+            finally:
+                db.rollback()
+
+    def _has_vec_table(self, db: sqlite3.Connection | None = None) -> bool:
+        row = (db or self._db).execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chunks_vec'"
+        ).fetchone()
+        return row is not None
+
+    def _create_vec_table(self, dim: int) -> None:
+        self._db.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS chunks_vec "
+            f"USING vec0(embedding float[{dim}] distance_metric=cosine)"
+        )
+
     def _chunk_text(self, text: str) -> list[str]:
         """Split text into overlapping chunks."""
-        chunks = []
-        start = 0
-        while start < len(text):
-            end = start + self.config.chunk_size
-
-            # Try to break at sentence boundary
-            if end < len(text):
-                # Look for sentence end within last 20% of chunk
-                search_start = int(end - self.config.chunk_size * 0.2)
-                for sep in [". ", ".\n", "! ", "? ", "\n\n"]:
-                    pos = text.rfind(sep, search_start, end)
-                    if pos > start:
-                        end = pos + len(sep)
-                        break
-
-            chunks.append(text[start:end].strip())
-            start = end - self.config.chunk_overlap
-
-        return [c for c in chunks if c]  # Filter empty chunks
+        return chunk_text(text, self.config.chunk_size, self.config.chunk_overlap)
 
     def _generate_chunk_id(self, source: str, chunk_index: int, text: str) -> str:
         """Generate deterministic chunk ID."""
@@ -83,109 +305,1097 @@ class LocalVectorStore(EvidenceProvider):
         """Generate embeddings for texts."""
         return self.encoder.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
 
+    def _embed_queries(self, claims: list[str]) -> np.ndarray:
+        """Embed claims, serving repeats from the query LRU and encoding the rest in one call."""
+        if self._query_cache is None:
+            return self._embed(claims).astype(np.float32, copy=False)
+
+        model = self.config.embedding_model
+        found: dict[str, np.ndarray] = {}
+        missing: list[str] = []
+        for claim in dict.fromkeys(claims):
+            emb = self._query_cache.get((model, claim))
+            if emb is None:
+                missing.append(claim)
+            else:
+                found[claim] = emb
+
+        if missing:
+            for claim, emb in zip(missing, self._embed(missing).astype(np.float32)):
+                emb.flags.writeable = False  # Shared between callers
+                self._query_cache.put((model, claim), emb)
+                found[claim] = emb
+
+        return np.stack([found[c] for c in claims])
+
     def _cosine_similarity(self, query_emb: np.ndarray, doc_embs: np.ndarray) -> np.ndarray:
-        """Compute cosine similarity (embeddings are already normalized)."""
-        return np.dot(doc_embs, query_emb)
+        """Compute cosine similarity (embeddings are already normalized).
+
+        A single query gives one score per chunk; a (claims, dim) batch gives (chunks, claims).
+        """
+        return doc_embs @ query_emb.T
+
+    def _write_chunks(self, rows: list[ChunkRow]) -> None:
+        """Upsert chunks in one statement batch, keeping the vec0 index in step with `chunks`."""
+        if not rows:
+            return
+
+        use_vec = self.config.backend == "sqlite_vec"
+        ids = [(row[0],) for row in rows]
+
+        if use_vec:
+            if not self._has_vec_table():
+                self._create_vec_table(len(rows[0][4]) // np.dtype(np.float32).itemsize)
+            # REPLACE gives a row a new rowid, so drop the stale vectors first
+            self._db.executemany(
+                "DELETE FROM chunks_vec WHERE rowid IN (SELECT rowid FROM chunks WHERE id = ?)",
+                ids,
+            )
+
+        self._db.executemany(
+            """
+            INSERT OR REPLACE INTO chunks (id, text, source, chunk_index, embedding, metadata)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+        if use_vec:
+            self._db.executemany(
+                "INSERT INTO chunks_vec(rowid, embedding) "
+                "SELECT rowid, embedding FROM chunks WHERE id = ?",
+                ids,
+            )
+
+    def _embed_cached(self, texts: list[str]) -> np.ndarray:
+        """Embed chunk texts, encoding only those not already in the embedding cache.
+
+        Call inside a write transaction: new embeddings and the encoded/reused
+        counters are written but not committed.
+        """
+        model = self.config.embedding_model
+        hashes = [hashlib.sha256(t.encode("utf-8")).hexdigest() for t in texts]
+        texts_by_hash = dict(zip(hashes, texts))
+        unique = list(texts_by_hash)
+
+        found: dict[str, np.ndarray] = {}
+        for start in range(0, len(unique), self._SQL_BATCH):
+            batch = unique[start : start + self._SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._db.execute(
+                "SELECT text_hash, embedding FROM embedding_cache "
+                f"WHERE model = ? AND text_hash IN ({placeholders})",
+                [model, *batch],
+            )
+            found.update((h, np.frombuffer(emb, dtype=np.float32)) for h, emb in rows)
+
+        missing = [h for h in unique if h not in found]
+        if missing:
+            encoded = self._embed([texts_by_hash[h] for h in missing])
+            encoded = encoded.astype(np.float32, copy=False)
+            self._db.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (model, text_hash, embedding) "
+                "VALUES (?, ?, ?)",
+                [(model, h, emb.tobytes()) for h, emb in zip(missing, encoded)],
+            )
+            found.update(zip(missing, encoded))
+
+        self._db.executemany(
+            "UPDATE store_meta SET value = CAST(value AS INTEGER) + ? WHERE key = ?",
+            [
+                (len(missing), "embeddings_encoded"),
+                (len(texts) - len(missing), "embeddings_reused"),
+            ],
+        )
+        return np.stack([found[h] for h in hashes])
+
+    def _embed_rows(self, pending: list[tuple[str, str, int, str]]) -> list[ChunkRow]:
+        """Embed (text, source, chunk_index, metadata) tuples, reusing cached embeddings."""
+        embeddings = self._embed_cached([text for text, _, _, _ in pending])
+        return [
+            (
+                self._generate_chunk_id(source, chunk_index, text),
+                text,
+                source,
+                chunk_index,
+                emb.tobytes(),
+                metadata,
+            )
+            for (text, source, chunk_index, metadata), emb in zip(pending, embeddings)
+        ]
 
-    def index_document(self, path: str) -> int:
-        """Index a single document."""
+    def _index_key(self, metadata: DocumentMetadata | None = None) -> str:
+        """Settings that change a file's chunks; documents indexed under another key are redone.
+
+        A document's own metadata is part of its key, so retagging an
+        unchanged file rewrites its chunks.
+        """
+        key = f"{self.config.embedding_model}:{self.config.chunk_size}:{self.config.chunk_overlap}"
+        if metadata:
+            key += ":" + json.dumps(metadata, sort_keys=True)
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    def _delete_sources(self, sources: list[str]) -> None:
+        """Remove every chunk (and vector) belonging to the given sources."""
+        params = [(source,) for source in sources]
+        if self.config.backend == "sqlite_vec" and self._has_vec_table():
+            self._db.executemany(
+                "DELETE FROM chunks_vec WHERE rowid IN (SELECT rowid FROM chunks WHERE source = ?)",
+                params,
+            )
+        self._db.executemany("DELETE FROM chunks WHERE source = ?", params)
+
+    def _record_documents(
+        self, files: list[tuple[ChunkedFile, int | None]], index_key: Callable[[str], str]
+    ) -> None:
+        """Upsert (file, chunk count) fingerprints; a None count keeps the stored one."""
+        now = time.time()
+        self._db.executemany(
+            """
+            INSERT INTO documents
+                (path, size, mtime_ns, content_hash, index_key, chunk_count, indexed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                size = excluded.size,
+                mtime_ns = excluded.mtime_ns,
+                content_hash = excluded.content_hash,
+                index_key = excluded.index_key,
+                chunk_count = CASE WHEN excluded.chunk_count < 0
+                    THEN documents.chunk_count ELSE excluded.chunk_count END,
+                indexed_at = excluded.indexed_at
+            """,
+            [
+                (
+                    f.path, f.size, f.mtime_ns, f.content_hash, index_key(f.path),
+                    count if count is not None else -1, now,
+                )
+                for f, count in files
+            ],
+        )
+
+    def index_document(
+        self, path: str, force: bool = False, metadata: DocumentMetadata | None = None
+    ) -> int:
+        """Index a single document. Returns 0 if it is unchanged since the last run.
+
+        `metadata` is stored on every chunk (next to `filename`) for
+        EvidenceFilter.metadata, e.g. {"product": "api", "version": "2.1"}.
+        """
         path_obj = Path(path)
         if not path_obj.exists():
             raise FileNotFoundError(f"Document not found: {path}")
 
-        text = path_obj.read_text(encoding="utf-8", errors="ignore")
-        chunks = self._chunk_text(text)
+        metadata_fn = (lambda _: metadata) if metadata else None
+        return self._index_paths([str(path)], force=force, metadata_fn=metadata_fn).chunks_indexed
 
-        if not chunks:
-            return 0
+    @_writes
+    def remove_document(self, path: str) -> None:
+        """Drop a document and its chunks from the index."""
+        self._delete_sources([path])
+        self._db.execute("DELETE FROM documents WHERE path = ?", (path,))
+        self._bump_generation()
+        self._db.commit()
+        self._invalidate_matrix()
 
-        embeddings = self._embed(chunks)
+    def _walk(self, root: Path, extensions: list[str]) -> list[str]:
+        """Single directory walk collecting files with a matching extension."""
+        suffixes = tuple(extensions)
+        paths = []
+        for dirpath, _, filenames in os.walk(root):
+            paths.extend(os.path.join(dirpath, f) for f in filenames if f.endswith(suffixes))
+        return sorted(paths)
 
-        for i, (chunk, emb) in enumerate(zip(chunks, embeddings)):
-            chunk_id = self._generate_chunk_id(str(path), i, chunk)
+    def _chunked_files(self, jobs: list[tuple[str, str | None]]) -> Iterator[ChunkedFile]:
+        """Read and chunk (path, known hash) jobs, in a process pool when configured, in order."""
+        size, overlap = self.config.chunk_size, self.config.chunk_overlap
+        workers = self.config.index_workers or os.cpu_count() or 1
 
-            self._db.execute(
-                """
-                INSERT OR REPLACE INTO chunks (id, text, source, chunk_index, embedding, metadata)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    chunk_id,
-                    chunk,
-                    str(path),
-                    i,
-                    emb.tobytes(),
-                    json.dumps({"filename": path_obj.name}),
-                ),
+        if workers == 1 or len(jobs) < 2:
+            for path, known_hash in jobs:
+                yield read_and_chunk(path, size, overlap, known_hash)
+            return
+
+        # Spawned, not forked: a fork would copy the loaded model, the reader pool's open
+        # SQLite connections and locks held by other threads into every worker
+        spawn = multiprocessing.get_context("spawn")
+        # Bounded window of in-flight files so chunk text never piles up ahead of the encoder
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+            window: deque[Future] = deque()
+            job_iter = iter(jobs)
+            for path, known_hash in job_iter:
+                window.append(pool.submit(read_and_chunk, path, size, overlap, known_hash))
+                if len(window) >= workers * 4:
+                    break
+            while window:
+                yield window.popleft().result()
+                job = next(job_iter, None)
+                if job is not None:
+                    window.append(pool.submit(read_and_chunk, job[0], size, overlap, job[1]))
+
+    @_writes
+    def _index_paths(
+        self,
+        paths: list[str],
+        progress: Callable[[IndexProgress], None] | None = None,
+        force: bool = False,
+        metadata_fn: Callable[[str], DocumentMetadata] | None = None,
+    ) -> IndexProgress:
+        """
+        Incrementally index files.
+
+        Files whose size and mtime match the `documents` table are skipped
+        without being opened. Files whose stat changed but whose content hash
+        did not only get their fingerprint refreshed. Changed files have all
+        of their old chunks replaced, so shrunk documents leave no orphans.
+
+        Files up to `stream_threshold_bytes` are read and chunked whole by
+        the worker pool. Larger ones are streamed in the calling process and
+        flushed in `index_batch_size` batches as they are chunked, so memory
+        is bounded by the batch size rather than the file size.
+
+        `metadata_fn(path)` returns extra metadata stored on each of the
+        file's chunks.
+        """
+        extra = {path: metadata_fn(path) for path in paths} if metadata_fn else {}
+        default_key = self._index_key()
+        index_keys = {path: self._index_key(meta) for path, meta in extra.items() if meta}
+
+        def index_key(path: str) -> str:
+            return index_keys.get(path, default_key)
+
+        known = {} if force else {
+            row[0]: row[1:]
+            for row in self._db.execute(
+                "SELECT path, size, mtime_ns, content_hash, index_key FROM documents"
             )
+        }
 
-        self._db.commit()
-        return len(chunks)
+        state = IndexProgress(files_total=len(paths))
+        small: list[tuple[str, str | None]] = []
+        large: list[tuple[str, str | None]] = []
+        for file_path in paths:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                small.append((file_path, None))  # Let the reader report it
+                continue
+
+            doc = known.get(file_path)
+            known_hash = None
+            if doc is not None and doc[3] == index_key(file_path):
+                if (st.st_size, st.st_mtime_ns) == (doc[0], doc[1]):
+                    state.files_done += 1
+                    state.files_skipped += 1
+                    continue
+                known_hash = doc[2]
+
+            if st.st_size > self.config.stream_threshold_bytes:
+                large.append((file_path, known_hash))
+            else:
+                small.append((file_path, known_hash))
+
+        started = time.perf_counter()
+        pending: list[tuple[str, str, int, str]] = []
+        starting: list[str] = []  # Files whose old chunks go in the next flush
+        finished: list[tuple[ChunkedFile, int | None]] = []  # Fingerprints to record
+        patched = False
 
-    def index_directory(self, path: str, extensions: list[str] | None = None) -> int:
-        """Index all documents in a directory."""
-        extensions = extensions or [".txt", ".md", ".py", ".js", ".ts", ".json", ".yaml", ".yml"]
+        def flush() -> None:
+            nonlocal patched
+            if pending or starting or finished:
+                rows = self._embed_rows(pending) if pending else []
+                changed = bool(rows or starting)
+                # Patch a loaded matrix with this batch rather than reloading the corpus per flush
+                patch = changed and self._matrix_state is not None
+                removed = self._source_rowids(starting) if patch else None
+                self._delete_sources(starting)
+                last_rowid = self._max_rowid() if patch else 0
+                self._write_chunks(rows)
+                added = self._rows_after(last_rowid) if patch else []
+                self._record_documents(finished, index_key)
+                if changed:
+                    generation = self._bump_generation()
+                if patch:
+                    # Queries that see the new generation wait for the patch instead of reloading
+                    with self._matrix_lock:
+                        self._db.commit()
+                        self._patch_matrix(generation, removed, added)
+                    patched = True
+                else:
+                    self._db.commit()
+                    if changed:
+                        self._invalidate_matrix()
+                state.chunks_indexed += len(pending)
+                pending.clear()
+                starting.clear()
+                finished.clear()
+            state.elapsed_seconds = time.perf_counter() - started
+            if progress is not None:
+                progress(state.model_copy())
+
+        def add_chunks(source: str, chunks: Iterable[str]) -> int:
+            starting.append(source)
+            metadata = json.dumps({**extra.get(source, {}), "filename": Path(source).name})
+            count = 0
+            for count, text in enumerate(chunks, start=1):
+                pending.append((text, source, count - 1, metadata))
+                if len(pending) >= self.config.index_batch_size:
+                    flush()
+            return count
+
+        def failed(file_path: str, error: object) -> None:
+            state.files_failed += 1
+            print(f"Warning: Failed to index {file_path}: {error}")
+
+        for chunked in self._chunked_files(small):
+            state.files_done += 1
+            if chunked.error is not None:
+                failed(chunked.path, chunked.error)
+            elif chunked.chunks is None:
+                state.files_skipped += 1
+                finished.append((chunked, None))
+            else:
+                finished.append((chunked, add_chunks(chunked.path, chunked.chunks)))
+
+        size, overlap = self.config.chunk_size, self.config.chunk_overlap
+        for file_path, known_hash in large:
+            state.files_done += 1
+            try:
+                st = os.stat(file_path)
+                if known_hash is not None and file_sha256(file_path) == known_hash:
+                    state.files_skipped += 1
+                    fingerprint = (st.st_size, st.st_mtime_ns, known_hash)
+                    finished.append((ChunkedFile(file_path, *fingerprint, None), None))
+                    continue
+                reader = DocumentReader(file_path)
+                count = add_chunks(file_path, iter_chunks(reader, size, overlap))
+            except OSError as e:
+                # Partially written chunks stay unrecorded, so the next run redoes the file
+                failed(file_path, e)
+                continue
+            fingerprint = (st.st_size, st.st_mtime_ns, reader.hexdigest())
+            finished.append((ChunkedFile(file_path, *fingerprint, None), count))
+
+        flush()
+        if patched and self.config.mmap_sidecar:
+            self._invalidate_matrix()  # Rewrite and map the sidecar once, not per batch
+        return state
+
+    @_writes
+    def _prune(self, root: Path, extensions: list[str], seen: set[str]) -> int:
+        """Delete documents under root that match extensions but no longer exist."""
+        prefix = os.path.join(str(root), "")
+        suffixes = tuple(extensions)
+        rows = self._db.execute(
+            """
+            SELECT path FROM documents WHERE substr(path, 1, ?) = ?
+            UNION SELECT DISTINCT source FROM chunks WHERE substr(source, 1, ?) = ?
+            """,
+            (len(prefix), prefix, len(prefix), prefix),
+        ).fetchall()
+        stale = [p for (p,) in rows if p.endswith(suffixes) and p not in seen]
+        if stale:
+            self._delete_sources(stale)
+            self._db.executemany("DELETE FROM documents WHERE path = ?", [(p,) for p in stale])
+            self._bump_generation()
+            self._db.commit()
+            self._invalidate_matrix()
+        return len(stale)
+
+    def index_directory(
+        self,
+        path: str,
+        extensions: list[str] | None = None,
+        progress: Callable[[IndexProgress], None] | None = None,
+        force: bool = False,
+        metadata_fn: Callable[[str], DocumentMetadata] | None = None,
+    ) -> int:
+        """
+        Index all documents in a directory.
+
+        Walks the tree once, skips files that are unchanged since the last
+        run, reads and chunks the rest in worker processes, embeds chunks in
+        cross-document batches of `index_batch_size` and writes each batch in
+        one transaction. Chunks of files that were deleted from the directory
+        are removed. `progress` is called after every batch and once at the
+        end. `metadata_fn(path)` tags each file's chunks, as in
+        index_document. Returns the number of chunks (re-)embedded.
+        """
+        extensions = extensions or DEFAULT_EXTENSIONS
         path_obj = Path(path)
 
         if not path_obj.exists():
             raise FileNotFoundError(f"Directory not found: {path}")
 
-        total_chunks = 0
-        for ext in extensions:
-            for file_path in path_obj.rglob(f"*{ext}"):
-                try:
-                    total_chunks += self.index_document(str(file_path))
-                except Exception as e:
-                    print(f"Warning: Failed to index {file_path}: {e}")
+        paths = self._walk(path_obj, extensions)
+        removed = self._prune(path_obj, extensions, set(paths))
 
-        return total_chunks
+        def report(state: IndexProgress) -> None:
+            state.files_removed = removed
+            if progress is not None:
+                progress(state)
 
-    def retrieve(self, claim: str, top_k: int | None = None) -> list[EvidenceChunk]:
-        """Retrieve evidence chunks relevant to a claim."""
-        top_k = top_k or self.config.top_k
+        return self._index_paths(paths, report, force, metadata_fn).chunks_indexed
+
+    def _generation(self) -> int:
+        """Write counter shared by every process that opens this database."""
+        with self._reader() as db:
+            row = db.execute("SELECT value FROM store_meta WHERE key = 'generation'").fetchone()
+        return int(row[0]) if row else 0
+
+    def _bump_generation(self) -> int:
+        """Mark cached matrices and sidecars stale; call inside the write transaction.
 
-        # Get all chunks from DB
-        cursor = self._db.execute(
-            "SELECT id, text, source, chunk_index, embedding, metadata FROM chunks"
+        Returns the new generation.
+        """
+        self._db.execute(
+            "UPDATE store_meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'generation'"
         )
-        rows = cursor.fetchall()
+        row = self._db.execute("SELECT value FROM store_meta WHERE key = 'generation'").fetchone()
+        return int(row[0])
 
-        if not rows:
-            return []  # No evidence is a valid signal
+    def _invalidate_matrix(self) -> None:
+        """Drop the cached embedding matrix so the next query rebuilds it."""
+        self._matrix_state = None
 
-        # Embed the claim
-        query_emb = self._embed([claim])[0]
+    def _source_rowids(self, sources: list[str]) -> np.ndarray:
+        """Rowids of the chunks of the given sources, as seen by the writer."""
+        rowids: list[int] = []
+        for source in sources:
+            cursor = self._db.execute("SELECT rowid FROM chunks WHERE source = ?", (source,))
+            rowids.extend(rowid for (rowid,) in cursor)
+        return np.asarray(rowids, dtype=np.int64)
 
-        # Compute similarities
-        results = []
-        for row in rows:
-            chunk_id, text, source, chunk_index, emb_bytes, metadata_str = row
-            doc_emb = np.frombuffer(emb_bytes, dtype=np.float32)
-            similarity = float(np.dot(query_emb, doc_emb))
+    def _max_rowid(self) -> int:
+        (rowid,) = self._db.execute("SELECT IFNULL(MAX(rowid), 0) FROM chunks").fetchone()
+        return rowid
+
+    def _rows_after(self, rowid: int) -> list[tuple[int, bytes]]:
+        """(rowid, embedding) of the chunks inserted after `rowid` was the largest one."""
+        return self._db.execute(
+            "SELECT rowid, embedding FROM chunks WHERE rowid > ? ORDER BY rowid", (rowid,)
+        ).fetchall()
+
+    def _patch_matrix(
+        self, generation: int, removed: np.ndarray, added: list[tuple[int, bytes]]
+    ) -> None:
+        """Carry the cached matrix across one committed write instead of reloading it.
+
+        `removed` are the rowids the write deleted and `added` the rows it
+        inserted, which SQLite numbers above every surviving rowid, so the
+        result stays sorted. Only a matrix of the generation just before the
+        write can be patched; any other (say, another process wrote in
+        between) is dropped. Call holding `_matrix_lock`.
+        """
+        state = self._matrix_state
+        if state is None or state[0] != generation - 1:
+            self._matrix_state = None
+            return
+        _, matrix, rowids = state
+        if len(removed):
+            keep = np.flatnonzero(~np.isin(rowids, removed))
+            matrix, rowids = matrix[keep], rowids[keep]
+        if added:
+            block = self._decode_blobs(added)
+            mode = self.config.quantization
+            if mode != "none":
+                block = QuantizedMatrix(*QuantizedMatrix.encode(block, mode))
+            if len(rowids) == 0:
+                matrix = block
+            elif isinstance(matrix, QuantizedMatrix):
+                matrix = matrix.append(block)
+            else:
+                matrix = np.concatenate([matrix, block])
+            rowids = np.concatenate(
+                [rowids, np.fromiter((row[0] for row in added), np.int64, len(added))]
+            )
+        self._matrix_state = (generation, matrix, rowids)
+
+    def _load_matrix(self) -> tuple[Matrix, np.ndarray]:
+        """Return the embedding matrix and the chunk rowid of each of its rows."""
+        # Label the matrix with the generation of the snapshot it was read from
+        with self._snapshot():
+            generation = self._generation()
+            state = self._matrix_state
+            if state is None or state[0] != generation:
+                with self._matrix_lock:  # One loader per store; other readers wait for it
+                    state = self._matrix_state
+                    if state is None or state[0] != generation:
+                        if self.config.mmap_sidecar:
+                            matrix, rowids = self._load_sidecar(generation)
+                        else:
+                            matrix, rowids = self._read_matrix()
+                        state = (generation, matrix, rowids)
+                        self._matrix_state = state
+        return state[1], state[2]
+
+    def _read_matrix(self) -> tuple[Matrix, np.ndarray]:
+        """Load every embedding into one contiguous matrix (rows aligned to rowids).
+
+        Quantized modes convert batch by batch so the full float32 matrix is
+        never materialized.
+        """
+        mode = self.config.quantization
+        rowids: list[int] = []
+        blobs: list[bytes] = []
+        codes: list[np.ndarray] = []
+        scales: list[np.ndarray] = []
+
+        with self._reader() as db:
+            cursor = db.execute("SELECT rowid, embedding FROM chunks ORDER BY rowid")
+            while batch := cursor.fetchmany(self._SIDECAR_BATCH):
+                rowids.extend(row[0] for row in batch)
+                if mode == "none":
+                    blobs.extend(row[1] for row in batch)
+                    continue
+                block_codes, block_scales = QuantizedMatrix.encode(self._decode_blobs(batch), mode)
+                codes.append(block_codes)
+                if block_scales is not None:
+                    scales.append(block_scales)
+
+        rowid_array = np.asarray(rowids, dtype=np.int64)
+        if mode != "none":
+            if not codes:
+                return np.empty((0, 0), dtype=np.float32), rowid_array
+            return (
+                QuantizedMatrix(np.concatenate(codes), np.concatenate(scales) if scales else None),
+                rowid_array,
+            )
+
+        if blobs:
+            dim = len(blobs[0]) // np.dtype(np.float32).itemsize
+            matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), dim)
+        else:
+            matrix = np.empty((0, 0), dtype=np.float32)
+
+        return matrix, rowid_array
+
+    @staticmethod
+    def _decode_blobs(rows: list[tuple[int, bytes]]) -> np.ndarray:
+        """Stack (rowid, float32 BLOB) rows into a (len(rows), dim) matrix."""
+        return np.frombuffer(b"".join(row[1] for row in rows), dtype=np.float32).reshape(
+            len(rows), -1
+        )
+
+    def _sidecar_paths(self) -> tuple[Path, Path, Path, Path]:
+        """Embedding matrix, int8 row scales, row -> chunk rowid map, and header next to db_path."""
+        base = Path(self.config.db_path)
+        return (
+            base.with_name(base.name + ".embeddings.npy"),
+            base.with_name(base.name + ".scales.npy"),
+            base.with_name(base.name + ".rowids.npy"),
+            base.with_name(base.name + ".sidecar.json"),
+        )
+
+    def _load_sidecar(self, generation: int) -> tuple[Matrix, np.ndarray]:
+        """Memory-map the sidecar, rebuilding it first if it is stale or in another format."""
+        matrix_path, scales_path, rowids_path, header_path = self._sidecar_paths()
+        mode = self.config.quantization
+
+        header: dict = {}
+        if header_path.exists():
+            try:
+                header = json.loads(header_path.read_text())
+            except (OSError, json.JSONDecodeError):
+                header = {}
+
+        if (
+            header.get("generation") != generation
+            or header.get("quantization", "none") != mode
+            or not matrix_path.exists()
+        ):
+            self._write_sidecar()
+            header = json.loads(header_path.read_text())
+            if header["generation"] != generation:
+                # Rebuilt from a newer snapshot than the caller's; stay on the caller's
+                return self._read_matrix()
+
+        if header["rows"] == 0:
+            return np.empty((0, 0), dtype=np.float32), np.empty(0, dtype=np.int64)
+
+        # Read-only maps are shared through the page cache across worker processes
+        matrix = np.load(matrix_path, mmap_mode="r")
+        rowids = np.load(rowids_path, mmap_mode="r")
+        if matrix.shape[0] != rowids.shape[0]:
+            # Caught a concurrent rewrite half-way; fall back to a heap copy this time
+            return self._read_matrix()
+        if mode == "int8":
+            return QuantizedMatrix(matrix, np.load(scales_path, mmap_mode="r")), rowids
+        if mode == "float16":
+            return QuantizedMatrix(matrix), rowids
+        return matrix, rowids
+
+    def _write_sidecar(self) -> None:
+        """Stream embeddings from SQLite into the sidecar without holding them on the heap."""
+        header_path = self._sidecar_paths()[3]
+        suffix = f".tmp{os.getpid()}"
+        mode = self.config.quantization
+
+        # The header generation, COUNT and row stream must all come from one snapshot
+        with self._snapshot() as db:
+            generation = self._generation()
+            n_rows, dim = self._stream_sidecar(db, mode, suffix)
+
+        tmp_header = header_path.with_name(header_path.name + suffix)
+        tmp_header.write_text(
+            json.dumps(
+                {"generation": generation, "rows": n_rows, "dim": dim, "quantization": mode}
+            )
+        )
+        os.replace(tmp_header, header_path)
+
+    def _stream_sidecar(
+        self, db: sqlite3.Connection, mode: QuantizationMode, suffix: str
+    ) -> tuple[int, int]:
+        """Write the sidecar arrays from one read snapshot; returns (rows, dim)."""
+        matrix_path, scales_path, rowids_path, _ = self._sidecar_paths()
+        dtype = {"none": np.float32, "int8": np.int8, "float16": np.float16}[mode]
+
+        (n_rows,) = db.execute("SELECT COUNT(*) FROM chunks").fetchone()
+        first = db.execute("SELECT embedding FROM chunks LIMIT 1").fetchone()
+        dim = len(first[0]) // np.dtype(np.float32).itemsize if first else 0
+
+        if n_rows:
+            outputs = [(matrix_path, dtype, (n_rows, dim)), (rowids_path, np.int64, (n_rows,))]
+            if mode == "int8":
+                outputs.append((scales_path, np.float32, (n_rows,)))
+            tmp_paths = [path.with_name(path.name + suffix) for path, _, _ in outputs]
+            maps = [
+                np.lib.format.open_memmap(tmp, mode="w+", dtype=dt, shape=shape)
+                for tmp, (_, dt, shape) in zip(tmp_paths, outputs)
+            ]
+            matrix, rowids = maps[0], maps[1]
+
+            cursor = db.execute("SELECT rowid, embedding FROM chunks ORDER BY rowid")
+            offset = 0
+            while batch := cursor.fetchmany(self._SIDECAR_BATCH):
+                end = offset + len(batch)
+                rowids[offset:end] = [row[0] for row in batch]
+                block = self._decode_blobs(batch)
+                if mode == "none":
+                    matrix[offset:end] = block
+                else:
+                    codes, scales = QuantizedMatrix.encode(block, mode)
+                    matrix[offset:end] = codes
+                    if scales is not None:
+                        maps[2][offset:end] = scales
+                offset = end
+
+            for mapped in maps:
+                mapped.flush()
+            del matrix, rowids, maps
+            for tmp, (path, _, _) in zip(tmp_paths, outputs):
+                os.replace(tmp, path)
+        return n_rows, dim
+
+    def _top_k(self, scores: np.ndarray, top_k: int, threshold: float | None = None) -> np.ndarray:
+        """Indices of the top_k scores above threshold (default: the configured one), best first."""
+        if threshold is None:
+            threshold = self.config.similarity_threshold
+        candidates = np.flatnonzero(scores >= threshold)
+        if len(candidates) > top_k:
+            part = np.argpartition(scores[candidates], -top_k)[-top_k:]
+            candidates = candidates[part]
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
 
-            if similarity >= self.config.similarity_threshold:
-                results.append(
+    def _fetch_chunks(self, hits: list[list[tuple[int, float]]]) -> list[list[EvidenceChunk]]:
+        """Materialize EvidenceChunk objects for the selected (rowid, score) hits only."""
+        wanted = sorted({rowid for claim_hits in hits for rowid, _ in claim_hits})
+        rows: dict[int, tuple] = {}
+        with self._reader() as db:
+            for start in range(0, len(wanted), self._SQL_BATCH):
+                batch = wanted[start : start + self._SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                cursor = db.execute(
+                    f"SELECT rowid, id, text, source, chunk_index, metadata FROM chunks "
+                    f"WHERE rowid IN ({placeholders})",
+                    batch,
+                )
+                rows.update((row[0], row[1:]) for row in cursor)
+
+        results = []
+        for claim_hits in hits:
+            chunks = []
+            for rowid, score in claim_hits:
+                if rowid not in rows:
+                    continue
+                chunk_id, text, source, chunk_index, metadata_str = rows[rowid]
+                chunks.append(
                     EvidenceChunk(
                         id=chunk_id,
                         text=text,
                         source=source,
-                        similarity_score=similarity,
+                        # Guard float drift on exact matches; lexical-only hits can be negative
+                        similarity_score=min(max(score, 0.0), 1.0),
                         chunk_index=chunk_index,
                         metadata=json.loads(metadata_str),
                     )
                 )
+            results.append(chunks)
+        return results
+
+    def warm_up(self) -> None:
+        """Load the encoder and scan matrix now instead of on the first query."""
+        self._embed(["warm up"])
+        if self.config.backend != "sqlite_vec":
+            self._load_matrix()
+
+    def retrieve(
+        self, claim: str, top_k: int | None = None, filters: EvidenceFilter | None = None
+    ) -> list[EvidenceChunk]:
+        """Retrieve evidence chunks relevant to a claim."""
+        return self.retrieve_many([claim], top_k, filters)[0]
+
+    def retrieve_many(
+        self,
+        claims: list[str],
+        top_k: int | None = None,
+        filters: EvidenceFilter | None = None,
+    ) -> list[list[EvidenceChunk]]:
+        """
+        Retrieve evidence for several claims with one encoder call.
+
+        In "hybrid" mode the cosine and BM25 rankings (each
+        `hybrid_candidates` deep) are fused with reciprocal rank fusion.
+        Lexical-only hits bypass `similarity_threshold` but still report
+        their cosine similarity.
+
+        `filters` is applied before scoring: only the chunks it selects are
+        scored, so a narrow filter makes the query cheaper.
+        """
+        top_k = top_k or self.config.top_k
+        if not claims:
+            return []
+        if self._is_empty():
+            return [[] for _ in claims]  # No evidence is a valid signal
+
+        return self._search(claims, self._embed_queries(claims), top_k, filters)
+
+    def _is_empty(self) -> bool:
+        """True if there is nothing to search (checked before paying for encoding)."""
+        if self.config.backend == "sqlite_vec":
+            with self._reader() as db:
+                return not self._has_vec_table(db)
+        return len(self._load_matrix()[1]) == 0
+
+    def _search(
+        self,
+        claims: list[str],
+        query_embs: np.ndarray,
+        top_k: int,
+        filters: EvidenceFilter | None = None,
+    ) -> list[list[EvidenceChunk]]:
+        """Rank chunks for already-embedded claims, reading one database snapshot."""
+        if filters is not None and filters.is_empty:
+            filters = None
+        with self._snapshot():
+            return self._search_snapshot(claims, query_embs, top_k, filters)
+
+    def _search_snapshot(
+        self,
+        claims: list[str],
+        query_embs: np.ndarray,
+        top_k: int,
+        filters: EvidenceFilter | None,
+    ) -> list[list[EvidenceChunk]]:
+        allowed = None
+        if filters is not None:
+            allowed = self._filtered_rowids(filters)
+            if len(allowed) == 0:
+                return [[] for _ in claims]
+
+        hybrid = self.config.search_mode == "hybrid"
+        pool = max(top_k, self.config.hybrid_candidates) if hybrid else top_k
+
+        # Only the brute-force scan narrows to BM25 candidates; vec0 ignores the prefilter
+        prefilter = self.config.lexical_prefilter if self.config.backend == "brute_force" else 0
+        lexical = None
+        if hybrid or prefilter:
+            depth = max(pool if hybrid else 0, prefilter)
+            lexical = self._search_lexical(claims, depth, filters)
+
+        if self.config.backend == "sqlite_vec":
+            if allowed is not None:
+                # vec0 cannot filter inside its KNN scan; score the selected rows exactly
+                dense = self._search_rows(query_embs, pool, allowed)
+            else:
+                dense = self._search_vec(query_embs, pool)
+        else:
+            candidates = lexical if prefilter else None
+            dense = self._search_matrix(query_embs, pool, candidates, allowed)
+
+        if hybrid:
+            hits = [
+                self._fuse(query_emb, dense_hits, lexical_hits[:pool], top_k)
+                for query_emb, dense_hits, lexical_hits in zip(query_embs, dense, lexical)
+            ]
+        else:
+            hits = dense
+
+        return self._fetch_chunks(hits)
+
+    def _fts_query(self, claim: str) -> str:
+        """OR of the claim's words, each quoted so "3.12" is matched as the phrase 3 12."""
+        words = (w.replace('"', "") for w in claim.split())
+        return " OR ".join(dict.fromkeys(f'"{w}"' for w in words if _WORD.search(w)))
+
+    def _search_lexical(
+        self, claims: list[str], limit: int, filters: EvidenceFilter | None = None
+    ) -> list[list[int]]:
+        """BM25-ranked rowids per claim from the FTS5 index."""
+        where, params = self._filter_sql(filters)
+        restrict = f" AND rowid IN (SELECT rowid FROM chunks WHERE {where})" if where else ""
+        hits: list[list[int]] = []
+        with self._reader() as db:
+            for claim in claims:
+                query = self._fts_query(claim)
+                if not query:
+                    hits.append([])
+                    continue
+                cursor = db.execute(
+                    f"SELECT rowid FROM chunks_fts WHERE chunks_fts MATCH ?{restrict} "
+                    f"ORDER BY rank LIMIT ?",
+                    (query, *params, limit),
+                )
+                hits.append([rowid for (rowid,) in cursor])
+        return hits
+
+    @staticmethod
+    def _filter_sql(filters: EvidenceFilter | None) -> tuple[str, list[Any]]:
+        """WHERE clause over `chunks` selecting the filtered rows ("" for no filter)."""
+        if filters is None:
+            return "", []
+        conditions: list[str] = []
+        params: list[Any] = []
+        if filters.source_prefix:
+            # A range on `source` is served by idx_source
+            conditions.append("source >= ?")
+            params.append(filters.source_prefix)
+            upper = _prefix_upper_bound(filters.source_prefix)
+            if upper is not None:
+                conditions.append("source < ?")
+                params.append(upper)
+        if filters.filename_glob:
+            conditions.append("json_extract(metadata, '$.filename') GLOB ?")
+            params.append(filters.filename_glob)
+        for key, value in sorted(filters.metadata.items()):
+            if not key or '"' in key:
+                raise ValueError(f"Invalid metadata filter key: {key!r}")
+            conditions.append("json_extract(metadata, ?) IS ?")
+            params.extend([f'$."{key}"', value])
+        return " AND ".join(conditions), params
+
+    def _filtered_rowids(self, filters: EvidenceFilter) -> np.ndarray:
+        """Sorted rowids selected by the filter, cached until the next write."""
+        key = (self._generation(), filters.cache_key())
+        rowids = self._filter_cache.get(key)
+        if rowids is None:
+            where, params = self._filter_sql(filters)
+            with self._reader() as db:
+                cursor = db.execute(
+                    f"SELECT rowid FROM chunks WHERE {where} ORDER BY rowid", params
+                )
+                rowids = np.fromiter((row[0] for row in cursor), dtype=np.int64)
+            self._filter_cache.put(key, rowids)
+        return rowids
+
+    def _search_matrix(
+        self,
+        query_embs: np.ndarray,
+        top_k: int,
+        candidates: list[list[int]] | None = None,
+        allowed: np.ndarray | None = None,
+    ) -> list[list[tuple[int, float]]]:
+        """
+        Score claims x chunks as one matrix product (blocked to bound memory).
+
+        With `candidates`, each claim is scored only against its own rowids;
+        claims without candidates fall back to the full matrix. With
+        `allowed` (sorted rowids), only those rows are scored at all.
+        """
+        matrix, rowids = self._load_matrix()
+        if allowed is not None:
+            matrix, rowids = self._select_rows(matrix, rowids, allowed)
+            if len(rowids) == 0:
+                return [[] for _ in query_embs]
+        hits: list[list[tuple[int, float]]] = []
+
+        # Quantized scores pick an oversampled pool that is re-ranked exactly in float32
+        quantized = isinstance(matrix, QuantizedMatrix)
+        pool = max(top_k, self.config.rescore_candidates) if quantized else top_k
+        threshold = -np.inf if quantized else None
+
+        if candidates is not None:
+            for query_emb, claim_rowids in zip(query_embs, candidates):
+                if not claim_rowids:
+                    hits.extend(self._search_matrix(query_emb[None, :], top_k, None, allowed))
+                    continue
+                idx = self._positions(rowids, np.asarray(claim_rowids, dtype=rowids.dtype))
+                scores = self._score(query_emb[None, :], matrix[idx])[:, 0]
+                best = self._top_k(scores, pool, threshold)
+                hits.append([(int(rowids[idx[b]]), float(scores[b])) for b in best])
+        else:
+            block = max(1, self._SCORE_BLOCK // len(rowids))
+            for start in range(0, len(query_embs), block):
+                scores = self._score(query_embs[start : start + block], matrix).T
+                for claim_scores in scores:
+                    best = self._top_k(claim_scores, pool, threshold)
+                    hits.append(
+                        [(int(r), float(s)) for r, s in zip(rowids[best], claim_scores[best])]
+                    )
+
+        if quantized:
+            hits = [
+                self._rescore(query_emb, claim_hits, top_k)
+                for query_emb, claim_hits in zip(query_embs, hits)
+            ]
+        return hits
+
+    @staticmethod
+    def _positions(rowids: np.ndarray, wanted: np.ndarray) -> np.ndarray:
+        """Indices into sorted `rowids` of the wanted rowids it contains."""
+        if len(rowids) == 0:
+            return np.empty(0, dtype=np.int64)
+        idx = np.minimum(np.searchsorted(rowids, wanted), len(rowids) - 1)
+        return idx[rowids[idx] == wanted]  # Skip rows newer than the loaded matrix
+
+    def _select_rows(
+        self, matrix: Matrix, rowids: np.ndarray, allowed: np.ndarray
+    ) -> tuple[Matrix, np.ndarray]:
+        """The rows of a loaded matrix whose rowids are in `allowed`."""
+        idx = self._positions(rowids, allowed)
+        return matrix[idx], rowids[idx]
+
+    def _search_rows(
+        self, query_embs: np.ndarray, top_k: int, rowids: np.ndarray
+    ) -> list[list[tuple[int, float]]]:
+        """Exact top-k over specific chunks, scored from their stored embeddings."""
+        found: list[int] = []
+        blobs: list[bytes] = []
+        with self._reader() as db:
+            for start in range(0, len(rowids), self._SQL_BATCH):
+                batch = rowids[start : start + self._SQL_BATCH].tolist()
+                placeholders = ",".join("?" * len(batch))
+                cursor = db.execute(
+                    f"SELECT rowid, embedding FROM chunks WHERE rowid IN ({placeholders})", batch
+                )
+                for rowid, emb in cursor:
+                    found.append(rowid)
+                    blobs.append(emb)
+        if not found:
+            return [[] for _ in query_embs]
 
-        # Sort by similarity and return top_k
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
-        return results[:top_k]
+        matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(found), -1)
+        found_rowids = np.asarray(found, dtype=np.int64)
+        hits = []
+        for claim_scores in self._cosine_similarity(query_embs, matrix).T:
+            best = self._top_k(claim_scores, top_k)
+            hits.append(
+                [(int(r), float(s)) for r, s in zip(found_rowids[best], claim_scores[best])]
+            )
+        return hits
+
+    def _score(self, query_embs: np.ndarray, matrix: Matrix) -> np.ndarray:
+        """(rows, claims) similarity scores; approximate for quantized matrices."""
+        if isinstance(matrix, QuantizedMatrix):
+            return matrix.score(query_embs)
+        return self._cosine_similarity(query_embs, matrix)
+
+    def _rescore(
+        self, query_emb: np.ndarray, approx_hits: list[tuple[int, float]], top_k: int
+    ) -> list[tuple[int, float]]:
+        """Exact float32 re-ranking of an approximate candidate pool from the stored BLOBs."""
+        exact = self._score_rows(query_emb, [rowid for rowid, _ in approx_hits])
+        ranked = sorted(
+            (item for item in exact.items() if item[1] >= self.config.similarity_threshold),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return ranked[:top_k]
+
+    def _search_vec(self, query_embs: np.ndarray, top_k: int) -> list[list[tuple[int, float]]]:
+        """KNN queries pushed down into the sqlite-vec index."""
+        hits: list[list[tuple[int, float]]] = []
+        with self._reader() as db:
+            for query_emb in query_embs:
+                cursor = db.execute(
+                    "SELECT rowid, distance FROM chunks_vec "
+                    "WHERE embedding MATCH ? AND k = ? ORDER BY distance",
+                    (query_emb.tobytes(), top_k),
+                )
+                claim_hits = []
+                for rowid, distance in cursor:
+                    similarity = 1.0 - float(distance)
+                    if similarity >= self.config.similarity_threshold:
+                        claim_hits.append((rowid, similarity))
+                hits.append(claim_hits)
+        return hits
 
+    def _fuse(
+        self,
+        query_emb: np.ndarray,
+        dense_hits: list[tuple[int, float]],
+        lexical_hits: list[int],
+        top_k: int,
+    ) -> list[tuple[int, float]]:
+        """Reciprocal rank fusion of one claim's dense and BM25 rankings."""
+        k = self.config.rrf_k
+        fused: dict[int, float] = defaultdict(float)
+        for rank, (rowid, _) in enumerate(dense_hits, start=1):
+            fused[rowid] += 1.0 / (k + rank)
+        for rank, rowid in enumerate(lexical_hits, start=1):
+            fused[rowid] += 1.0 / (k + rank)
+
+        ranked = sorted(fused, key=lambda rowid: (-fused[rowid], rowid))[:top_k]
+        similarity = dict(dense_hits)
+        missing = [rowid for rowid in ranked if rowid not in similarity]
+        similarity.update(self._score_rows(query_emb, missing))
+        return [(rowid, similarity[rowid]) for rowid in ranked]
+
+    def _score_rows(self, query_emb: np.ndarray, rowids: list[int]) -> dict[int, float]:
+        """Cosine similarity for specific chunks, read from their stored embeddings."""
+        scores: dict[int, float] = {}
+        with self._reader() as db:
+            for start in range(0, len(rowids), self._SQL_BATCH):
+                batch = rowids[start : start + self._SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                cursor = db.execute(
+                    f"SELECT rowid, embedding FROM chunks WHERE rowid IN ({placeholders})", batch
+                )
+                for rowid, emb in cursor:
+                    scores[rowid] = float(np.frombuffer(emb, dtype=np.float32) @ query_emb)
+        return scores
+
+    @_writes
     def clear(self) -> None:
         """Clear all indexed documents."""
+        if self.config.backend == "sqlite_vec" and self._has_vec_table():
+            # Dropped rather than emptied so a new embedding model can change the dimension
+            self._db.execute("DROP TABLE chunks_vec")
         self._db.execute("DELETE FROM chunks")
+        self._db.execute("DELETE FROM documents")
+        self._bump_generation()
         self._db.commit()
+        self._invalidate_matrix()
 
     def stats(self) -> dict:
         """Get index statistics."""
-        cursor = self._db.execute("SELECT COUNT(*), COUNT(DISTINCT source) FROM chunks")
-        total_chunks, total_docs = cursor.fetchone()
-        return {"total_chunks": total_chunks, "total_documents": total_docs}
+        with self._reader() as db:
+            cursor = db.execute("SELECT COUNT(*), COUNT(DISTINCT source) FROM chunks")
+            total_chunks, total_docs = cursor.fetchone()
+            counters = dict(
+                db.execute(
+                    "SELECT key, CAST(value AS INTEGER) FROM store_meta "
+                    "WHERE key IN ('embeddings_encoded', 'embeddings_reused')"
+                ).fetchall()
+            )
+        encoded = counters.get("embeddings_encoded", 0)
+        reused = counters.get("embeddings_reused", 0)
+        return {
+            "total_chunks": total_chunks,
+            "total_documents": total_docs,
+            "embeddings_encoded": encoded,
+            "embeddings_reused": reused,
+            # Share of chunk embeddings served from the cache instead of the encoder
+            "embedding_dedup_ratio": reused / (encoded + reused) if encoded + reused else 0.0,
+            "query_cache": self._query_cache.stats() if self._query_cache is not None else None,
+        }
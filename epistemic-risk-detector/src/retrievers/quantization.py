@@ -0,0 +1,82 @@
+"""Compact in-memory embedding matrices for approximate first-pass scoring."""
+
+from typing import Literal
+
+import numpy as np
+
+QuantizationMode = Literal["none", "int8", "float16"]
+
+
+class QuantizedMatrix:
+    """Row-wise compressed embedding matrix.
+
+    int8 rows are stored as `codes[i] * scales[i]` with a symmetric
+    per-vector scale; float16 rows are stored as half floats with no scale.
+    `score` dequantizes one block of rows at a time, so the float32 working
+    set stays bounded regardless of corpus size.
+
+    This saves memory, not time. numpy has no BLAS kernel for half or int8
+    products, and computing them natively is slower still. Every scan pays
+    the widening cast on top of the float32 matmul.
+    """
+
+    _BLOCK_ROWS = 8192  # ~12 MB float32 working set at 384 dims
+
+    def __init__(self, codes: np.ndarray, scales: np.ndarray | None = None):
+        self.codes = codes
+        self.scales = scales
+
+    @staticmethod
+    def encode(rows: np.ndarray, mode: QuantizationMode) -> tuple[np.ndarray, np.ndarray | None]:
+        """Quantize float32 rows; returns (codes, per-row scales or None)."""
+        if mode == "float16":
+            return rows.astype(np.float16), None
+        if mode == "int8":
+            scales = np.abs(rows).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0  # All-zero rows stay zero
+            codes = np.rint(rows / scales[:, None]).astype(np.int8)
+            return codes, scales.astype(np.float32)
+        raise ValueError(f"Unknown quantization mode: {mode}")
+
+    @classmethod
+    def quantize(cls, matrix: np.ndarray, mode: QuantizationMode) -> "QuantizedMatrix":
+        return cls(*cls.encode(matrix, mode))
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.codes.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, idx) -> "QuantizedMatrix":
+        return QuantizedMatrix(
+            self.codes[idx], self.scales[idx] if self.scales is not None else None
+        )
+
+    def append(self, other: "QuantizedMatrix") -> "QuantizedMatrix":
+        """A new matrix with `other`'s rows (same mode) after this one's."""
+        scales = None
+        if self.scales is not None and other.scales is not None:
+            scales = np.concatenate([self.scales, other.scales])
+        return QuantizedMatrix(np.concatenate([self.codes, other.codes]), scales)
+
+    def dequantize(self, rows: slice = slice(None)) -> np.ndarray:
+        block = self.codes[rows].astype(np.float32)
+        if self.scales is not None:
+            block *= self.scales[rows, None]
+        return block
+
+    def score(self, queries: np.ndarray) -> np.ndarray:
+        """Approximate `matrix @ queries.T`, shape (rows, queries)."""
+        out = np.empty((len(self.codes), len(queries)), dtype=np.float32)
+        for start in range(0, len(self.codes), self._BLOCK_ROWS):
+            rows = slice(start, start + self._BLOCK_ROWS)
+            out[rows] = self.codes[rows].astype(np.float32) @ queries.T
+        if self.scales is not None:
+            out *= self.scales[:, None]  # Scale per row after the product, not per element
+        return out
@@ -0,0 +1,235 @@
+"""Evidence store partitioned across several SQLite files."""
+
+import hashlib
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from src.core.config import RetrievalConfig
+from src.core.interfaces import EvidenceProvider
+from src.core.schemas import DocumentMetadata, EvidenceChunk, EvidenceFilter, IndexProgress
+from src.retrievers.chunking import DEFAULT_EXTENSIONS
+from src.retrievers.local_vector import LocalVectorStore
+
+T = TypeVar("T")
+
+
+class _SharedEncoder:
+    """Loads the sentence transformer on first use; one instance serves every shard."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._model: Any = None
+        self._lock = threading.Lock()
+
+    def encode(self, *args, **kwargs):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(*args, **kwargs)
+
+
+class ShardedVectorStore(EvidenceProvider):
+    """
+    Drop-in replacement for LocalVectorStore that partitions chunks across
+    `retrieval.shards` SQLite files by a hash of the chunk source.
+
+    Every shard is a LocalVectorStore, safe to query from any thread.
+    Writes and queries fan out to the shards in parallel on one shared
+    thread pool (numpy scoring and SQLite release the GIL), and per-shard
+    top-k lists are merged. The pool has a writer plus `read_pool_size`
+    readers per shard, so concurrent retrieve calls search the same shard
+    at once instead of queuing. Claims are embedded once, through the first
+    shard's query cache, and the encoder is shared by all shards.
+    """
+
+    def __init__(self, config: RetrievalConfig):
+        self.config = config
+        n_shards = config.shards
+        # Split the read/chunk process budget between shards that index concurrently
+        workers = max(1, (config.index_workers or os.cpu_count() or 1) // n_shards)
+
+        # Matches each shard's connection budget: one writer and its read pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=n_shards * (config.read_pool_size + 1),
+            thread_name_prefix="evidence-shard",
+        )
+        self.shards: list[LocalVectorStore] = [
+            LocalVectorStore(
+                config.model_copy(
+                    update={"db_path": self.shard_path(i), "shards": 1, "index_workers": workers}
+                )
+            )
+            for i in range(n_shards)
+        ]
+        self._encoder = _SharedEncoder(config.embedding_model)
+
+    @property
+    def _encoder(self) -> Any:
+        return self._shared_encoder
+
+    @_encoder.setter
+    def _encoder(self, encoder: Any) -> None:
+        self._shared_encoder = encoder
+        for shard in self.shards:
+            shard._encoder = encoder
+
+    def shard_path(self, index: int) -> str:
+        """`evidence.db` -> `evidence.shard0.db`, next to the configured db_path."""
+        base = Path(self.config.db_path)
+        return str(base.with_name(f"{base.stem}.shard{index}{base.suffix}"))
+
+    def _shard_for(self, source: str) -> int:
+        digest = hashlib.sha256(source.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % len(self.shards)
+
+    def _fan_out(
+        self, call: Callable[[LocalVectorStore], T], shards: Iterable[int] | None = None
+    ) -> list[T]:
+        """Run call on each selected shard in the shared pool; results in shard order."""
+        indices = range(len(self.shards)) if shards is None else shards
+        futures = [self._executor.submit(call, self.shards[i]) for i in indices]
+        return [future.result() for future in futures]
+
+    def warm_up(self) -> None:
+        """Load the shared encoder and every shard's scan matrix."""
+        self._fan_out(lambda shard: shard.warm_up())
+
+    def retrieve(
+        self, claim: str, top_k: int | None = None, filters: EvidenceFilter | None = None
+    ) -> list[EvidenceChunk]:
+        """Retrieve evidence chunks relevant to a claim."""
+        return self.retrieve_many([claim], top_k, filters)[0]
+
+    def retrieve_many(
+        self,
+        claims: list[str],
+        top_k: int | None = None,
+        filters: EvidenceFilter | None = None,
+    ) -> list[list[EvidenceChunk]]:
+        """Embed claims once, search every non-empty shard in parallel, merge top-k."""
+        top_k = top_k or self.config.top_k
+        if not claims:
+            return []
+
+        empty = self._fan_out(lambda shard: shard._is_empty())
+        live = [i for i, is_empty in enumerate(empty) if not is_empty]
+        if not live:
+            return [[] for _ in claims]  # No evidence is a valid signal
+
+        query_embs = self.shards[0]._embed_queries(claims)
+        per_shard = self._fan_out(
+            lambda shard: shard._search(claims, query_embs, top_k, filters), live
+        )
+        return [
+            self._merge([results[i] for results in per_shard], top_k) for i in range(len(claims))
+        ]
+
+    def _merge(self, shard_results: list[list[EvidenceChunk]], top_k: int) -> list[EvidenceChunk]:
+        """Merge per-shard rankings.
+
+        Dense results merge on cosine similarity. Hybrid RRF scores are not
+        comparable across shards, so those interleave by per-shard rank.
+        """
+        ranked = [
+            (rank, chunk) for results in shard_results for rank, chunk in enumerate(results)
+        ]
+        if self.config.search_mode == "hybrid":
+            ranked.sort(key=lambda item: (item[0], -item[1].similarity_score))
+        else:
+            ranked.sort(key=lambda item: -item[1].similarity_score)
+        return [chunk for _, chunk in ranked[:top_k]]
+
+    def index_document(
+        self, path: str, force: bool = False, metadata: DocumentMetadata | None = None
+    ) -> int:
+        """Index a single document into the shard owning its path."""
+        return self._fan_out(
+            lambda shard: shard.index_document(path, force=force, metadata=metadata),
+            [self._shard_for(str(path))],
+        )[0]
+
+    def remove_document(self, path: str) -> None:
+        """Drop a document and its chunks from the index."""
+        self._fan_out(lambda shard: shard.remove_document(path), [self._shard_for(path)])
+
+    def index_directory(
+        self,
+        path: str,
+        extensions: list[str] | None = None,
+        progress: Callable[[IndexProgress], None] | None = None,
+        force: bool = False,
+        metadata_fn: Callable[[str], DocumentMetadata] | None = None,
+    ) -> int:
+        """
+        Index all documents in a directory, every shard writing in parallel.
+
+        `progress` receives totals summed over shards and may be called from
+        shard threads.
+        """
+        extensions = extensions or DEFAULT_EXTENSIONS
+        root = Path(path)
+
+        if not root.exists():
+            raise FileNotFoundError(f"Directory not found: {path}")
+
+        paths = self.shards[0]._walk(root, extensions)
+        groups: list[list[str]] = [[] for _ in self.shards]
+        for file_path in paths:
+            groups[self._shard_for(file_path)].append(file_path)
+
+        seen = set(paths)
+        removed = sum(self._fan_out(lambda shard: shard._prune(root, extensions, seen)))
+
+        latest = [IndexProgress(files_total=len(group)) for group in groups]
+        lock = threading.Lock()
+
+        def reporter(index: int) -> Callable[[IndexProgress], None]:
+            def report(state: IndexProgress) -> None:
+                with lock:
+                    latest[index] = state
+                    total = IndexProgress(
+                        files_total=sum(s.files_total for s in latest),
+                        files_done=sum(s.files_done for s in latest),
+                        files_failed=sum(s.files_failed for s in latest),
+                        files_skipped=sum(s.files_skipped for s in latest),
+                        files_removed=removed,
+                        chunks_indexed=sum(s.chunks_indexed for s in latest),
+                        elapsed_seconds=max(s.elapsed_seconds for s in latest),
+                    )
+                    if progress is not None:
+                        progress(total)
+
+            return report
+
+        futures = [
+            self._executor.submit(shard._index_paths, group, reporter(i), force, metadata_fn)
+            for i, (shard, group) in enumerate(zip(self.shards, groups))
+        ]
+        return sum(future.result().chunks_indexed for future in futures)
+
+    def clear(self) -> None:
+        """Clear all indexed documents in every shard."""
+        self._fan_out(lambda shard: shard.clear())
+
+    def stats(self) -> dict:
+        """Index statistics summed over shards."""
+        per_shard = self._fan_out(lambda shard: shard.stats())
+        encoded = sum(s["embeddings_encoded"] for s in per_shard)
+        reused = sum(s["embeddings_reused"] for s in per_shard)
+        return {
+            "total_chunks": sum(s["total_chunks"] for s in per_shard),
+            # Sources never span shards, so per-shard document counts add up
+            "total_documents": sum(s["total_documents"] for s in per_shard),
+            "embeddings_encoded": encoded,
+            "embeddings_reused": reused,
+            "embedding_dedup_ratio": reused / (encoded + reused) if encoded + reused else 0.0,
+            "query_cache": per_shard[0]["query_cache"],
+            "shards": len(self.shards),
+        }
@@ -0,0 +1,183 @@
+"""Long-lived HTTP API around one warm EpistemicRiskDetector."""
+
+import json
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from src.core.config import ServerConfig
+from src.evaluators.alignment import CascadeAlignmentEvaluator
+from src.pipeline import EpistemicRiskDetector
+
+
+class RequestError(Exception):
+    """A client error reported as a JSON body with the given HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server sharing one detector across all requests.
+
+    The encoder, scan matrix and database connections are loaded once at
+    startup, so requests only pay for extraction, retrieval and alignment.
+    Each connection is handled on its own thread. Batch requests go through
+    `analyze_batch`, so repeated claims share retrieval and alignment. Their
+    extraction and alignment fan out on a thread pool shared by all batch
+    requests, whatever pipeline.concurrency says.
+
+    Routes:
+        POST /analyze        {"text": str} -> render_for_web result
+        POST /analyze/batch  {"texts": [str]} -> {"results": [...]}, in input order
+        GET  /stats          corpus, cache and request counters
+        GET  /health         liveness probe
+    """
+
+    daemon_threads = True
+
+    def __init__(self, detector: EpistemicRiskDetector, config: ServerConfig | None = None):
+        self.detector = detector
+        self.config = config or detector.config.server
+        self.started_at = time.time()
+        self.batch_pool = ThreadPoolExecutor(
+            max_workers=self.config.batch_workers, thread_name_prefix="analyze-batch"
+        )
+        self._counts: dict[str, int] = {"requests": 0, "errors": 0, "texts_analyzed": 0}
+        self._counts_lock = threading.Lock()
+
+        detector.warm_up()
+        super().__init__((self.config.host, self.config.port), AnalysisRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, **increments: int) -> None:
+        with self._counts_lock:
+            for key, value in increments.items():
+                self._counts[key] += value
+
+    def stats(self) -> dict[str, Any]:
+        """Corpus statistics plus cache and request counters."""
+        detector = self.detector
+        with self._counts_lock:
+            counts = dict(self._counts)
+        stats: dict[str, Any] = {
+            "corpus": detector.retriever.stats(),
+            "server": {"uptime_seconds": time.time() - self.started_at, **counts},
+        }
+        if detector.alignment_cache is not None:
+            stats["alignment_cache"] = detector.alignment_cache.stats()
+        if detector.extraction_cache is not None:
+            stats["extraction_cache"] = detector.extraction_cache.stats()
+        if isinstance(detector.evaluator, CascadeAlignmentEvaluator):
+            stats["cascade"] = detector.evaluator.stats()
+        return stats
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.batch_pool.shutdown(wait=False, cancel_futures=True)
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """JSON request/response handling for AnalysisServer."""
+
+    server: AnalysisServer
+    protocol_version = "HTTP/1.1"  # Keep-alive for clients behind a gateway
+
+    def do_GET(self) -> None:
+        routes = {"/stats": self.server.stats, "/health": lambda: {"status": "ok"}}
+        self._dispatch(routes)
+
+    def do_POST(self) -> None:
+        routes = {"/analyze": self._analyze, "/analyze/batch": self._analyze_batch}
+        self._dispatch(routes)
+
+    def _dispatch(self, routes: dict) -> None:
+        self.server.count(requests=1)
+        try:
+            route = routes.get(self.path.split("?", 1)[0].rstrip("/") or "/")
+            if route is None:
+                # Drain any body so the kept-alive connection stays in sync
+                self._read_body(required=False)
+                raise RequestError(404, f"No route for {self.command} {self.path}")
+            self._reply(200, route())
+        except RequestError as e:
+            self.server.count(errors=1)
+            self._reply(e.status, {"error": e.message})
+        except Exception as e:
+            self.server.count(errors=1)
+            self.log_error("%s", traceback.format_exc())
+            self._reply(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def _analyze(self) -> dict[str, Any]:
+        text = self._text(self._read_json().get("text"), "text")
+        detector = self.server.detector
+        result = detector.render_web(detector.analyze(text))
+        self.server.count(texts_analyzed=1)
+        return result
+
+    def _analyze_batch(self) -> dict[str, Any]:
+        texts = self._read_json().get("texts")
+        if not isinstance(texts, list):
+            raise RequestError(400, "'texts' must be a list of strings")
+        if len(texts) > self.server.config.max_batch_size:
+            raise RequestError(
+                413, f"Batch of {len(texts)} exceeds max_batch_size "
+                f"({self.server.config.max_batch_size})"
+            )
+        texts = [self._text(text, f"texts[{i}]") for i, text in enumerate(texts)]
+
+        detector = self.server.detector
+        results = detector.analyze_batch(texts, pool=self.server.batch_pool)
+        self.server.count(texts_analyzed=len(texts))
+        return {"results": [detector.render_web(result) for result in results]}
+
+    @staticmethod
+    def _text(value: Any, field: str) -> str:
+        if not isinstance(value, str) or not value.strip():
+            raise RequestError(400, f"'{field}' must be a non-empty string")
+        return value
+
+    def _read_body(self, required: bool = True) -> bytes:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise RequestError(400, "Invalid Content-Length") from None
+        if length > self.server.config.max_request_bytes:
+            self.close_connection = True  # Don't read the oversized body
+            raise RequestError(
+                413, f"Request body exceeds {self.server.config.max_request_bytes} bytes"
+            )
+        if required and length == 0:
+            raise RequestError(411 if "Content-Length" not in self.headers else 400, "Empty body")
+        return self.rfile.read(length) if length else b""
+
+    def _read_json(self) -> dict:
+        try:
+            payload = json.loads(self._read_body())
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise RequestError(400, f"Invalid JSON: {e}") from None
+        if not isinstance(payload, dict):
+            raise RequestError(400, "Request body must be a JSON object")
+        return payload
+
+    def _reply(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.config.access_log:
+            super().log_message(format, *args)
@@ -1,8 +1,12 @@
 """Pytest fixtures for testing."""
 
+import hashlib
 import json
+import re
+from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 import pytest
 
 from src.core.config import (
@@ -20,6 +24,7 @@ from src.core.schemas import (
     ContradictionType,
     EvidenceChunk,
 )
+from src.retrievers.local_vector import LocalVectorStore
 
 
 class MockLLMProvider:
@@ -75,6 +80,71 @@ class MockLLMProvider:
         return self.responses.get("default", {})
 
 
+class MockEncoder:
+    """Deterministic bag-of-words encoder standing in for SentenceTransformer."""
+
+    def __init__(self, dim: int = 64):
+        self.dim = dim
+        self.calls: list[list[str]] = []
+
+    def encode(
+        self, texts: list[str], convert_to_numpy: bool = True, normalize_embeddings: bool = True
+    ) -> np.ndarray:
+        self.calls.append(list(texts))
+        embeddings = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in re.findall(r"\w+", text.lower()):
+                bucket = int(hashlib.md5(token.encode()).hexdigest(), 16) % self.dim
+                embeddings[i, bucket] += 1.0
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.where(norms == 0, 1.0, norms)
+        return embeddings
+
+
+class MockCrossEncoder:
+    """Stands in for a sentence-transformers NLI CrossEncoder.
+
+    Returns fixed probabilities keyed by a marker word in the premise
+    (evidence): "entails", "contradicts" or "hints"; anything else is neutral.
+    Columns follow `labels`, mirroring the model config's id2label.
+    """
+
+    PROBABILITIES = {
+        "entails": {"entailment": 0.9, "neutral": 0.08, "contradiction": 0.02},
+        "contradicts": {"entailment": 0.05, "neutral": 0.15, "contradiction": 0.8},
+        "hints": {"entailment": 0.3, "neutral": 0.6, "contradiction": 0.1},
+    }
+    NEUTRAL = {"entailment": 0.05, "neutral": 0.9, "contradiction": 0.05}
+
+    def __init__(self, labels: tuple[str, ...] = ("contradiction", "entailment", "neutral")):
+        self.labels = labels
+        self.calls: list[list[tuple[str, str]]] = []
+        self.model = type("Model", (), {})()
+        self.model.config = type("Config", (), {"id2label": dict(enumerate(labels))})()
+
+    def predict(self, pairs, batch_size=32, apply_softmax=False, show_progress_bar=None):
+        self.calls.append(list(pairs))
+        rows = []
+        for premise, _ in pairs:
+            marker = next((m for m in self.PROBABILITIES if m in premise), None)
+            probs = self.PROBABILITIES.get(marker, self.NEUTRAL)
+            rows.append([probs[label] for label in self.labels])
+        return np.array(rows, dtype=np.float32)
+
+
+@pytest.fixture
+def mock_encoder() -> MockEncoder:
+    """Provide a deterministic local encoder."""
+    return MockEncoder()
+
+
+@pytest.fixture
+def mock_cross_encoder() -> MockCrossEncoder:
+    """Provide a deterministic NLI cross-encoder."""
+    return MockCrossEncoder()
+
+
 @pytest.fixture
 def mock_llm() -> MockLLMProvider:
     """Provide a mock LLM provider."""
@@ -97,6 +167,20 @@ def test_config(tmp_path) -> Config:
     )
 
 
+@pytest.fixture
+def make_store(test_config, mock_encoder) -> Callable[..., LocalVectorStore]:
+    """Provide a LocalVectorStore factory on mock_encoder; kwargs override test_config.retrieval."""
+
+    def make(**update) -> LocalVectorStore:
+        # Chunk in-process unless a test asks for worker processes
+        config = test_config.retrieval.model_copy(update={"index_workers": 1, **update})
+        store = LocalVectorStore(config)
+        store._encoder = mock_encoder
+        return store
+
+    return make
+
+
 @pytest.fixture
 def sample_claim() -> Claim:
     """Provide a sample claim for testing."""
@@ -1,9 +1,145 @@
 """Tests for alignment evaluation module."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from src.core.schemas import AlignmentLabel, AlignmentResult, ContradictionType
-from src.evaluators.alignment import LLMAlignmentEvaluator
+from src.core.schemas import AlignmentLabel, AlignmentResult, ContradictionType, EvidenceChunk
+from src.evaluators.alignment import (
+    CascadeAlignmentEvaluator,
+    HeuristicAlignmentEvaluator,
+    LLMAlignmentEvaluator,
+)
+from src.evaluators.nli import NLIAlignmentEvaluator
+
+
+class TestHeuristicAlignmentEvaluator:
+    """Test suite for the rule-only HeuristicAlignmentEvaluator."""
+
+    def test_judges_without_llm(self, sample_claim, sample_evidence):
+        """Every chunk should get a rule-based judgment explaining its scores."""
+        results = HeuristicAlignmentEvaluator().evaluate(sample_claim, sample_evidence)
+
+        assert [r.evidence_id for r in results] == [e.id for e in sample_evidence]
+        assert results[0].label == AlignmentLabel.SUPPORTS
+        assert results[0].explanation.startswith("Heuristic evaluation (similarity 0.92")
+
+    async def test_detects_contradiction(self, hallucination_claim, contradicting_evidence):
+        """Negation mismatches against similar evidence should contradict, sync or async."""
+        evaluator = HeuristicAlignmentEvaluator()
+
+        [result] = await evaluator.aevaluate(hallucination_claim, contradicting_evidence)
+
+        assert result.label == AlignmentLabel.CONTRADICTS
+        assert result.contradiction_type == ContradictionType.DIRECT_NEGATION
+        assert result == evaluator.evaluate_single(hallucination_claim, contradicting_evidence[0])
+
+
+class TestCascadeAlignmentEvaluator:
+    """Test suite for CascadeAlignmentEvaluator."""
+
+    def test_settles_clear_cases_and_escalates_the_rest(
+        self, mock_llm, sample_claim, sample_evidence
+    ):
+        """Near-duplicates and sub-threshold chunks skip the LLM; a temporal mismatch doesn't."""
+        evidence = [
+            sample_evidence[0].model_copy(update={"id": "dup", "similarity_score": 0.97}),
+            EvidenceChunk(
+                id="far", text="Rust is fast.", source="x.txt", similarity_score=0.1, chunk_index=0
+            ),
+            sample_evidence[1],  # No 1991 in the evidence: temporal mismatch
+        ]
+        cascade = CascadeAlignmentEvaluator(LLMAlignmentEvaluator(mock_llm))
+
+        results = cascade.evaluate(sample_claim, evidence)
+
+        assert [r.evidence_id for r in results] == ["dup", "far", sample_evidence[1].id]
+        assert [r.label for r in results] == [
+            AlignmentLabel.SUPPORTS, AlignmentLabel.IRRELEVANT, AlignmentLabel.SUPPORTS
+        ]
+        assert "Near-duplicate" in results[0].explanation
+        assert results[2].explanation == "Evidence directly supports the claim"  # From the LLM
+        assert len(mock_llm.calls) == 1
+
+        stats = cascade.stats()
+        assert (stats["pairs"], stats["settled_by_rules"], stats["escalated"]) == (3, 2, 1)
+        assert stats["escalation_rate"] == pytest.approx(1 / 3)
+        assert stats["llm_ms_per_pair"] > 0.0 and stats["rules_ms_per_pair"] > 0.0
+
+    def test_track_counts_one_block(self, mock_llm, sample_claim, sample_evidence):
+        """track() should count only its own block, while stats() keeps lifetime totals."""
+        cascade = CascadeAlignmentEvaluator(LLMAlignmentEvaluator(mock_llm))
+        cascade.evaluate(sample_claim, sample_evidence)
+
+        with cascade.track() as tracked:
+            cascade.evaluate(sample_claim, sample_evidence[:1])
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(cascade.evaluate, sample_claim, sample_evidence).result()
+        cascade.evaluate(sample_claim, sample_evidence)
+
+        assert tracked.summary()["pairs"] == 1  # A plain pool thread has its own context
+        assert cascade.stats()["pairs"] == 1 + 3 * len(sample_evidence)
+
+    @pytest.mark.parametrize("band,escalated", [(0.0, 0), (1.0, 1)])
+    async def test_escalation_band(self, mock_llm, sample_claim, sample_evidence, band, escalated):
+        """A wider band sends borderline heuristic scores to the LLM, sync or async."""
+        cascade = CascadeAlignmentEvaluator(LLMAlignmentEvaluator(mock_llm), escalation_band=band)
+
+        [result] = await cascade.aevaluate(sample_claim, sample_evidence[:1])
+
+        assert result.label == AlignmentLabel.SUPPORTS
+        assert cascade.stats()["escalated"] == escalated
+        assert len(mock_llm.calls) == escalated
+
+
+class TestNLIAlignmentEvaluator:
+    """Test suite for the cross-encoder NLIAlignmentEvaluator."""
+
+    @staticmethod
+    def _chunk(chunk_id: str, text: str) -> EvidenceChunk:
+        return EvidenceChunk(
+            id=chunk_id, text=text, source="facts.txt", similarity_score=0.6, chunk_index=0
+        )
+
+    def test_one_forward_pass_for_all_pairs(
+        self, mock_cross_encoder, sample_claim, hallucination_claim
+    ):
+        """evaluate_many should score every claim x evidence pair in a single predict call."""
+        evaluator = NLIAlignmentEvaluator()
+        evaluator._model = mock_cross_encoder
+        evidence = [
+            [self._chunk("a", "It entails 1991."), self._chunk("b", "It hints at 1991.")],
+            [],
+            [self._chunk("c", "It contradicts: 3.12 did not remove it."),
+             self._chunk("d", "Unrelated text.")],
+        ]
+
+        results = evaluator.evaluate_many(
+            [sample_claim, sample_claim, hallucination_claim], evidence
+        )
+
+        assert len(evaluator._model.calls) == 1
+        assert evaluator._model.calls[0][0] == ("It entails 1991.", sample_claim.text)
+        assert [[r.label for r in rs] for rs in results] == [
+            [AlignmentLabel.SUPPORTS, AlignmentLabel.WEAK_SUPPORT],
+            [],
+            [AlignmentLabel.CONTRADICTS, AlignmentLabel.IRRELEVANT],
+        ]
+        assert [r.evidence_id for r in results[2]] == ["c", "d"]
+        assert results[0][0].confidence == pytest.approx(0.9)
+        assert results[2][0].contradiction_type == ContradictionType.DIRECT_NEGATION
+        assert evaluator.evaluate_many([sample_claim], [[]]) == [[]]
+
+    def test_label_order_from_model_config(self, mock_cross_encoder, sample_claim):
+        """Output columns should be read from id2label, whatever order the model uses."""
+        evaluator = NLIAlignmentEvaluator()
+        labels = ("entailment", "neutral", "contradiction")
+        evaluator._model = type(mock_cross_encoder)(labels=labels)
+
+        result = evaluator.evaluate_single(sample_claim, self._chunk("a", "It entails 1991."))
+
+        assert result.label == AlignmentLabel.SUPPORTS
+        assert result.logical_score == pytest.approx(0.9)
 
 
 class TestLLMAlignmentEvaluator:
@@ -176,3 +312,102 @@ class TestLLMAlignmentEvaluator:
         assert result.label == AlignmentLabel.CONTRADICTS
         assert result.negation_detected
         assert result.contradiction_type == ContradictionType.DIRECT_NEGATION
+
+    def test_cache_reuses_judgments(self, mock_llm, sample_claim, sample_evidence, tmp_path):
+        """Repeated claim/evidence text should be served from the cache."""
+        from src.cache.persistent import PersistentCache
+
+        cache = PersistentCache(str(tmp_path / "cache.db"), namespace="alignment")
+        evaluator = LLMAlignmentEvaluator(mock_llm, cache=cache)
+
+        first = evaluator.evaluate(sample_claim, sample_evidence)
+        calls = len(mock_llm.calls)
+        renamed = sample_claim.model_copy(update={"id": "other_claim"})
+        second = evaluator.evaluate(renamed, sample_evidence)
+
+        assert len(mock_llm.calls) == calls
+        assert [r.label for r in second] == [r.label for r in first]
+        assert all(r.claim_id == "other_claim" for r in second)
+        assert cache.stats()["hits"] == len(sample_evidence)
+
+    def test_cache_skips_heuristic_fallbacks(
+        self, mock_llm, sample_claim, sample_evidence, tmp_path
+    ):
+        """Heuristic results from LLM failures should not be cached."""
+        from src.cache.persistent import PersistentCache
+
+        def failing_complete_json(*args, **kwargs):
+            raise Exception("API Error")
+
+        mock_llm.complete_json = failing_complete_json
+        cache = PersistentCache(str(tmp_path / "cache.db"), namespace="alignment")
+        evaluator = LLMAlignmentEvaluator(mock_llm, cache=cache)
+        evaluator.evaluate_single(sample_claim, sample_evidence[0])
+
+        assert cache.stats()["entries"] == 0
+
+
+class TestBatchAlignment:
+    """Batched evaluation: one prompt per claim covering all evidence chunks."""
+
+    def _judgment(self, index: int, label: str) -> dict:
+        return {
+            "index": index,
+            "label": label,
+            "confidence": 0.8,
+            "explanation": f"judgment {index}",
+            "temporal_match": True,
+            "semantic_score": 0.7,
+            "logical_score": 0.6,
+        }
+
+    def test_single_call_for_all_chunks(self, mock_llm, sample_claim, sample_evidence):
+        """All chunks should be judged by one LLM call, matched by index."""
+        mock_llm.responses["alignment"] = {
+            "judgments": [self._judgment(2, "IRRELEVANT"), self._judgment(1, "SUPPORTS")]
+        }
+        evaluator = LLMAlignmentEvaluator(mock_llm, batch_evidence=True)
+
+        results = evaluator.evaluate(sample_claim, sample_evidence)
+
+        assert len(mock_llm.calls) == 1
+        assert "EVIDENCE [2]" in mock_llm.calls[0]
+        assert [r.evidence_id for r in results] == [e.id for e in sample_evidence]
+        assert [r.label for r in results] == [AlignmentLabel.SUPPORTS, AlignmentLabel.IRRELEVANT]
+
+    def test_malformed_items_fall_back_per_item(self, mock_llm, sample_claim, sample_evidence):
+        """A bad item should get a heuristic result without discarding good ones."""
+        mock_llm.responses["alignment"] = {
+            "judgments": [self._judgment(1, "SUPPORTS"), {"index": 2, "label": "MAYBE"}]
+        }
+        evaluator = LLMAlignmentEvaluator(mock_llm, batch_evidence=True)
+
+        results = evaluator.evaluate(sample_claim, sample_evidence)
+
+        assert results[0].explanation == "judgment 1"
+        assert "Heuristic" in results[1].explanation
+
+    def test_llm_failure_falls_back_for_all(self, mock_llm, sample_claim, sample_evidence):
+        """A failed batch call should produce heuristic results for every chunk."""
+        def failing_complete_json(*args, **kwargs):
+            raise Exception("API Error")
+
+        mock_llm.complete_json = failing_complete_json
+        evaluator = LLMAlignmentEvaluator(mock_llm, batch_evidence=True)
+
+        results = evaluator.evaluate(sample_claim, sample_evidence)
+
+        assert len(results) == len(sample_evidence)
+        assert all("Heuristic" in r.explanation for r in results)
+
+    async def test_async_batch(self, mock_llm, sample_claim, sample_evidence):
+        """aevaluate should use the same single batched call."""
+        mock_llm.responses["alignment"] = {
+            "judgments": [self._judgment(1, "SUPPORTS"), self._judgment(2, "WEAK_SUPPORT")]
+        }
+        evaluator = LLMAlignmentEvaluator(mock_llm, batch_evidence=True)
+
+        results = await evaluator.aevaluate(sample_claim, sample_evidence)
+
+        assert len(mock_llm.calls) == 1
+        assert [r.label for r in results] == [AlignmentLabel.SUPPORTS, AlignmentLabel.WEAK_SUPPORT]
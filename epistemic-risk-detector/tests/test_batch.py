@@ -0,0 +1,147 @@
+"""Tests for streaming JSONL batch analysis."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src.batch import completed_ids, iter_records, open_for_append, run_batch
+from src.evaluators.alignment import LLMAlignmentEvaluator
+from src.extractors.claim_extractor import LLMClaimExtractor
+from src.pipeline import EpistemicRiskDetector
+
+
+@pytest.fixture
+def detector(test_config, mock_llm, mock_encoder, tmp_path) -> EpistemicRiskDetector:
+    """Detector wired to the mock LLM and encoder, with a one-file corpus."""
+    detector = EpistemicRiskDetector(test_config)
+    detector.llm = mock_llm
+    detector.extractor = LLMClaimExtractor(mock_llm, test_config.extraction)
+    detector.evaluator = LLMAlignmentEvaluator(mock_llm)
+    detector.retriever._encoder = mock_encoder
+
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("Python was created by Guido van Rossum and released in 1991.")
+    detector.index_corpus(str(corpus))
+    return detector
+
+
+def _jsonl(path, records) -> str:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return str(path)
+
+
+def _read(path) -> list[dict]:
+    return [json.loads(line) for line in open(path)]
+
+
+class TestRunBatch:
+    """Test suite for run_batch and its resume helpers."""
+
+    def test_writes_one_line_per_record(self, detector, tmp_path):
+        """Every record should produce a render_for_web line tagged with its id."""
+        records = [{"id": i, "text": f"Python response {i}"} for i in range(10)]
+        lines = open(_jsonl(tmp_path / "in.jsonl", records))
+        output = tmp_path / "out.jsonl"
+
+        with open_for_append(output) as out:
+            summary = run_batch(detector, iter_records(lines), out, workers=3)
+
+        results = _read(output)
+        assert sorted(int(r["id"]) for r in results) == list(range(10))
+        assert all("verdicts" in r and "overall_hallucination_risk" in r for r in results)
+        assert summary.records_done == 10
+        assert summary.claims == 10
+        assert summary.records_per_second > 0
+
+    def test_resume_skips_completed_ids(self, detector, mock_llm, tmp_path):
+        """A second run should analyze only records missing from the output."""
+        records = [{"id": f"r{i}", "text": f"Python response {i}"} for i in range(6)]
+        output = tmp_path / "out.jsonl"
+        with open_for_append(output) as out:
+            run_batch(detector, iter_records(json.dumps(r) for r in records[:3]), out)
+
+        calls_before = len(mock_llm.calls)
+        with open_for_append(output) as out:
+            summary = run_batch(
+                detector,
+                iter_records(json.dumps(r) for r in records),
+                out,
+                skip=completed_ids(output),
+            )
+
+        assert summary.records_skipped == 3
+        assert summary.records_done == 3
+        assert sorted(r["id"] for r in _read(output)) == [f"r{i}" for i in range(6)]
+        assert len(mock_llm.calls) - calls_before == 3 * 2  # Extraction + alignment each
+
+    def test_bad_records_become_error_lines_and_are_retried(self, detector, tmp_path):
+        """Unreadable lines and analysis failures should not stop the batch."""
+        lines = ['{"id": "ok", "text": "Python response"}', "{oops", '{"id": "blank"}']
+        output = tmp_path / "out.jsonl"
+
+        with open_for_append(output) as out:
+            summary = run_batch(detector, iter_records(lines), out)
+
+        errors = {r["id"]: r["error"] for r in _read(output) if "error" in r}
+        assert set(errors) == {"line:2", "blank"}
+        assert summary.records_failed == 2
+        assert completed_ids(output) == {"ok"}
+
+    def test_groups_share_work_and_isolate_failures(self, detector, tmp_path):
+        """Records go through analyze_batch in groups; a failing group is retried per record."""
+        groups = []
+        analyze_batch = detector.analyze_batch
+
+        def flaky(texts):
+            groups.append(len(texts))
+            if any("boom" in text for text in texts):
+                raise RuntimeError("boom")
+            return analyze_batch(texts)
+
+        detector.analyze_batch = flaky
+        lines = [json.dumps({"id": i, "text": "boom" if i == 4 else f"Python {i}"})
+                 for i in range(6)]
+        output = tmp_path / "out.jsonl"
+
+        with open_for_append(output) as out:
+            summary = run_batch(detector, iter_records(lines), out, workers=1, batch_size=3)
+
+        assert groups == [3, 3, 1, 1, 1]  # Second group failed, then ran record by record
+        assert summary.records_done == 5
+        assert [r["id"] for r in _read(output) if "error" in r] == ["4"]
+
+    def test_truncated_output_line_is_ignored(self, tmp_path):
+        """A half-written last line should neither count as done nor corrupt appends."""
+        output = tmp_path / "out.jsonl"
+        output.write_text('{"id": "a", "verdicts": []}\n{"id": "b", "verd')
+
+        assert completed_ids(output) == {"a"}
+        with open_for_append(output) as out:
+            out.write('{"id": "c"}\n')
+        assert completed_ids(output) == {"a", "c"}
+
+
+class TestAnalyzeBatchCommand:
+    """The analyze-batch CLI command."""
+
+    def test_streams_and_summarizes(self, detector, monkeypatch, tmp_path):
+        """The command should write results and print a throughput summary."""
+        import src.cli as cli
+
+        monkeypatch.setattr(cli, "EpistemicRiskDetector", lambda config: detector)
+        input_path = _jsonl(
+            tmp_path / "in.jsonl", [{"uid": i, "body": f"Python response {i}"} for i in range(4)]
+        )
+        output = tmp_path / "out.jsonl"
+        args = ["analyze-batch", input_path, "-o", str(output), "-j", "2",
+                "--id-field", "uid", "--text-field", "body"]
+
+        first = CliRunner().invoke(cli.main, args)
+        second = CliRunner().invoke(cli.main, args)
+
+        assert first.exit_code == 0, first.output
+        assert "Analyzed 4 responses" in first.output
+        assert "responses/s" in first.output
+        assert "4 already in" in second.output
+        assert len(_read(output)) == 4
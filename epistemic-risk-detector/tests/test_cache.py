@@ -0,0 +1,113 @@
+"""Tests for caching module."""
+
+import time
+
+from src.cache.persistent import PersistentCache
+
+
+class TestPersistentCache:
+    """Test suite for PersistentCache."""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        """Stored values should come back and be counted as hits."""
+        cache = PersistentCache(str(tmp_path / "cache.db"), namespace="test")
+
+        assert cache.get("k") is None
+        cache.put("k", {"label": "SUPPORTS", "score": 0.5})
+
+        assert cache.get("k") == {"label": "SUPPORTS", "score": 0.5}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new process opening the same file should see earlier entries."""
+        path = str(tmp_path / "cache.db")
+        PersistentCache(path, namespace="test").put("k", {"v": 1})
+
+        assert PersistentCache(path, namespace="test").get("k") == {"v": 1}
+        assert PersistentCache(path, namespace="other").get("k") is None
+
+    def test_ttl_expiry(self, tmp_path):
+        """Entries older than the TTL should be misses."""
+        cache = PersistentCache(str(tmp_path / "cache.db"), namespace="test", ttl_seconds=0.05)
+        cache.put("k", {"v": 1})
+        time.sleep(0.1)
+
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_size_eviction_drops_least_recently_read(self, tmp_path):
+        """A put past max_entries should evict at once, keeping recently read entries."""
+        cache = PersistentCache(str(tmp_path / "cache.db"), namespace="test", max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, {"v": key})
+            time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+
+        cache.put("c", {"v": "c"})
+        cache.put("c", {"v": "c2"})  # Replacing an entry doesn't grow the namespace
+
+        assert cache.stats()["entries"] == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": "a"}
+        assert cache.evict() == 0
+
+    def test_read_times_are_written_in_batches(self, tmp_path):
+        """Hits should buffer accessed_at and write it with the next put or a full batch of keys."""
+        import sqlite3
+
+        path = str(tmp_path / "cache.db")
+        cache = PersistentCache(path, namespace="test")
+        cache._TOUCH_BATCH = 3
+        cache.put("k", {"v": 1})
+        cache.put("other", {"v": 2})
+
+        def accessed_at() -> float:
+            with sqlite3.connect(path) as db:
+                query = "SELECT accessed_at FROM cache_entries WHERE key = 'k'"
+                return db.execute(query).fetchone()[0]
+
+        written = accessed_at()
+        time.sleep(0.01)
+        cache.get("k")
+        assert accessed_at() == written
+
+        cache.put("new", {"v": 3})
+        assert accessed_at() > written
+
+        written = accessed_at()
+        time.sleep(0.01)
+        for key in ("k", "k", "other", "new"):  # A full batch is three distinct keys
+            cache.get(key)
+        assert cache._touched == {}
+        assert accessed_at() > written
+
+
+class TestTieredCache:
+    """Test suite for LRUCache and TieredCache."""
+
+    def test_lru_evicts_least_recently_used(self):
+        from src.cache.memory import LRUCache
+
+        cache = LRUCache(max_entries=2)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+        cache.get("a")
+        cache.put("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.stats()["entries"] == 2
+
+    def test_persistent_hits_promoted_to_memory(self, tmp_path):
+        from src.cache.memory import LRUCache, TieredCache
+
+        path = str(tmp_path / "cache.db")
+        TieredCache(LRUCache(), PersistentCache(path, namespace="x")).put("k", {"v": 1})
+
+        cache = TieredCache(LRUCache(), PersistentCache(path, namespace="x"))
+        assert cache.get("k") == {"v": 1}
+        assert cache.memory.get("k") == {"v": 1}
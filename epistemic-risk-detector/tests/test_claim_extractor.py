@@ -4,7 +4,7 @@ import pytest
 
 from src.core.config import ExtractionConfig
 from src.core.schemas import Claim, ClaimType
-from src.extractors.claim_extractor import LLMClaimExtractor
+from src.extractors.claim_extractor import LLMClaimExtractor, RuleBasedClaimExtractor
 
 
 class TestLLMClaimExtractor:
@@ -143,3 +143,113 @@ class TestLLMClaimExtractor:
         if claims:
             assert claims[0].hedging_detected
             assert claims[0].claim_type == ClaimType.HEDGED
+
+    def test_cache_skips_provider_on_repeat(self, mock_llm):
+        """Repeated input should be served from the extraction cache."""
+        from src.cache.memory import LRUCache
+
+        extractor = LLMClaimExtractor(mock_llm, cache=LRUCache())
+        first = extractor.extract("Python was created in 1991.")
+        calls = len(mock_llm.calls)
+        second, metadata = extractor.extract_with_confidence("Python was created in 1991.")
+
+        assert len(mock_llm.calls) == calls
+        assert second == first
+        assert metadata["cache_hit"]
+
+    def test_cache_normalizes_whitespace_and_reanchors_spans(self, mock_llm):
+        """Whitespace-only differences should hit the cache with spans in the new text."""
+        from src.cache.memory import LRUCache
+
+        extractor = LLMClaimExtractor(mock_llm, cache=LRUCache())
+        extractor.extract("Python was created in 1991.")
+        calls = len(mock_llm.calls)
+
+        text = "  Python was created in 1991."
+        claims = extractor.extract(text)
+
+        assert len(mock_llm.calls) == calls
+        start, end = claims[0].source_span
+        assert text[start:end] == "Python was created in 1991"
+
+    def test_cache_misses_when_paraphrase_cannot_be_reanchored(self, mock_llm):
+        """A cached paraphrase absent from the new text should be re-extracted, not clamped."""
+        from src.cache.memory import LRUCache
+
+        mock_llm.responses["extract_claims"] = {
+            "claims": [
+                {"text": "Guido van Rossum released Python in 1991", "start": 55, "end": 70,
+                 "confidence": 0.9, "is_factual": True}
+            ]
+        }
+        extractor = LLMClaimExtractor(mock_llm, cache=LRUCache())
+        extractor.extract("Python," + " " * 20 + "first released in 1991 by Guido van Rossum.")
+        calls = len(mock_llm.calls)
+        mock_llm.responses["extract_claims"] = {
+            "claims": [
+                {"text": "Python was first released in 1991", "start": 0, "end": 30,
+                 "confidence": 0.9, "is_factual": True}
+            ]
+        }
+
+        text = "Python, first released in 1991 by Guido van Rossum."
+        claims, metadata = extractor.extract_with_confidence(text)
+
+        assert len(mock_llm.calls) == calls + 1
+        assert "cache_hit" not in metadata
+        assert [c.text for c in claims] == ["Python was first released in 1991"]
+
+    def test_cache_key_depends_on_config(self, mock_llm):
+        """Config fields that change the output should change the cache key."""
+        a = LLMClaimExtractor(mock_llm, ExtractionConfig(max_claims=5))
+        b = LLMClaimExtractor(mock_llm, ExtractionConfig(max_claims=6))
+        c = LLMClaimExtractor(mock_llm, ExtractionConfig(max_claims=5, max_retries=1))
+
+        assert a._cache_key("text") != b._cache_key("text")
+        assert a._cache_key("text") == c._cache_key("text")
+
+
+class TestRuleBasedClaimExtractor:
+    """Test suite for RuleBasedClaimExtractor."""
+
+    def test_one_claim_per_sentence_with_spans(self):
+        """Each sentence should become a claim whose span points back into the text."""
+        text = (
+            "Python was created by Guido v. Rossum in 1991. NumPy might be fast, e.g. for "
+            "arrays.\n- Django was released in 2005; it is a web framework."
+        )
+        claims = RuleBasedClaimExtractor().extract(text)
+
+        assert [c.text for c in claims] == [
+            "Python was created by Guido v. Rossum in 1991",
+            "NumPy might be fast, e.g. for arrays",
+            "Django was released in 2005",
+            "it is a web framework",
+        ]
+        for claim in claims:
+            start, end = claim.source_span
+            assert text[start:end] == claim.text
+
+    def test_types_hedging_and_opinions(self):
+        """Claim types and hedging use the shared rules; opinions and questions are dropped."""
+        text = (
+            "Python 3.12 probably removed the GIL. I think Rust is the nicest language. "
+            "Is NumPy written in C? GPT-3 has 175 billion parameters."
+        )
+        claims, metadata = RuleBasedClaimExtractor().extract_with_confidence(text)
+
+        assert [c.claim_type for c in claims] == [ClaimType.HEDGED, ClaimType.QUANTITATIVE]
+        assert claims[0].hedging_detected
+        assert metadata["filtered_opinions"] == 2
+        assert metadata["after_filtering"] == 2
+
+        with_opinions = RuleBasedClaimExtractor(ExtractionConfig(include_opinions=True))
+        assert len(with_opinions.extract(text)) == 4
+
+    def test_respects_length_and_count_limits(self):
+        """Short fragments and claims past max_claims should be skipped."""
+        text = "Yes. " + " ".join(f"Fact number {i} is true." for i in range(5))
+        claims = RuleBasedClaimExtractor(ExtractionConfig(max_claims=3)).extract(text)
+
+        assert [c.text for c in claims] == [f"Fact number {i} is true" for i in range(3)]
+        assert RuleBasedClaimExtractor().extract("   ") == []
@@ -0,0 +1,301 @@
+"""Tests for the analysis pipeline orchestration."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.config import PipelineConfig
+from src.core.schemas import AlignmentLabel, Claim, VerdictLabel
+from src.evaluators.alignment import (
+    CascadeAlignmentEvaluator,
+    HeuristicAlignmentEvaluator,
+    LLMAlignmentEvaluator,
+)
+from src.evaluators.nli import NLIAlignmentEvaluator
+from src.extractors.claim_extractor import LLMClaimExtractor, RuleBasedClaimExtractor
+from src.pipeline import EpistemicRiskDetector
+
+RESPONSE = (
+    "Python was created by Guido van Rossum in 1991. "
+    "Rust is a systems programming language. "
+    "NumPy was created by Travis Oliphant in 2005. "
+    "The Transformer architecture was introduced in 2017."
+)
+
+
+def _claims_payload(text: str) -> dict:
+    sentences = [s.strip() + "." for s in text.split(".") if s.strip()]
+    return {
+        "claims": [
+            {
+                "text": s,
+                "start": text.find(s),
+                "end": text.find(s) + len(s),
+                "confidence": 0.9,
+                "is_factual": True,
+            }
+            for s in sentences
+        ]
+    }
+
+
+@pytest.fixture
+def detector(test_config, mock_llm, mock_encoder, tmp_path) -> EpistemicRiskDetector:
+    """Detector wired to mock LLM and encoder, with a small indexed corpus."""
+    mock_llm.responses["extract_claims"] = _claims_payload(RESPONSE)
+
+    detector = EpistemicRiskDetector(test_config)
+    detector.llm = mock_llm
+    detector.extractor = LLMClaimExtractor(mock_llm, test_config.extraction)
+    detector.evaluator = LLMAlignmentEvaluator(mock_llm)
+    detector.retriever._encoder = mock_encoder
+
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text(RESPONSE)
+    detector.index_corpus(str(corpus))
+    return detector
+
+
+class TestEpistemicRiskDetector:
+    """Test suite for EpistemicRiskDetector.analyze."""
+
+    def test_reports_stage_timings(self, detector):
+        """analyze should record per-stage timings in metadata."""
+        result = detector.analyze(RESPONSE)
+
+        timings = result.metadata["timings"]
+        for stage in ("extraction", "retrieval", "alignment", "calibration", "verdict", "total"):
+            assert timings[stage] >= 0.0
+        assert result.metadata["concurrency"]["mode"] == "sequential"
+
+    def test_threaded_mode_preserves_claim_order(self, detector):
+        """Parallel claim processing should return verdicts in claim order."""
+        sequential = detector.analyze(RESPONSE)
+
+        detector.config.pipeline = PipelineConfig(concurrency="threads", max_workers=4)
+        threaded = detector.analyze(RESPONSE)
+
+        assert [v.claim.id for v in threaded.verdicts] == [c.id for c in threaded.claims]
+        assert [v.label for v in threaded.verdicts] == [v.label for v in sequential.verdicts]
+
+    def test_threaded_mode_runs_claims_concurrently(self, detector):
+        """Slow evaluations should overlap rather than run back to back."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        evaluate = detector.evaluator.evaluate
+
+        def slow_evaluate(claim, evidence):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return evaluate(claim, evidence)
+
+        detector.evaluator.evaluate = slow_evaluate
+        detector.config.pipeline = PipelineConfig(concurrency="threads", max_workers=2)
+        result = detector.analyze(RESPONSE)
+
+        assert len(result.verdicts) == 4
+        assert peak == 2  # Bounded by max_workers
+
+
+class TestFastMode:
+    """pipeline.mode = "fast" should run the full stack with rules only."""
+
+    def test_no_llm_calls(self, test_config, mock_encoder, tmp_path):
+        """Fast mode should extract, align and judge without an LLM provider."""
+        test_config.pipeline.mode = "fast"
+        detector = EpistemicRiskDetector(test_config)
+        detector.retriever._encoder = mock_encoder
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text(RESPONSE)
+        detector.index_corpus(str(corpus))
+
+        result = detector.analyze(RESPONSE + " Python 3.12 might not be released yet.")
+
+        assert detector.llm is None
+        assert isinstance(detector.extractor, RuleBasedClaimExtractor)
+        assert isinstance(detector.evaluator, HeuristicAlignmentEvaluator)
+        assert result.metadata["mode"] == "fast"
+        assert len(result.verdicts) == 5
+        assert all(v.alignments[0].label == AlignmentLabel.SUPPORTS for v in result.verdicts[:4])
+        assert result.verdicts[-1].label == VerdictLabel.HALLUCINATED  # Not in the corpus
+        assert "vague_language" in result.verdicts[-1].calibrated_confidence.penalties_applied
+
+
+class TestCascade:
+    """alignment.cascade should put the rule tier in front of the LLM judge."""
+
+    def test_reports_escalations_in_metadata(self, test_config, mock_llm, mock_encoder, tmp_path):
+        """Result metadata should carry this analysis's escalation rate and tier latencies."""
+        test_config.alignment.cascade = True
+        detector = EpistemicRiskDetector(test_config)
+        assert isinstance(detector.evaluator, CascadeAlignmentEvaluator)
+        detector.llm = mock_llm
+        detector.evaluator.llm_evaluator = LLMAlignmentEvaluator(mock_llm)
+        detector.extractor = LLMClaimExtractor(mock_llm, test_config.extraction)
+        detector.retriever._encoder = mock_encoder
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("Python was created in 1991")
+        detector.index_corpus(str(corpus))
+
+        detector.analyze("Python was created in 1991")
+        result = detector.analyze("Python was created in 1991")
+
+        cascade = result.metadata["cascade"]
+        assert cascade["pairs"] == 1  # This analysis only
+        assert cascade["settled_by_rules"] == 1  # Near-duplicate evidence
+        assert cascade["escalation_rate"] == 0.0
+        assert detector.evaluator.stats()["pairs"] == 2  # Lifetime totals, as served by /stats
+        assert len(mock_llm.calls) == 2  # Extraction only
+
+
+class TestNLIEvaluator:
+    """alignment.evaluator = "nli" should judge a response's claims in one forward pass."""
+
+    def test_fully_local_single_forward_pass(
+        self, test_config, mock_encoder, mock_cross_encoder, tmp_path
+    ):
+        """Fast extraction plus the NLI judge should need no LLM and one predict call."""
+        test_config.pipeline.mode = "fast"
+        test_config.alignment.evaluator = "nli"
+        detector = EpistemicRiskDetector(test_config)
+        assert isinstance(detector.evaluator, NLIAlignmentEvaluator)
+        detector.evaluator._model = mock_cross_encoder
+        detector.retriever._encoder = mock_encoder
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("Python entails facts. " + RESPONSE)
+        detector.index_corpus(str(corpus))
+
+        result = detector.analyze(RESPONSE)
+        [batch_result] = detector.analyze_batch([RESPONSE])
+
+        assert detector.llm is None
+        assert len(mock_cross_encoder.calls) == 2  # One per call, covering all claims
+        assert len(mock_cross_encoder.calls[0]) == sum(len(v.alignments) for v in result.verdicts)
+        assert {v.alignments[0].label for v in result.verdicts} == {AlignmentLabel.SUPPORTS}
+        assert result.metadata["timings"]["alignment"] > 0.0
+        assert [v.label for v in batch_result.verdicts] == [v.label for v in result.verdicts]
+
+
+class TestAnalyzeBatch:
+    """analyze_batch should share retrieval and alignment across responses."""
+
+    VARIANT = (
+        "Intro sentence about history. "
+        "python was  created by GUIDO van Rossum in 1991. "
+        "Rust is a systems programming language."
+    )
+
+    @pytest.fixture
+    def batch_detector(self, detector):
+        """Detector whose extractor turns every sentence into a claim, with its own span."""
+
+        def extract(text):
+            claims = []
+            for sentence in (s.strip() for s in text.split(".")):
+                if sentence:
+                    start = text.find(sentence)
+                    claims.append(
+                        Claim(
+                            id=f"{start}:{sentence[:8]}",
+                            text=sentence,
+                            source_span=(start, start + len(sentence)),
+                            raw_confidence=0.9,
+                        )
+                    )
+            return claims, {"claims": len(claims)}
+
+        detector.extractor.extract_with_confidence = extract
+        return detector
+
+    def test_unique_claims_aligned_once(self, batch_detector, mock_encoder):
+        """Claims repeated across responses (modulo case and spacing) are aligned once."""
+        detector = batch_detector
+        evaluated = []
+        evaluate = detector.evaluator.evaluate
+        detector.evaluator.evaluate = lambda c, e: evaluated.append(c.text) or evaluate(c, e)
+        retrieve_many = detector.retriever.retrieve_many
+        retrieved = []
+        detector.retriever.retrieve_many = lambda claims, *a: retrieved.append(claims) or (
+            retrieve_many(claims, *a)
+        )
+
+        results = detector.analyze_batch([RESPONSE, self.VARIANT, RESPONSE])
+
+        assert len(retrieved) == 1
+        assert len(retrieved[0]) == len(evaluated) == 5  # 4 from RESPONSE + the intro
+        assert [len(r.verdicts) for r in results] == [4, 3, 4]
+        assert results[0].metadata["batch"] == {
+            "responses": 3,
+            "unique_responses": 2,
+            "claims": 11,
+            "unique_claims": 5,
+            "dedup_ratio": pytest.approx(1 - 5 / 11),
+        }
+
+    def test_fan_out_keeps_per_response_claims(self, batch_detector):
+        """Each response keeps its own claim ids and spans, and matches analyze()."""
+        detector = batch_detector
+        texts = [RESPONSE, self.VARIANT]
+
+        results = detector.analyze_batch(texts)
+
+        for text, result in zip(texts, results):
+            single = detector.analyze(text)
+            assert [v.claim.id for v in result.verdicts] == [c.id for c in single.claims]
+            assert [v.label for v in result.verdicts] == [v.label for v in single.verdicts]
+            for verdict in result.verdicts:
+                start, end = verdict.claim.source_span
+                assert text[start:end] == verdict.claim.text
+                assert {a.claim_id for a in verdict.alignments} <= {verdict.claim.id}
+
+    def test_empty_and_threaded(self, batch_detector):
+        """Responses without claims get the no-claims result; threads keep input order."""
+        detector = batch_detector
+        detector.config.pipeline = PipelineConfig(concurrency="threads", max_workers=4)
+
+        results = detector.analyze_batch(["", RESPONSE, " "])
+
+        assert [r.original_text for r in results] == ["", RESPONSE, " "]
+        assert results[0].summary == "No factual claims found in the text."
+        assert len(results[1].verdicts) == 4
+        assert detector.analyze_batch([]) == []
+
+    def test_fans_out_on_given_pool(self, batch_detector):
+        """A caller's pool runs extraction and alignment even when concurrency is sequential."""
+        detector = batch_detector
+        threads = set()
+        evaluate = detector.evaluator.evaluate
+        detector.evaluator.evaluate = lambda c, e: (
+            threads.add(threading.current_thread().name) or evaluate(c, e)
+        )
+
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="batch") as pool:
+            results = detector.analyze_batch([RESPONSE, self.VARIANT], pool=pool)
+
+        assert detector.config.pipeline.concurrency == "sequential"
+        assert threads and all(name.startswith("batch") for name in threads)
+        assert [len(r.verdicts) for r in results] == [4, 3]
+        assert results[0].metadata["concurrency"]["mode"] == "threads"
+
+
+class TestCanonicalClaimText:
+    """canonical_claim_text keys near-identical wordings together."""
+
+    def test_folds_case_space_and_trailing_punctuation(self):
+        """Case, runs of whitespace, compatibility forms and final punctuation are ignored."""
+        from src.pipeline import canonical_claim_text
+
+        assert canonical_claim_text("Python 3.12  removed\nthe GIL.") == (
+            canonical_claim_text("python 3.12 removed the ＧＩＬ")
+        )
+        assert canonical_claim_text("GIL removed in 3.12") != canonical_claim_text(
+            "GIL removed in 3.13"
+        )
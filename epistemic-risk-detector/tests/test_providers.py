@@ -0,0 +1,209 @@
+"""Tests for LLM providers against a local stub HTTP server."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.config import Config, LLMConfig, RetrievalConfig
+from src.core.interfaces import AsyncLLMProvider, LLMProvider
+from src.providers.llm import AnthropicProvider, OllamaProvider, OpenAIProvider
+
+pytest.importorskip("httpx")
+
+ALIGNMENT = {
+    "label": "SUPPORTS",
+    "confidence": 0.8,
+    "explanation": "stub",
+    "temporal_match": True,
+    "semantic_score": 0.8,
+    "logical_score": 0.8,
+}
+
+CLAIMS = {
+    "claims": [
+        {
+            "text": "Python was created in 1991",
+            "start": 0,
+            "end": 26,
+            "confidence": 0.9,
+            "is_factual": True,
+        }
+    ]
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Speaks just enough of the OpenAI, Anthropic and Ollama wire formats."""
+
+    def log_message(self, format, *args):  # Keep test output quiet
+        pass
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, request))
+
+        prompt = request.get("prompt") or request["messages"][-1]["content"]
+        content = json.dumps(CLAIMS if "atomic" in prompt else ALIGNMENT)
+
+        if self.path.endswith("/chat/completions"):
+            self._reply({
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request["model"],
+                "choices": [
+                    {"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}
+                ],
+            })
+        elif self.path.endswith("/messages"):
+            self._reply({
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "model": request["model"],
+                "content": [{"type": "text", "text": f"```json\n{content}\n```"}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 1, "output_tokens": 1},
+            })
+        elif self.path == "/api/generate":
+            self._reply({"model": request["model"], "response": content, "done": True})
+        else:
+            self.send_error(404)
+
+
+class _StubServer(ThreadingHTTPServer):
+    request_queue_size = 128  # Default backlog of 5 resets bursts of concurrent connects
+
+
+@pytest.fixture
+def stub_server():
+    """Run the stub server on a free local port for the duration of a test."""
+    server = _StubServer(("127.0.0.1", 0), _StubHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _provider(kind: str, server) -> OpenAIProvider | AnthropicProvider | OllamaProvider:
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    if kind == "openai":
+        pytest.importorskip("openai")
+        return OpenAIProvider(LLMConfig(provider="openai", api_key="test", base_url=f"{base}/v1"))
+    if kind == "anthropic":
+        pytest.importorskip("anthropic")
+        return AnthropicProvider(
+            LLMConfig(provider="anthropic", model="claude-test", api_key="test", base_url=base)
+        )
+    return OllamaProvider(LLMConfig(provider="ollama", model="llama3", base_url=base))
+
+
+@pytest.mark.parametrize("kind", ["openai", "anthropic", "ollama"])
+class TestAsyncProviders:
+    """Async protocol implementations for each provider."""
+
+    def test_implements_both_protocols(self, kind, stub_server):
+        provider = _provider(kind, stub_server)
+
+        assert isinstance(provider, LLMProvider)
+        assert isinstance(provider, AsyncLLMProvider)
+
+    async def test_acomplete_json(self, kind, stub_server):
+        """acomplete_json should return the parsed JSON body."""
+        provider = _provider(kind, stub_server)
+
+        result = await provider.acomplete_json("Classify the relationship", {"type": "object"})
+
+        assert result == ALIGNMENT
+        assert len(stub_server.requests) == 1
+
+    async def test_concurrent_requests_share_one_loop(self, kind, stub_server):
+        """Many in-flight requests should complete on a single event loop."""
+        provider = _provider(kind, stub_server)
+
+        results = await asyncio.gather(
+            *(provider.acomplete(f"prompt {i}") for i in range(20))
+        )
+
+        assert len(results) == 20
+        assert len(stub_server.requests) == 20
+
+    async def test_aclose_closes_client(self, kind, stub_server):
+        """aclose should close the loop's client so the next call builds a new one."""
+        provider = _provider(kind, stub_server)
+        await provider.acomplete("prompt")
+        client = provider.async_client
+
+        await provider.aclose()
+
+        assert getattr(client, "_client", client).is_closed
+        assert provider.async_client is not client
+
+    def test_new_loop_disconnects_previous_client(self, kind, stub_server, monkeypatch):
+        """Reuse from a second asyncio.run() should drop the first loop's connections."""
+        monkeypatch.setattr(_StubHandler, "protocol_version", "HTTP/1.1")  # Keep-alive
+        disconnected = threading.Event()
+        finish = _StubHandler.finish
+
+        def finish_and_record(handler):
+            finish(handler)
+            disconnected.set()
+
+        monkeypatch.setattr(_StubHandler, "finish", finish_and_record)
+        provider = _provider(kind, stub_server)
+
+        asyncio.run(provider.acomplete("first"))
+        first = provider._async_client
+        assert not disconnected.wait(0.2)
+
+        asyncio.run(provider.acomplete("second"))
+
+        assert disconnected.wait(5)
+        assert provider._async_client is not first
+
+
+async def test_aanalyze_end_to_end(stub_server, mock_encoder, tmp_path):
+    """aanalyze should extract, retrieve off the loop and judge through the async provider."""
+    from src.pipeline import EpistemicRiskDetector
+
+    base = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    config = Config(
+        llm=LLMConfig(provider="ollama", model="llama3", base_url=base),
+        retrieval=RetrievalConfig(db_path=str(tmp_path / "evidence.db")),
+    )
+    detector = EpistemicRiskDetector(config)
+    detector.retriever._encoder = mock_encoder
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("Python was created by Guido van Rossum and first released in 1991.")
+    detector.index_corpus(str(corpus))
+    retrieve_many = detector.retriever.retrieve_many
+    retrieval_threads = []
+    detector.retriever.retrieve_many = lambda *args: (
+        retrieval_threads.append(threading.current_thread()) or retrieve_many(*args)
+    )
+
+    results = await asyncio.gather(
+        *(detector.aanalyze("Python was created in 1991.") for _ in range(5))
+    )
+
+    assert len(retrieval_threads) == 5
+    assert threading.current_thread() not in retrieval_threads
+    for result in results:
+        assert len(result.verdicts) == 1
+        assert result.verdicts[0].alignments[0].explanation == "stub"
+        assert result.metadata["concurrency"]["mode"] == "async"
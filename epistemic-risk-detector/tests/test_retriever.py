@@ -142,3 +142,1085 @@ class TestLocalVectorStore:
 
         for result in results:
             assert 0 <= result.similarity_score <= 1
+
+
+class TestVectorizedRetrieval:
+    """Retrieval engine behaviour using a deterministic local encoder."""
+
+    def test_returns_best_match_first(self, make_store, tmp_path):
+        """Top result should be the chunk sharing the most tokens with the claim."""
+        (tmp_path / "a.txt").write_text("Python was created by Guido van Rossum in 1991.")
+        (tmp_path / "b.txt").write_text("Rust is a systems programming language.")
+
+        store = make_store()
+        store.index_directory(str(tmp_path), extensions=[".txt"])
+
+        results = store.retrieve("Guido van Rossum created Python in 1991")
+
+        assert results
+        assert results[0].source.endswith("a.txt")
+        scores = [r.similarity_score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_matches_exhaustive_scoring(self, make_store, test_config, mock_encoder, tmp_path):
+        """argpartition top-k should agree with a full sort over every chunk."""
+        doc = tmp_path / "many.txt"
+        doc.write_text(
+            " ".join(f"Fact {i} about topic {i % 7} and item {i % 3}." for i in range(300))
+        )
+
+        test_config.retrieval.similarity_threshold = 0.0
+        store = make_store()
+        store.index_document(str(doc))
+
+        results = store.retrieve("topic 3 item 1", top_k=3)
+
+        query = mock_encoder.encode(["topic 3 item 1"])[0]
+        matrix, _ = store._load_matrix()
+        expected = sorted((float(s) for s in matrix @ query), reverse=True)[:3]
+        assert [r.similarity_score for r in results] == pytest.approx(expected)
+
+    def test_matrix_invalidated_on_write(self, make_store, tmp_path):
+        """Indexing and clearing should be visible to the next query."""
+        store = make_store()
+        assert store.retrieve("Python") == []
+
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python is a programming language.")
+        store.index_document(str(doc))
+        assert store.retrieve("Python programming language")
+
+        store.clear()
+        assert store.retrieve("Python programming language") == []
+
+    def test_retrieve_many_single_encode(self, make_store, mock_encoder, tmp_path):
+        """retrieve_many should encode all claims at once and match per-claim retrieve."""
+        (tmp_path / "a.txt").write_text("Python was created by Guido van Rossum in 1991.")
+        (tmp_path / "b.txt").write_text("Rust is a systems programming language.")
+        store = make_store()
+        store.index_directory(str(tmp_path), extensions=[".txt"])
+
+        claims = ["Guido created Python", "Rust is a systems language", "unrelated zebra"]
+        mock_encoder.calls.clear()
+        batched = store.retrieve_many(claims)
+
+        assert len(mock_encoder.calls) == 1
+        assert mock_encoder.calls[0] == claims
+        assert len(batched) == len(claims)
+        for claim, evidence in zip(claims, batched):
+            assert [e.id for e in evidence] == [e.id for e in store.retrieve(claim)]
+
+    def test_retrieve_many_empty(self, make_store, mock_encoder):
+        """No claims and an empty corpus should both be handled without encoding."""
+        store = make_store()
+
+        assert store.retrieve_many([]) == []
+        assert store.retrieve_many(["a", "b"]) == [[], []]
+        assert mock_encoder.calls == []
+
+
+
+class TestBulkIndexing:
+    """index_directory batches chunks across documents and reports progress."""
+
+    def _corpus(self, root):
+        for i in range(6):
+            (root / f"doc{i}.txt").write_text(
+                " ".join(f"Document {i} fact {j} about topic {j % 5}." for j in range(40))
+            )
+        (root / "skip.bin").write_text("ignored")
+
+    def _rows(self, store):
+        return store._db.execute(
+            "SELECT id, source, chunk_index, embedding FROM chunks ORDER BY id"
+        ).fetchall()
+
+    def test_matches_per_document_indexing(self, make_store, tmp_path):
+        """Batched indexing should produce the same rows as indexing each file."""
+        corpus = tmp_path / "corpus"
+        corpus.mkdir()
+        self._corpus(corpus)
+
+        bulk = make_store(index_batch_size=7)
+        count = bulk.index_directory(str(corpus), extensions=[".txt"])
+
+        single = make_store(db_path=str(tmp_path / "single.db"))
+        expected = sum(single.index_document(str(p)) for p in sorted(corpus.glob("*.txt")))
+
+        assert count == expected
+        assert self._rows(bulk) == self._rows(single)
+
+    def test_batches_encoder_calls(self, make_store, mock_encoder, tmp_path):
+        """Chunks from several documents should share one encoder call."""
+        self._corpus(tmp_path)
+        store = make_store(index_batch_size=10_000)
+
+        store.index_directory(str(tmp_path), extensions=[".txt"])
+
+        assert len(mock_encoder.calls) == 1
+
+    def test_progress_reports_every_file(self, make_store, tmp_path):
+        """The final progress snapshot should cover every matched file."""
+        self._corpus(tmp_path)
+        store = make_store(index_batch_size=5)
+        snapshots = []
+
+        count = store.index_directory(str(tmp_path), extensions=[".txt"], progress=snapshots.append)
+
+        assert len(snapshots) > 1
+        assert snapshots[-1].files_total == snapshots[-1].files_done == 6
+        assert snapshots[-1].chunks_indexed == count
+
+    def test_process_pool_workers(self, make_store, tmp_path):
+        """Reading and chunking in worker processes should give the same corpus."""
+        corpus = tmp_path / "corpus"
+        corpus.mkdir()
+        self._corpus(corpus)
+
+        pooled = make_store(index_workers=2)
+        pooled.index_directory(str(corpus), extensions=[".txt"])
+        inline = make_store(index_workers=1, db_path=str(tmp_path / "inline.db")
+        )
+        inline.index_directory(str(corpus), extensions=[".txt"])
+
+        assert self._rows(pooled) == self._rows(inline)
+
+
+
+class TestIncrementalIndexing:
+    """Re-indexing should only touch files that changed on disk."""
+
+    def _corpus(self, root):
+        root.mkdir()
+        for i in range(3):
+            (root / f"doc{i}.txt").write_text(f"Document {i} says Python is fast. " * 20)
+        return root
+
+    def test_unchanged_files_are_skipped(self, make_store, mock_encoder, tmp_path):
+        """A second run over an unchanged tree should not embed anything."""
+        corpus = self._corpus(tmp_path / "corpus")
+        store = make_store()
+        assert store.index_directory(str(corpus)) > 0
+        calls = len(mock_encoder.calls)
+
+        snapshots = []
+        assert store.index_directory(str(corpus), progress=snapshots.append) == 0
+        assert len(mock_encoder.calls) == calls
+        assert snapshots[-1].files_skipped == 3
+
+    def test_touched_file_with_same_content_is_not_reembedded(
+        self, make_store, mock_encoder, tmp_path
+    ):
+        """A new mtime alone should only refresh the fingerprint."""
+        import os
+
+        corpus = self._corpus(tmp_path / "corpus")
+        store = make_store()
+        store.index_directory(str(corpus))
+        calls = len(mock_encoder.calls)
+
+        doc = corpus / "doc0.txt"
+        st = doc.stat()
+        os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        assert store.index_directory(str(corpus)) == 0
+        assert len(mock_encoder.calls) == calls
+        (mtime,) = store._db.execute(
+            "SELECT mtime_ns FROM documents WHERE path = ?", (str(doc),)
+        ).fetchone()
+        assert mtime == st.st_mtime_ns + 10**9
+
+    def test_shrunk_file_leaves_no_orphans(self, make_store, tmp_path):
+        """Only the changed file is re-embedded and its old chunks are replaced."""
+        corpus = self._corpus(tmp_path / "corpus")
+        store = make_store()
+        store.index_directory(str(corpus))
+
+        doc = corpus / "doc1.txt"
+        doc.write_text("Now a single short sentence.")
+
+        assert store.index_directory(str(corpus)) == 1
+        chunks = store._db.execute(
+            "SELECT text FROM chunks WHERE source = ?", (str(doc),)
+        ).fetchall()
+        assert chunks == [("Now a single short sentence.",)]
+
+    def test_deleted_file_is_pruned(self, make_store, tmp_path):
+        """Chunks of files removed from the directory should be deleted."""
+        corpus = self._corpus(tmp_path / "corpus")
+        store = make_store()
+        store.index_directory(str(corpus))
+
+        (corpus / "doc2.txt").unlink()
+        snapshots = []
+        store.index_directory(str(corpus), progress=snapshots.append)
+
+        assert store.stats()["total_documents"] == 2
+        assert snapshots[-1].files_removed == 1
+        (n_docs,) = store._db.execute("SELECT COUNT(*) FROM documents").fetchone()
+        assert n_docs == 2
+
+    def test_force_and_config_change_reindex(self, make_store, tmp_path):
+        """force=True and a new chunk size should both re-embed unchanged files."""
+        corpus = self._corpus(tmp_path / "corpus")
+        store = make_store()
+        store.index_directory(str(corpus))
+
+        assert store.index_directory(str(corpus), force=True) > 0
+
+        store.config.chunk_size = 128
+        store.config.chunk_overlap = 16
+        assert store.index_directory(str(corpus)) > 0
+
+
+
+class TestEmbeddingCache:
+    """Chunk embeddings are cached by text hash, per embedding model."""
+
+    LICENSE = "Licensed under the Apache License, Version 2.0."
+
+    def _encoded_texts(self, mock_encoder) -> list[str]:
+        return [text for call in mock_encoder.calls for text in call]
+
+    def test_duplicate_chunks_encoded_once(self, make_store, mock_encoder, tmp_path):
+        """Identical boilerplate across files should hit the encoder a single time."""
+        for i in range(4):
+            (tmp_path / f"mod{i}.py").write_text(self.LICENSE)
+
+        store = make_store()
+        assert store.index_directory(str(tmp_path)) == 4
+
+        assert self._encoded_texts(mock_encoder) == [self.LICENSE]
+        stats = store.stats()
+        assert stats["embeddings_encoded"] == 1
+        assert stats["embeddings_reused"] == 3
+        assert stats["embedding_dedup_ratio"] == pytest.approx(0.75)
+
+    def test_forced_reindex_reuses_embeddings(self, make_store, mock_encoder, tmp_path):
+        """Re-embedding unchanged text should be served entirely from the cache."""
+        (tmp_path / "doc.txt").write_text("Python is a programming language. " * 30)
+        store = make_store()
+        store.index_directory(str(tmp_path))
+        calls = len(mock_encoder.calls)
+
+        store.clear()
+        assert store.index_directory(str(tmp_path)) > 0
+
+        assert len(mock_encoder.calls) == calls
+        assert store.retrieve("Python programming language")
+
+    def test_scoped_per_model(self, make_store, mock_encoder, tmp_path):
+        """A different embedding model must not reuse another model's vectors."""
+        (tmp_path / "doc.txt").write_text(self.LICENSE)
+        make_store().index_directory(str(tmp_path))
+
+        other = make_store(embedding_model="other-model")
+        other.index_directory(str(tmp_path))
+
+        assert self._encoded_texts(mock_encoder) == [self.LICENSE, self.LICENSE]
+
+
+
+class TestQueryCache:
+    """Repeated claims should skip the encoder via the query-embedding LRU."""
+
+    def test_repeat_claims_skip_encoder(self, make_store, mock_encoder, tmp_path):
+        """Only claims not seen before should be encoded, once each."""
+        (tmp_path / "doc.txt").write_text("Python 3.12 did not remove the GIL.")
+        store = make_store(query_cache_size=8)
+        store.index_document(str(tmp_path / "doc.txt"))
+        mock_encoder.calls.clear()
+
+        first = store.retrieve("Python 3.12 removed the GIL")
+        store.retrieve_many(["Python 3.12 removed the GIL", "GIL", "GIL"])
+        again = store.retrieve("Python 3.12 removed the GIL")
+
+        assert mock_encoder.calls == [["Python 3.12 removed the GIL"], ["GIL"]]
+        assert [c.id for c in again] == [c.id for c in first]
+        cache_stats = store.stats()["query_cache"]
+        assert cache_stats["hits"] == 2
+        assert cache_stats["entries"] == 2
+
+    def test_bounded_and_disableable(self, make_store, mock_encoder, tmp_path):
+        """The LRU keeps at most query_cache_size entries; 0 turns it off."""
+        (tmp_path / "doc.txt").write_text("Python is a programming language.")
+
+        store = make_store(query_cache_size=2)
+        store.index_document(str(tmp_path / "doc.txt"))
+        store.retrieve_many(["a", "b", "c"])
+        assert store.stats()["query_cache"]["entries"] == 2
+
+        uncached = make_store(query_cache_size=0)
+        mock_encoder.calls.clear()
+        uncached.retrieve("a")
+        uncached.retrieve("a")
+        assert len(mock_encoder.calls) == 2
+        assert uncached.stats()["query_cache"] is None
+
+
+
+def _reference_chunks(text: str, chunk_size: int, chunk_overlap: int) -> list[str]:
+    """The original in-memory chunker, kept as the oracle for the streaming one."""
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + chunk_size
+        if end < len(text):
+            search_start = int(end - chunk_size * 0.2)
+            for sep in [". ", ".\n", "! ", "? ", "\n\n"]:
+                pos = text.rfind(sep, search_start, end)
+                if pos > start:
+                    end = pos + len(sep)
+                    break
+        chunks.append(text[start:end].strip())
+        start = end - chunk_overlap
+    return [c for c in chunks if c]
+
+
+class TestStreamingChunker:
+    """Generator chunker over bounded buffers, and streamed indexing of large files."""
+
+    def test_matches_in_memory_chunker(self):
+        """Chunks must not depend on where the reader's buffers happen to split."""
+        import random
+
+        from src.retrievers.chunking import iter_chunks
+
+        rng = random.Random(0)
+        for _ in range(200):
+            text = "".join(rng.choice("ab .!?\n") for _ in range(rng.randint(0, 2000)))
+            chunk_size = rng.randint(10, 120)
+            chunk_overlap = rng.randint(0, chunk_size // 2)
+            pieces, i = [], 0
+            while i < len(text):
+                step = rng.randint(1, 300)
+                pieces.append(text[i : i + step])
+                i += step
+
+            assert list(iter_chunks(pieces, chunk_size, chunk_overlap)) == _reference_chunks(
+                text, chunk_size, chunk_overlap
+            )
+
+    def test_reader_decodes_like_read_text(self, tmp_path):
+        """Small buffers must not break multi-byte characters or CRLF pairs."""
+        import hashlib
+
+        from src.retrievers.chunking import DocumentReader
+
+        doc = tmp_path / "doc.txt"
+        data = "naïve café\r\nline two\r\n".encode() * 50 + b"\xff tail"
+        doc.write_bytes(data)
+
+        reader = DocumentReader(str(doc), buffer_size=7)
+        assert "".join(reader) == doc.read_text(encoding="utf-8", errors="ignore")
+        assert reader.hexdigest() == hashlib.sha256(data).hexdigest()
+
+    def test_large_file_streams_in_batches(self, make_store, tmp_path):
+        """A streamed file should be flushed batch by batch with the same rows."""
+        doc = tmp_path / "big.log"
+        doc.write_text("".join(f"Line {i} reports event {i % 13}. " for i in range(2000)))
+
+        streamed = make_store(stream_threshold_bytes=0, index_batch_size=16)
+        snapshots = []
+        count = streamed.index_directory(
+            str(tmp_path), extensions=[".log"], progress=snapshots.append
+        )
+
+        whole = make_store(db_path=str(tmp_path / "whole.db"))
+        whole.index_directory(str(tmp_path), extensions=[".log"])
+
+        rows = "SELECT id, text, chunk_index FROM chunks ORDER BY id"
+        assert streamed._db.execute(rows).fetchall() == whole._db.execute(rows).fetchall()
+        assert len(snapshots) >= count // 16
+        (chunk_count,) = streamed._db.execute(
+            "SELECT chunk_count FROM documents WHERE path = ?", (str(doc),)
+        ).fetchone()
+        assert chunk_count == count
+
+    def test_touched_large_file_is_hashed_not_chunked(self, make_store, mock_encoder, tmp_path):
+        """An mtime-only change to a streamed file should not re-embed it."""
+        import os
+
+        doc = tmp_path / "big.log"
+        doc.write_text("Python is a programming language. " * 200)
+        store = make_store(stream_threshold_bytes=0)
+        store.index_directory(str(tmp_path), extensions=[".log"])
+        calls = len(mock_encoder.calls)
+
+        st = doc.stat()
+        os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        assert store.index_directory(str(tmp_path), extensions=[".log"]) == 0
+        assert len(mock_encoder.calls) == calls
+
+
+
+class TestHybridRetrieval:
+    """FTS5 BM25 index fused with dense scores, and BM25 as a candidate filter."""
+
+    def _gil_corpus(self, root):
+        (root / "pep703.txt").write_text("PEP 703 proposes making the GIL optional in Python 3.13.")
+        (root / "release.txt").write_text("Python 3.12 kept the GIL.")
+        (root / "rust.txt").write_text("Rust has no global interpreter lock.")
+
+    def test_exact_version_token_is_surfaced(self, make_store, tmp_path):
+        """Lexical hits should be returned even when dense scores miss the threshold."""
+        self._gil_corpus(tmp_path)
+        store = make_store(search_mode="hybrid", similarity_threshold=0.99)
+        store.index_directory(str(tmp_path), extensions=[".txt"])
+
+        results = store.retrieve("Python 3.12 removed the GIL")
+
+        assert results[0].source.endswith("release.txt")
+        assert all(0.0 <= r.similarity_score <= 1.0 for r in results)
+        assert not any(r.source.endswith("rust.txt") for r in results)
+
+    def test_fts_index_tracks_writes(self, make_store, tmp_path):
+        """Re-indexing a changed file and clearing should be mirrored in chunks_fts."""
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python 3.12 kept the GIL.")
+        store = make_store(search_mode="hybrid")
+        store.index_document(str(doc))
+
+        doc.write_text("Python 3.13 made the GIL optional.")
+        store.index_document(str(doc))
+
+        assert store._search_lexical(["3.12"], 10) == [[]]
+        assert len(store._search_lexical(["3.13"], 10)[0]) == 1
+        store.clear()
+        assert store._search_lexical(["3.13"], 10) == [[]]
+
+    def test_backfills_existing_corpus(self, make_store, tmp_path):
+        """Opening a dense-only corpus in hybrid mode should build the FTS index."""
+        self._gil_corpus(tmp_path)
+        make_store().index_directory(str(tmp_path), extensions=[".txt"])
+
+        store = make_store(search_mode="hybrid")
+
+        assert len(store._search_lexical(["GIL"], 10)[0]) == 2
+
+    def test_prefilter_scores_only_candidates(self, make_store, tmp_path):
+        """Dense scoring should be restricted to BM25 candidates, with a full-scan fallback."""
+        self._gil_corpus(tmp_path)
+        store = make_store(lexical_prefilter=1, similarity_threshold=0.0)
+        store.index_directory(str(tmp_path), extensions=[".txt"])
+
+        filtered = store.retrieve("Python 3.12", top_k=3)
+        fallback = store.retrieve("zzz unmatched", top_k=3)
+
+        assert len(filtered) == 1
+        assert filtered[0].source.endswith("release.txt")
+        assert len(fallback) == 3
+
+
+
+class TestFilteredRetrieval:
+    """EvidenceFilter should narrow the rows scored, not post-filter results."""
+
+    def _corpus(self, root):
+        for product in ["alpha", "beta"]:
+            (root / product).mkdir(parents=True)
+            for version in ["v1", "v2"]:
+                for ext in [".md", ".txt"]:
+                    (root / product / f"{version}{ext}").write_text(
+                        f"The {product} release {version} supports streaming exports."
+                    )
+        return root
+
+    def _indexed(self, make_store, tmp_path, **update) -> LocalVectorStore:
+        store = make_store(similarity_threshold=0.0, **update)
+        store.index_directory(str(self._corpus(tmp_path / "corpus")))
+        return store
+
+    def test_filters_match_post_filtering(self, make_store, tmp_path):
+        """Each condition, alone and combined, should equal filtering a full ranking."""
+        from src.core.schemas import EvidenceFilter
+
+        store = self._indexed(make_store, tmp_path)
+        alpha = str(tmp_path / "corpus" / "alpha")
+        everything = store.retrieve("streaming exports", top_k=100)
+
+        cases = [
+            (EvidenceFilter(source_prefix=alpha), lambda c: c.source.startswith(alpha)),
+            (EvidenceFilter(filename_glob="v1.*"), lambda c: "/v1." in c.source),
+            (EvidenceFilter(metadata={"filename": "v2.md"}), lambda c: c.source.endswith("v2.md")),
+            (
+                EvidenceFilter(source_prefix=alpha, filename_glob="*.md"),
+                lambda c: c.source.startswith(alpha) and c.source.endswith(".md"),
+            ),
+        ]
+        for filters, keep in cases:
+            got = store.retrieve("streaming exports", top_k=100, filters=filters)
+            assert [c.id for c in got] == [c.id for c in everything if keep(c)]
+
+    def test_unmatched_and_empty_filters(self, make_store, tmp_path):
+        """A filter selecting nothing returns no evidence; an empty filter selects all."""
+        from src.core.schemas import EvidenceFilter
+
+        store = self._indexed(make_store, tmp_path)
+
+        assert store.retrieve("streaming", filters=EvidenceFilter(source_prefix="/nope")) == []
+        assert store.retrieve("streaming", filters=EvidenceFilter(metadata={"team": "x"})) == []
+        assert len(store.retrieve("streaming", top_k=100, filters=EvidenceFilter())) == 8
+        missing_key = EvidenceFilter(metadata={"team": None})
+        assert len(store.retrieve("streaming", top_k=100, filters=missing_key)) == 8
+
+    def test_filters_on_document_metadata(self, make_store, tmp_path):
+        """Tags given at index time should be filterable alongside the filename."""
+        from src.core.schemas import EvidenceFilter
+
+        store = self._indexed(make_store, tmp_path)
+        docs = tmp_path / "tagged"
+        (docs / "cli").mkdir(parents=True)
+        api_doc, cli_doc = docs / "api.md", docs / "cli" / "cli.md"
+        api_doc.write_text("The api product supports streaming exports.")
+        cli_doc.write_text("The cli product supports streaming exports.")
+        store.index_document(str(api_doc), metadata={"product": "api", "tier": 2})
+        store.index_directory(str(docs / "cli"), metadata_fn=lambda _: {"product": "cli"})
+
+        def sources(**metadata):
+            filters = EvidenceFilter(metadata=metadata)
+            return [c.source for c in store.retrieve("streaming", top_k=100, filters=filters)]
+
+        assert sources(product="api") == [str(api_doc)]
+        assert sources(product="cli") == [str(cli_doc)]
+        assert sources(product="api", tier=2, filename="api.md") == [str(api_doc)]
+
+        # Retagging an unchanged file rewrites its chunks
+        store.index_document(str(api_doc), metadata={"product": "web"})
+        assert sources(product="api") == []
+        assert sources(product="web") == [str(api_doc)]
+
+    def test_rejects_unsafe_metadata_keys(self):
+        """Keys that can't be quoted into a JSON path should fail validation."""
+        from pydantic import ValidationError
+
+        from src.core.schemas import EvidenceFilter
+
+        for key in ['x"', ""]:
+            with pytest.raises(ValidationError):
+                EvidenceFilter(metadata={key: 1})
+
+    def test_only_selected_rows_are_scored(self, make_store, tmp_path):
+        """A narrow filter should shrink the scored matrix, and its rows are cached."""
+        from src.core.schemas import EvidenceFilter
+
+        store = self._indexed(make_store, tmp_path)
+        scored: list[int] = []
+        score = store._score
+        store._score = lambda query_embs, matrix: scored.append(len(matrix)) or score(
+            query_embs, matrix
+        )
+        filters = EvidenceFilter(source_prefix=str(tmp_path / "corpus" / "beta" / "v1"))
+
+        store.retrieve("streaming", filters=filters)
+        store.retrieve("exports", filters=filters)
+
+        assert scored == [2, 2]
+        assert store._filter_cache.stats()["hits"] == 1
+
+    @pytest.mark.parametrize(
+        "update",
+        [
+            {"search_mode": "hybrid"},
+            {"lexical_prefilter": 4},
+            {"quantization": "int8"},
+        ],
+    )
+    def test_filters_apply_to_every_search_path(self, make_store, tmp_path, update):
+        """Hybrid fusion, BM25 prefiltering and quantized scans should respect the filter."""
+        from src.core.schemas import EvidenceFilter
+
+        store = self._indexed(make_store, tmp_path, **update)
+        beta = str(tmp_path / "corpus" / "beta")
+
+        results = store.retrieve(
+            "alpha release", top_k=100, filters=EvidenceFilter(source_prefix=beta)
+        )
+
+        assert results
+        assert all(c.source.startswith(beta) for c in results)
+
+    def test_prefix_upper_bound(self):
+        """The range end should sort after every extension of the prefix."""
+        from src.retrievers.local_vector import _prefix_upper_bound
+
+        assert _prefix_upper_bound("docs/a") == "docs/b"
+        assert _prefix_upper_bound("a\U0010ffff") == "b"
+        assert _prefix_upper_bound("\U0010ffff") is None
+        assert _prefix_upper_bound("a\ud7ff") == "a\ue000"
+
+
+class TestQuantizedMatrix:
+    """int8 / float16 scan matrices with exact float32 rescoring."""
+
+    @pytest.mark.parametrize("mode", ["int8", "float16"])
+    def test_encoding_roundtrip(self, mode):
+        """Dequantized rows should stay close to the float32 originals."""
+        import numpy as np
+
+        from src.retrievers.quantization import QuantizedMatrix
+
+        rng = np.random.default_rng(0)
+        rows = rng.standard_normal((100, 64)).astype(np.float32)
+        rows /= np.linalg.norm(rows, axis=1, keepdims=True)
+
+        quantized = QuantizedMatrix.quantize(rows, mode)
+
+        assert np.abs(quantized.dequantize() - rows).max() < 0.01
+        assert quantized.nbytes < rows.nbytes / 1.9
+
+    @pytest.mark.parametrize("mode", ["int8", "float16"])
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_rescored_results_match_exact(self, make_store, tmp_path, mode, mmap):
+        """After rescoring, hits and scores should equal the float32 search."""
+        from src.retrievers.quantization import QuantizedMatrix
+
+        doc = tmp_path / "many.txt"
+        doc.write_text(
+            " ".join(f"Fact {i} about topic {i % 7} and item {i % 3}." for i in range(300))
+        )
+
+        exact = make_store(similarity_threshold=0.0)
+        exact.index_document(str(doc))
+        quantized = make_store(similarity_threshold=0.0, quantization=mode, mmap_sidecar=mmap)
+
+        claims = ["topic 3 item 1", "Fact 12 about topic 5"]
+        expected = exact.retrieve_many(claims, top_k=4)
+        actual = quantized.retrieve_many(claims, top_k=4)
+
+        assert isinstance(quantized._load_matrix()[0], QuantizedMatrix)
+        assert [[c.id for c in r] for r in actual] == [[c.id for c in r] for r in expected]
+        assert [c.similarity_score for r in actual for c in r] == pytest.approx(
+            [c.similarity_score for r in expected for c in r]
+        )
+
+    def test_sidecar_rebuilt_on_mode_change(self, make_store, tmp_path):
+        """Switching quantization should rewrite a sidecar left in another format."""
+        import numpy as np
+
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python was created by Guido van Rossum in 1991.")
+        make_store(mmap_sidecar=True).index_document(str(doc))
+        make_store(mmap_sidecar=True).retrieve("Guido")
+
+        store = make_store(mmap_sidecar=True, quantization="int8")
+        matrix, _ = store._load_matrix()
+
+        assert matrix.codes.dtype == np.int8
+        assert isinstance(matrix.scales, np.memmap)
+        assert store.retrieve("Guido created Python")[0].source == str(doc)
+
+
+
+class TestShardedVectorStore:
+    """ShardedVectorStore should behave like a single LocalVectorStore."""
+
+    def _corpus(self, root):
+        root.mkdir()
+        for i in range(8):
+            (root / f"doc{i}.txt").write_text(
+                " ".join(f"Document {i} fact {j} about topic {j % 5}." for j in range(30))
+            )
+        return root
+
+    def _stores(self, test_config, mock_encoder, make_store, tmp_path):
+        from src.retrievers.sharded import ShardedVectorStore
+
+        sharded = ShardedVectorStore(
+            test_config.retrieval.model_copy(
+                update={"index_workers": 1, "similarity_threshold": 0.0, "shards": 3}
+            )
+        )
+        sharded._encoder = mock_encoder
+        single = make_store(similarity_threshold=0.0, db_path=str(tmp_path / "one.db"))
+        return sharded, single
+
+    def test_matches_single_store(self, test_config, mock_encoder, make_store, tmp_path):
+        """Merged per-shard top-k should equal a single store's top-k."""
+        corpus = self._corpus(tmp_path / "corpus")
+        sharded, single = self._stores(test_config, mock_encoder, make_store, tmp_path)
+
+        assert sharded.index_directory(str(corpus)) == single.index_directory(str(corpus))
+
+        claims = ["Document 3 fact 7", "topic 2", "fact 11 about topic 1"]
+        got = sharded.retrieve_many(claims, top_k=6)
+        want = single.retrieve_many(claims, top_k=6)
+        # Tied scores may come from different shards in either order
+        assert [c.similarity_score for r in got for c in r] == pytest.approx(
+            [c.similarity_score for r in want for c in r]
+        )
+        assert got[0][0].id == want[0][0].id
+
+        stats = sharded.stats()
+        assert stats["shards"] == 3
+        assert stats["total_chunks"] == single.stats()["total_chunks"]
+        assert stats["total_documents"] == 8
+
+    def test_sources_partitioned_across_files(
+        self, test_config, mock_encoder, make_store, tmp_path
+    ):
+        """Each source should live in exactly one shard database."""
+        corpus = self._corpus(tmp_path / "corpus")
+        sharded, _ = self._stores(test_config, mock_encoder, make_store, tmp_path)
+        sharded.index_directory(str(corpus))
+
+        per_shard = sharded._fan_out(lambda shard: shard.stats()["total_documents"])
+        assert sum(per_shard) == 8
+        assert sum(1 for n in per_shard if n) > 1
+        assert (tmp_path / "test_evidence.shard0.db").exists()
+
+    def test_claims_encoded_once(self, test_config, mock_encoder, make_store, tmp_path):
+        """Fan-out should reuse one batch of query embeddings for all shards."""
+        corpus = self._corpus(tmp_path / "corpus")
+        sharded, _ = self._stores(test_config, mock_encoder, make_store, tmp_path)
+        sharded.index_directory(str(corpus))
+        mock_encoder.calls.clear()
+
+        sharded.retrieve_many(["topic 1", "topic 2"])
+
+        assert mock_encoder.calls == [["topic 1", "topic 2"]]
+
+    def test_filters_reach_every_shard(self, test_config, mock_encoder, make_store, tmp_path):
+        """Filtered fan-out should match a filtered single store."""
+        from src.core.schemas import EvidenceFilter
+
+        corpus = self._corpus(tmp_path / "corpus")
+        sharded, single = self._stores(test_config, mock_encoder, make_store, tmp_path)
+        sharded.index_directory(str(corpus))
+        single.index_directory(str(corpus))
+        filters = EvidenceFilter(filename_glob="doc[1-3].txt")
+
+        got = sharded.retrieve("topic 2", top_k=50, filters=filters)
+        want = single.retrieve("topic 2", top_k=50, filters=filters)
+
+        assert {c.id for c in got} == {c.id for c in want}
+        assert {c.metadata["filename"] for c in got} == {"doc1.txt", "doc2.txt", "doc3.txt"}
+
+    def test_document_routing_and_clear(self, test_config, mock_encoder, make_store, tmp_path):
+        """Single-document indexing, removal and clear should route to the right shard."""
+        corpus = self._corpus(tmp_path / "corpus")
+        sharded, _ = self._stores(test_config, mock_encoder, make_store, tmp_path)
+        doc = str(corpus / "doc0.txt")
+
+        assert sharded.index_document(doc) > 0
+        assert sharded.stats()["total_documents"] == 1
+        sharded.remove_document(doc)
+        assert sharded.retrieve("Document 0") == []
+
+        sharded.index_directory(str(corpus))
+        sharded.clear()
+        assert sharded.stats()["total_chunks"] == 0
+
+    def test_overlapping_queries_share_a_shard(
+        self, test_config, mock_encoder, make_store, tmp_path
+    ):
+        """Two concurrent queries should be inside the same shard's search at once."""
+        import threading
+
+        corpus = self._corpus(tmp_path / "corpus")
+        sharded, _ = self._stores(test_config, mock_encoder, make_store, tmp_path)
+        sharded.index_directory(str(corpus))
+        shard = sharded.shards[0]
+        assert shard.stats()["total_chunks"]
+
+        both_inside = threading.Barrier(2, timeout=5)
+        search = shard._search
+
+        def overlapping_search(*args, **kwargs):
+            both_inside.wait()  # Breaks if the second query queues behind the first
+            return search(*args, **kwargs)
+
+        shard._search = overlapping_search
+        results: list[list] = []
+        errors: list[BaseException] = []
+
+        def query(claim):
+            try:
+                results.append(sharded.retrieve(claim))
+            except BaseException as e:  # noqa: BLE001 - surfaced in the main thread
+                errors.append(e)
+
+        threads = [threading.Thread(target=query, args=(c,)) for c in ["topic 1", "topic 2"]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(results) == 2 and all(results)
+
+
+class TestConcurrentAccess:
+    """WAL mode with a read-only pool should let queries run during a re-index."""
+
+    def _corpus(self, root, n_docs=12, tag="fact"):
+        root.mkdir(exist_ok=True)
+        for i in range(n_docs):
+            (root / f"doc{i}.txt").write_text(
+                " ".join(f"Document {i} {tag} {j} about topic {j % 5}." for j in range(40))
+            )
+        return root
+
+    def test_database_uses_wal(self, make_store):
+        """The writer connection should switch the database to WAL."""
+        store = make_store()
+        (mode,) = store._db.execute("PRAGMA journal_mode").fetchone()
+        assert mode == "wal"
+
+    def test_reader_connections_are_read_only(self, make_store):
+        """Pooled connections should refuse writes."""
+        import sqlite3
+
+        store = make_store()
+        with store._reader() as db:
+            with pytest.raises(sqlite3.OperationalError):
+                db.execute("DELETE FROM chunks")
+
+    def test_pool_is_bounded(self, make_store):
+        """Borrowing never opens more than read_pool_size connections."""
+        import threading
+
+        store = make_store(read_pool_size=2)
+        barrier = threading.Barrier(4)
+
+        def borrow():
+            with store._reader() as db:
+                db.execute("SELECT COUNT(*) FROM chunks").fetchone()
+            barrier.wait()
+
+        threads = [threading.Thread(target=borrow) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert store._reader_count <= 2
+
+    def test_queries_during_reindex(self, make_store, tmp_path):
+        """Threads querying while a forced re-index runs should see no errors."""
+        import threading
+
+        corpus = self._corpus(tmp_path / "corpus")
+        store = make_store(similarity_threshold=0.0, index_batch_size=16)
+        store.index_directory(str(corpus))
+
+        errors: list[BaseException] = []
+        done = threading.Event()
+
+        def query():
+            try:
+                while not done.is_set():
+                    for results in store.retrieve_many(["topic 2", "Document 3 fact 7"]):
+                        assert results
+                    store.stats()
+            except BaseException as e:  # noqa: BLE001 - surfaced in the main thread
+                errors.append(e)
+
+        readers = [threading.Thread(target=query) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        try:
+            self._corpus(corpus, tag="claim")
+            store.index_directory(str(corpus))
+            store.index_directory(str(corpus), force=True)
+        finally:
+            done.set()
+            for thread in readers:
+                thread.join()
+
+        assert errors == []
+        texts = [chunk.text for chunk in store.retrieve("topic 2", top_k=50)]
+        assert texts and all("claim" in text and "fact" not in text for text in texts)
+
+    @pytest.mark.parametrize("quantization", ["none", "int8"])
+    def test_queries_between_flushes_patch_the_matrix(
+        self, make_store, tmp_path, monkeypatch, quantization
+    ):
+        """Each index batch is patched into the loaded matrix; queries never reload it."""
+        import numpy as np
+
+        corpus = self._corpus(tmp_path / "corpus")
+        store = make_store(
+            similarity_threshold=0.0, index_batch_size=16, quantization=quantization
+        )
+        store.index_directory(str(corpus))
+        store.retrieve("topic 2")
+
+        reloads = []
+        read_matrix = store._read_matrix
+
+        def counting_read_matrix():
+            reloads.append(1)
+            return read_matrix()
+
+        monkeypatch.setattr(store, "_read_matrix", counting_read_matrix)
+        seen: list[str] = []
+
+        def query(state):
+            seen.extend(chunk.text for chunk in store.retrieve("Document 0 claim 3", top_k=3))
+
+        self._corpus(corpus, tag="claim")
+        store.index_directory(str(corpus), progress=query)
+
+        assert reloads == []
+        assert any("claim" in text for text in seen)
+        generation, matrix, rowids = store._matrix_state
+        assert generation == store._generation()
+        fresh_matrix, fresh_rowids = read_matrix()
+        np.testing.assert_array_equal(rowids, fresh_rowids)
+        if quantization == "none":
+            np.testing.assert_array_equal(matrix, fresh_matrix)
+        else:
+            np.testing.assert_array_equal(matrix.codes, fresh_matrix.codes)
+            np.testing.assert_array_equal(matrix.scales, fresh_matrix.scales)
+
+
+def _can_load_sqlite_vec() -> bool:
+    import sqlite3
+
+    try:
+        import sqlite_vec
+
+        db = sqlite3.connect(":memory:")
+        db.enable_load_extension(True)
+        sqlite_vec.load(db)
+        return True
+    except (ImportError, AttributeError, sqlite3.OperationalError):
+        return False
+
+
+requires_sqlite_vec = pytest.mark.skipif(
+    not _can_load_sqlite_vec(),
+    reason="sqlite-vec not installed or sqlite3 cannot load extensions"
+)
+
+
+@requires_sqlite_vec
+class TestSqliteVecBackend:
+    """sqlite-vec KNN backend should agree with brute force and stay in sync."""
+
+    def test_matches_brute_force(self, make_store, tmp_path):
+        """Both backends should return the same chunks in the same order."""
+        doc = tmp_path / "many.txt"
+        doc.write_text(
+            " ".join(f"Fact {i} about topic {i % 7} and item {i % 3}." for i in range(200))
+        )
+
+        vec_store = make_store(backend="sqlite_vec")
+        vec_store.index_document(str(doc))
+        brute_store = make_store(backend="brute_force")
+
+        vec_results = vec_store.retrieve("topic 3 item 1", top_k=3)
+        brute_results = brute_store.retrieve("topic 3 item 1", top_k=3)
+
+        assert [r.similarity_score for r in vec_results] == pytest.approx(
+            [r.similarity_score for r in brute_results], abs=1e-5
+        )
+
+    def test_reindex_and_clear_stay_in_sync(self, make_store, tmp_path):
+        """Replacing and clearing chunks should be mirrored in the vec0 table."""
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python is a programming language.")
+
+        store = make_store(backend="sqlite_vec")
+        store.index_document(str(doc))
+        store.index_document(str(doc))
+
+        (n_vecs,) = store._db.execute("SELECT COUNT(*) FROM chunks_vec").fetchone()
+        assert n_vecs == store.stats()["total_chunks"]
+
+        store.clear()
+        assert store.retrieve("Python programming language") == []
+
+    def test_bulk_index_keeps_vec_table_in_sync(self, make_store, tmp_path):
+        """Batched directory indexing should write one vector per chunk."""
+        for i in range(3):
+            (tmp_path / f"doc{i}.txt").write_text(f"Document {i} about Python. " * 30)
+
+        store = make_store(backend="sqlite_vec")
+        store.index_directory(str(tmp_path), extensions=[".txt"])
+        store.index_directory(str(tmp_path), extensions=[".txt"])
+
+        (n_vecs,) = store._db.execute("SELECT COUNT(*) FROM chunks_vec").fetchone()
+        assert n_vecs == store.stats()["total_chunks"] > 0
+        assert store.retrieve("Document 1 Python")
+
+    def test_filtered_search_scores_selected_rows(self, make_store, tmp_path):
+        """Filters should bypass the KNN index and rank only the selected chunks."""
+        from src.core.schemas import EvidenceFilter
+
+        for name in ["keep.md", "skip.txt"]:
+            (tmp_path / name).write_text(f"{name} covers Python packaging.")
+        store = make_store(backend="sqlite_vec")
+        store.index_directory(str(tmp_path), extensions=[".md", ".txt"])
+
+        results = store.retrieve(
+            "skip.txt Python packaging", filters=EvidenceFilter(filename_glob="*.md")
+        )
+
+        assert [r.metadata["filename"] for r in results] == ["keep.md"]
+
+    def test_backfills_existing_corpus(self, make_store, tmp_path):
+        """Opening a brute-force corpus with the vec backend should build the index."""
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python is a programming language.")
+        make_store(backend="brute_force").index_document(str(doc))
+
+        store = make_store(backend="sqlite_vec")
+
+        assert store.retrieve("Python programming language")
+
+    @pytest.mark.parametrize("search_mode, lexical_calls", [("dense", 0), ("hybrid", 1)])
+    def test_prefilter_skips_unused_bm25_query(
+        self, make_store, tmp_path, monkeypatch, search_mode, lexical_calls
+    ):
+        """The KNN backend never uses prefilter candidates, so it should not query FTS5 for them."""
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python is a programming language.")
+        store = make_store(backend="sqlite_vec", lexical_prefilter=80, search_mode=search_mode)
+        store.index_document(str(doc))
+
+        calls = []
+        search_lexical = store._search_lexical
+
+        def counting_search_lexical(claims, limit, filters=None):
+            calls.append(limit)
+            return search_lexical(claims, limit, filters)
+
+        monkeypatch.setattr(store, "_search_lexical", counting_search_lexical)
+
+        assert store.retrieve("Python programming language", top_k=2)
+        assert len(calls) == lexical_calls
+        assert all(limit == store.config.hybrid_candidates for limit in calls)
+
+
+class TestMmapSidecar:
+    """Memory-mapped embedding sidecar next to the evidence database."""
+
+    def test_sidecar_is_memory_mapped(self, make_store, tmp_path):
+        """Queries should be served from a read-only memmap written next to db_path."""
+        import numpy as np
+
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python was created by Guido van Rossum in 1991.")
+
+        store = make_store(mmap_sidecar=True)
+        store.index_document(str(doc))
+        results = store.retrieve("Guido created Python")
+
+        matrix, _ = store._load_matrix()
+        assert isinstance(matrix, np.memmap)
+        assert (tmp_path / "test_evidence.db.embeddings.npy").exists()
+        assert results and results[0].source == str(doc)
+
+    def test_second_process_sees_writes(self, make_store, tmp_path):
+        """A store opened on the same db should rebuild a stale sidecar."""
+        reader = make_store(mmap_sidecar=True)
+        assert reader.retrieve("Python programming language") == []
+
+        doc = tmp_path / "doc.txt"
+        doc.write_text("Python is a programming language.")
+        make_store(mmap_sidecar=True).index_document(str(doc))
+
+        assert reader.retrieve("Python programming language")
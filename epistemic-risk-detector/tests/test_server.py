@@ -0,0 +1,115 @@
+"""Tests for the HTTP analysis server."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.config import ServerConfig
+from src.evaluators.alignment import LLMAlignmentEvaluator
+from src.extractors.claim_extractor import LLMClaimExtractor
+from src.pipeline import EpistemicRiskDetector
+from src.server import AnalysisServer
+
+
+@pytest.fixture
+def server(test_config, mock_llm, mock_encoder, tmp_path):
+    """AnalysisServer on a free port, wired to the mock LLM and encoder."""
+    detector = EpistemicRiskDetector(test_config)
+    detector.llm = mock_llm
+    detector.extractor = LLMClaimExtractor(mock_llm, test_config.extraction)
+    detector.evaluator = LLMAlignmentEvaluator(mock_llm)
+    detector.retriever._encoder = mock_encoder
+
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("Python was created by Guido van Rossum and released in 1991.")
+    detector.index_corpus(str(corpus))
+
+    server = AnalysisServer(
+        detector, ServerConfig(port=0, max_batch_size=3, max_request_bytes=4096, access_log=False)
+    )
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, path: str, payload=None, raw: bytes | None = None) -> tuple[int, dict]:
+    data = raw if raw is not None else (json.dumps(payload).encode() if payload else None)
+    request = urllib.request.Request(server.url + path, data=data)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestAnalysisServer:
+    """Test suite for AnalysisServer routes."""
+
+    def test_analyze_returns_web_payload(self, server):
+        """POST /analyze should return the render_for_web shape."""
+        status, body = _request(server, "/analyze", {"text": "Python was created in 1991"})
+
+        assert status == 200
+        assert body["claims_count"] == 1
+        assert body["verdicts"][0]["claim"]["text"] == "Python was created in 1991"
+        assert set(body["statistics"]) == {"grounded", "weak", "hallucinated"}
+
+    def test_batch_preserves_order(self, server):
+        """POST /analyze/batch should return one result per text, in input order."""
+        texts = ["first response", "second response", "third response"]
+        status, body = _request(server, "/analyze/batch", {"texts": texts})
+
+        assert status == 200
+        assert [r["original_text"] for r in body["results"]] == texts
+
+    def test_stats_reports_corpus_and_requests(self, server):
+        """GET /stats should include corpus totals and request counters."""
+        _request(server, "/analyze", {"text": "Python was created in 1991"})
+        status, body = _request(server, "/stats")
+
+        assert status == 200
+        assert body["corpus"]["total_documents"] == 1
+        assert body["server"]["texts_analyzed"] == 1
+        assert body["server"]["requests"] == 2
+
+    @pytest.mark.parametrize(
+        "path,payload,raw,status",
+        [
+            ("/analyze", None, b"{not json", 400),
+            ("/analyze", {"text": ""}, None, 400),
+            ("/analyze/batch", {"texts": "one"}, None, 400),
+            ("/analyze/batch", {"texts": ["a", "b", "c", "d"]}, None, 413),
+            ("/analyze", None, b'{"text": "' + b"x" * 5000 + b'"}', 413),
+            ("/nowhere", {"text": "x"}, None, 404),
+        ],
+        ids=["bad-json", "empty-text", "texts-not-list", "batch-too-big", "body-too-big", "404"],
+    )
+    def test_client_errors(self, server, path, payload, raw, status):
+        """Malformed, oversized or misrouted requests should get JSON errors."""
+        got, body = _request(server, path, payload, raw)
+
+        assert got == status
+        assert body["error"]
+
+    def test_models_loaded_once_and_shared(self, server, mock_encoder):
+        """The encoder should be warmed at startup and serve concurrent requests."""
+        assert mock_encoder.calls  # warm_up ran before the first request
+        encoder = server.detector.retriever.encoder
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(
+                pool.map(
+                    lambda i: _request(server, "/analyze", {"text": f"Python claim {i}"}),
+                    range(16),
+                )
+            )
+
+        assert all(status == 200 for status, _ in responses)
+        assert server.detector.retriever.encoder is encoder
+        assert server.stats()["server"]["errors"] == 0